@@ -5,6 +5,7 @@ Works for any trader - fully configurable and universal
 """
 
 import streamlit as st
+import importlib
 import sys
 import os
 from datetime import datetime
@@ -18,60 +19,42 @@ if current_dir not in sys.path:
 if system_dir not in sys.path:
     sys.path.insert(0, system_dir)
 
-# Import dashboard components (with fallback)
-try:
-    from harrison_original_complete import HarrisonOriginalDashboard
-    from streamlit_trading_dashboard import TradingDashboard as HarrisonStreamlitDashboard
-    from system.streamlit_6_chart_dashboard import StreamlitTradingDashboard
-    from system.streamlit_system_integration import StreamlitSystemIntegration
-    from system.harrison_enhanced_dashboard import HarrisonEnhancedDashboard
-    from system.ninjatrader_tradovate_dashboard import NinjaTraderTradovateDashboard
-except ImportError:
-    try:
-        from streamlit_6_chart_dashboard import StreamlitTradingDashboard
-        from streamlit_system_integration import StreamlitSystemIntegration
-        from harrison_enhanced_dashboard import HarrisonEnhancedDashboard
-        from ninjatrader_tradovate_dashboard import NinjaTraderTradovateDashboard
-        # Fallback for Harrison's dashboards
-        HarrisonOriginalDashboard = None
-        HarrisonStreamlitDashboard = None
-    except ImportError:
-        # Create fallback classes if imports fail
-        class HarrisonOriginalDashboard:
-            def run(self):
-                st.error("Harrison's original dashboard module not found.")
-                st.markdown("## 🎯 Harrison's Original Dashboard")
-                st.info("This is a fallback. Please ensure harrison_original_dashboard.py exists.")
-        
-        class HarrisonStreamlitDashboard:
-            def run(self):
-                st.error("Harrison's streamlit dashboard module not found.")
-                st.markdown("## 🎯 Harrison's Streamlit Dashboard")
-                st.info("This is a fallback. Please ensure streamlit_trading_dashboard.py exists.")
-        
-        class StreamlitTradingDashboard:
-            def run(self):
-                st.error("Dashboard module not found. Creating basic dashboard...")
-                st.markdown("## 🎯 6-Chart Trading Dashboard")
-                st.info("This is a fallback dashboard. Please ensure all system files are properly installed.")
-        
-        class StreamlitSystemIntegration:
-            def render_integration_dashboard(self):
-                st.error("Integration module not found. Creating basic integration...")
-                st.markdown("## 🔗 System Integration")
-                st.info("This is a fallback integration panel. Please ensure all system files are properly installed.")
-        
-        class HarrisonEnhancedDashboard:
-            def run(self):
-                st.error("Harrison's enhanced dashboard module not found.")
-                st.markdown("## 🎯 Harrison's Enhanced Dashboard")
-                st.info("This is a fallback. Please ensure all system files are properly installed.")
-        
-        class NinjaTraderTradovateDashboard:
-            def run(self):
-                st.error("NinjaTrader dashboard module not found.")
-                st.markdown("## 🥷 NinjaTrader + Tradovate Dashboard")
-                st.info("This is a fallback. Please ensure all system files are properly installed.")
+# Dashboards are imported when their page is first opened, so the first
+# render doesn't pay for modules the user never visits; sys.modules keeps
+# them for later reruns
+def load_component(class_name, *module_names):
+    """Import a dashboard class from the first module that provides it, or None"""
+    for module_name in module_names:
+        try:
+            return getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            continue
+    return None
+
+# Shown when a dashboard module can't be imported
+class FallbackHarrisonDashboard:
+    def run(self):
+        st.error("Harrison's dashboard module not found.")
+        st.markdown("## 🎯 Harrison's Dashboard")
+        st.info("This is a fallback. Please ensure harrison_original_complete.py exists.")
+
+class FallbackTradingDashboard:
+    def run(self):
+        st.error("Dashboard module not found. Creating basic dashboard...")
+        st.markdown("## 🎯 6-Chart Trading Dashboard")
+        st.info("This is a fallback dashboard. Please ensure all system files are properly installed.")
+
+class FallbackSystemIntegration:
+    def render_integration_dashboard(self):
+        st.error("Integration module not found. Creating basic integration...")
+        st.markdown("## 🔗 System Integration")
+        st.info("This is a fallback integration panel. Please ensure all system files are properly installed.")
+
+class FallbackNinjaTraderDashboard:
+    def run(self):
+        st.error("NinjaTrader dashboard module not found.")
+        st.markdown("## 🥷 NinjaTrader + Tradovate Dashboard")
+        st.info("This is a fallback. Please ensure all system files are properly installed.")
 
 class UniversalTradingApp:
     """
@@ -390,28 +373,30 @@ class UniversalTradingApp:
     
     def render_dashboard_page(self):
         """Render the main dashboard page"""
-        dashboard = StreamlitTradingDashboard()
+        dashboard_class = load_component('StreamlitTradingDashboard',
+                                         'system.streamlit_6_chart_dashboard', 'streamlit_6_chart_dashboard')
+        dashboard = (dashboard_class or FallbackTradingDashboard)()
         dashboard.run()
     
     def render_harrison_page(self):
         """Render Harrison's original dashboard page"""
+        def load_enhanced():
+            return load_component('HarrisonEnhancedDashboard',
+                                  'system.harrison_enhanced_dashboard', 'harrison_enhanced_dashboard')
+        
         try:
-            if HarrisonOriginalDashboard:
-                harrison_dashboard = HarrisonOriginalDashboard()
-                harrison_dashboard.run()
-            elif HarrisonStreamlitDashboard:
-                # Fallback to the streamlit_trading_dashboard version
-                harrison_dashboard = HarrisonStreamlitDashboard()
-                harrison_dashboard.run()
-            else:
-                # Final fallback to enhanced version
-                harrison_dashboard = HarrisonEnhancedDashboard()
-                harrison_dashboard.run()
+            # Original, then the streamlit_trading_dashboard version, then the enhanced one
+            harrison_class = (load_component('HarrisonOriginalDashboard', 'harrison_original_complete')
+                              or load_component('TradingDashboard', 'streamlit_trading_dashboard')
+                              or load_enhanced()
+                              or FallbackHarrisonDashboard)
+            harrison_dashboard = harrison_class()
+            harrison_dashboard.run()
         except Exception as e:
             st.error(f"Error loading Harrison's dashboard: {e}")
             st.info("Trying fallback options...")
             try:
-                harrison_dashboard = HarrisonEnhancedDashboard()
+                harrison_dashboard = (load_enhanced() or FallbackHarrisonDashboard)()
                 harrison_dashboard.run()
             except Exception as e2:
                 st.error(f"All Harrison dashboard options failed: {e2}")
@@ -420,12 +405,16 @@ class UniversalTradingApp:
     
     def render_ninjatrader_page(self):
         """Render the NinjaTrader + Tradovate dashboard page"""
-        ninjatrader_dashboard = NinjaTraderTradovateDashboard()
+        ninjatrader_class = load_component('NinjaTraderTradovateDashboard',
+                                           'system.ninjatrader_tradovate_dashboard', 'ninjatrader_tradovate_dashboard')
+        ninjatrader_dashboard = (ninjatrader_class or FallbackNinjaTraderDashboard)()
         ninjatrader_dashboard.run()
     
     def render_integration_page(self):
         """Render the system integration page"""
-        integration = StreamlitSystemIntegration()
+        integration_class = load_component('StreamlitSystemIntegration',
+                                           'system.streamlit_system_integration', 'streamlit_system_integration')
+        integration = (integration_class or FallbackSystemIntegration)()
         integration.render_integration_dashboard()
     
     def render_settings_page(self):
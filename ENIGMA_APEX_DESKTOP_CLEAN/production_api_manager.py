@@ -531,29 +531,40 @@ class ProductionAPIManager:
         self.platforms[name] = platform
         self.logger.info(f"Added trading platform: {name}")
     
+    async def _on_each_platform(self, method: str, *args) -> Dict[str, Any]:
+        """Await a platform method on every platform concurrently
+        
+        Platforms are independent, so total latency is the slowest platform
+        rather than the sum. Failures come back as exception objects.
+        """
+        names = list(self.platforms)
+        outcomes = await asyncio.gather(
+            *(getattr(self.platforms[name], method)(*args) for name in names),
+            return_exceptions=True
+        )
+        return dict(zip(names, outcomes))
+    
     async def connect_all(self) -> Dict[str, bool]:
         """Connect to all configured platforms"""
         results = {}
         
-        for name, platform in self.platforms.items():
-            try:
-                success = await platform.connect()
-                results[name] = success
-                self.logger.info(f"Platform {name} connection: {'Success' if success else 'Failed'}")
-            except Exception as e:
+        for name, outcome in (await self._on_each_platform("connect")).items():
+            if isinstance(outcome, BaseException):
                 results[name] = False
-                self.logger.error(f"Failed to connect to {name}: {e}")
+                self.logger.error(f"Failed to connect to {name}: {outcome}")
+            else:
+                results[name] = outcome
+                self.logger.info(f"Platform {name} connection: {'Success' if outcome else 'Failed'}")
         
         return results
     
     async def disconnect_all(self):
         """Disconnect from all platforms"""
-        for name, platform in self.platforms.items():
-            try:
-                await platform.disconnect()
+        for name, outcome in (await self._on_each_platform("disconnect")).items():
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"Error disconnecting from {name}: {outcome}")
+            else:
                 self.logger.info(f"Disconnected from {name}")
-            except Exception as e:
-                self.logger.error(f"Error disconnecting from {name}: {e}")
     
     async def place_order_on_platform(self, platform_name: str, order: TradingOrder) -> str:
         """Place order on specific platform"""
@@ -567,12 +578,11 @@ class ProductionAPIManager:
         """Get account info from all platforms"""
         results = {}
         
-        for name, platform in self.platforms.items():
-            try:
-                account_info = await platform.get_account_info()
-                results[name] = account_info
-            except Exception as e:
-                self.logger.error(f"Error getting account info from {name}: {e}")
+        for name, outcome in (await self._on_each_platform("get_account_info")).items():
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"Error getting account info from {name}: {outcome}")
+            else:
+                results[name] = outcome
         
         return results
     
@@ -580,32 +590,39 @@ class ProductionAPIManager:
         """Emergency stop - cancel all orders and close positions"""
         self.logger.warning("EMERGENCY STOP ACTIVATED")
         
-        for name, platform in self.platforms.items():
-            try:
-                # Cancel all open orders
-                orders = await platform.get_orders()
-                for order in orders:
-                    if order.status == OrderStatus.PENDING:
-                        await platform.cancel_order(order.order_id)
-                
-                # Close all positions (implementation depends on platform)
-                positions = await platform.get_positions()
-                for position in positions:
-                    if position.quantity != 0:
-                        # Create market order to close position
-                        close_order = TradingOrder(
-                            symbol=position.symbol,
-                            side=OrderSide.SELL if position.quantity > 0 else OrderSide.BUY,
-                            order_type=OrderType.MARKET,
-                            quantity=abs(position.quantity),
-                            account_id=position.account_id
-                        )
-                        await platform.place_order(close_order)
-                
-                self.logger.info(f"Emergency stop completed for {name}")
-                
-            except Exception as e:
-                self.logger.error(f"Error during emergency stop for {name}: {e}")
+        # Every platform is flattened at once; each one still cancels before closing
+        await asyncio.gather(*(
+            self._emergency_stop_platform(name, platform)
+            for name, platform in self.platforms.items()
+        ))
+    
+    async def _emergency_stop_platform(self, name: str, platform: TradingPlatform):
+        """Cancel pending orders, then close open positions, on one platform"""
+        try:
+            # Cancel all open orders
+            orders = await platform.get_orders()
+            for order in orders:
+                if order.status == OrderStatus.PENDING:
+                    await platform.cancel_order(order.order_id)
+            
+            # Close all positions (implementation depends on platform)
+            positions = await platform.get_positions()
+            for position in positions:
+                if position.quantity != 0:
+                    # Create market order to close position
+                    close_order = TradingOrder(
+                        symbol=position.symbol,
+                        side=OrderSide.SELL if position.quantity > 0 else OrderSide.BUY,
+                        order_type=OrderType.MARKET,
+                        quantity=abs(position.quantity),
+                        account_id=position.account_id
+                    )
+                    await platform.place_order(close_order)
+            
+            self.logger.info(f"Emergency stop completed for {name}")
+            
+        except Exception as e:
+            self.logger.error(f"Error during emergency stop for {name}: {e}")
 
 # Example usage and testing
 async def test_production_api():
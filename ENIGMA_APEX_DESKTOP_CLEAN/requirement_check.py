@@ -0,0 +1,28 @@
+"""
+📦 REQUIREMENT CHECK
+Shared by the launchers: finds which pip requirements are missing
+by locating their modules, without importing anything
+"""
+
+import re
+from importlib.util import find_spec
+
+# Import names for packages whose module differs from the pip name (keys lower-case)
+MODULE_NAMES = {
+    "opencv-python": "cv2",
+    "pillow": "PIL",
+    "python-dotenv": "dotenv",
+}
+
+def module_name(requirement):
+    """Import name for a pip requirement such as 'Pillow>=10.0.0'"""
+    name = re.split(r"[<>=!~\[;\s]", requirement, maxsplit=1)[0]
+    return MODULE_NAMES.get(name.lower(), name.replace("-", "_"))
+
+def is_installed(requirement):
+    """Whether the requirement's module can be found on sys.path"""
+    return find_spec(module_name(requirement)) is not None
+
+def missing_requirements(requirements):
+    """Return the requirements whose module can't be found"""
+    return [requirement for requirement in requirements if not is_installed(requirement)]
@@ -11,6 +11,22 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 import logging
 
+# Alerts arrive in bursts (a violation posts several at once), so the
+# HH:MM:SS stamp is formatted once per wall-clock second and reused.
+# The monitor and Tk threads both read it, so it is one immutable
+# (second, text) pair replaced in a single assignment
+_clock_stamp_cache = (-1, "")
+
+def clock_stamp() -> str:
+    """Current local time as HH:MM:SS, reformatted at most once per second"""
+    global _clock_stamp_cache
+    now = int(time.time())
+    second, text = _clock_stamp_cache
+    if now != second:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        _clock_stamp_cache = (now, text)
+    return text
+
 @dataclass
 class ApexRules:
     """Apex Trader Funding rule configurations - OFFICIAL APEX 3.0 RULES"""
@@ -304,6 +320,9 @@ class ApexComplianceGuardian:
         
     def monitoring_loop(self):
         """Main monitoring loop"""
+        # Checks run on fixed one-second deadlines, so time spent checking
+        # doesn't push every later check back
+        next_check = time.monotonic()
         while self.is_monitoring:
             try:
                 # Simulate trade data (in real implementation, connect to Tradovate API)
@@ -311,10 +330,15 @@ class ApexComplianceGuardian:
                 self.check_compliance()
                 self.update_gui()
                 
-                time.sleep(1)  # Update every second
-                
             except Exception as e:
                 self.add_alert(f"❌ Monitoring error: {str(e)}", "ERROR")
+            
+            next_check += 1.0  # Update every second
+            delay = next_check - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_check = time.monotonic()  # Fell behind; don't burst to catch up
                 
     def update_trade_data(self):
         """Update trade data (simulate for demo)"""
@@ -413,8 +437,6 @@ class ApexComplianceGuardian:
             
     def trigger_violation(self, rule_type, message):
         """Trigger rule violation response - OFFICIAL APEX 3.0 CONSEQUENCES"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
         self.add_alert(f"🚨 APEX RULE VIOLATION: {rule_type}", "ERROR")
         self.add_alert(f"💥 {message}", "ERROR") 
         self.add_alert(f"⚡ EXECUTING EMERGENCY PROTOCOL", "ERROR")
@@ -515,7 +537,7 @@ class ApexComplianceGuardian:
             log_filename = f"logs/apex_violation_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             
             with open(log_filename, 'w') as f:
-                json.dump(violation_record, f, indent=2)
+                f.write(json.dumps(violation_record, indent=2))
                 
             self.add_alert(f"📄 Violation log saved: {log_filename}", "INFO")
             
@@ -587,7 +609,7 @@ class ApexComplianceGuardian:
             
     def add_alert(self, message, level="INFO"):
         """Add alert to the log"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        timestamp = clock_stamp()
         
         # Color code by level
         colors = {
@@ -636,7 +658,7 @@ class ApexComplianceGuardian:
         }
 
         with open('apex_settings.json', 'w') as f:
-            json.dump(settings, f, indent=2)
+            f.write(json.dumps(settings, indent=2))
 
         self.add_alert("💾 Settings saved successfully", "SUCCESS")
         
@@ -4,20 +4,22 @@ Universal Streamlit-based visual control system for multi-chart trading
 Works with any trader's setup - configurable for different accounts and strategies
 """
 
-import streamlit as st
-import pandas as pd
+import tkinter as tk
 import numpy as np
 import json
-import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 import logging
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 
-@dataclass
+# Signals the demo monitoring loop picks from
+SIMULATED_SIGNALS = ("BULLISH", "BEARISH", "NONE", "CONFLUENCE L2", "CONFLUENCE L3")
+
+# Simulated data refresh interval
+MONITORING_INTERVAL_MS = 2000
+
+@dataclass(slots=True)
 class ChartStatus:
     """Individual chart status data"""
     chart_id: int
@@ -33,6 +35,31 @@ class ChartStatus:
     last_signal: str
     last_update: datetime
 
+class ChartSnapshot(NamedTuple):
+    """Immutable view of every chart, replaced whole on each monitoring tick"""
+    chart_ids: Tuple[int, ...]
+    margin_percentage: np.ndarray
+    daily_pnl: np.ndarray
+    open_positions: np.ndarray
+    signals: Tuple[str, ...]
+    active: np.ndarray
+    timestamp: datetime
+
+@lru_cache(maxsize=1024)
+def _format_margin(percentage_tenths: int, remaining_dollars: int) -> str:
+    """Chart margin line, keyed on the values as displayed"""
+    return f"{percentage_tenths / 10:.1f}% | ${remaining_dollars:,}"
+
+@lru_cache(maxsize=1024)
+def _format_pnl(pnl_cents: int) -> str:
+    """Daily P&L line, keyed on the value as displayed"""
+    return f"Daily P&L: ${pnl_cents / 100:,.2f}"
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    """Mark a snapshot array read-only so readers can share it safely"""
+    array.flags.writeable = False
+    return array
+
 class MultiChartControlPanel:
     """Michael's 6-Chart Visual Control Panel"""
     
@@ -41,6 +68,7 @@ class MultiChartControlPanel:
         self.total_margin_remaining = 0.0
         self.total_margin_percentage = 100.0
         self.is_monitoring = False
+        self._rng = np.random.default_rng()
         
         # Initialize 6 charts with demo data
         self.initialize_charts()
@@ -48,7 +76,7 @@ class MultiChartControlPanel:
         # Setup GUI
         self.setup_gui()
         
-        # Start monitoring thread
+        # Schedule monitoring ticks on the tk event loop
         self.start_monitoring()
         
     def initialize_charts(self):
@@ -77,6 +105,22 @@ class MultiChartControlPanel:
                 last_signal="NONE",
                 last_update=datetime.now()
             )
+        
+        self._snapshot = self.snapshot_from_charts()
+    
+    def snapshot_from_charts(self) -> ChartSnapshot:
+        """Build a snapshot from the current chart state"""
+        charts = list(self.chart_data.values())
+        count = len(charts)
+        return ChartSnapshot(
+            chart_ids=tuple(chart.chart_id for chart in charts),
+            margin_percentage=_frozen(np.fromiter((c.margin_percentage for c in charts), dtype=float, count=count)),
+            daily_pnl=_frozen(np.fromiter((c.daily_pnl for c in charts), dtype=float, count=count)),
+            open_positions=_frozen(np.fromiter((c.open_positions for c in charts), dtype=int, count=count)),
+            signals=tuple(chart.last_signal for chart in charts),
+            active=_frozen(np.fromiter((c.is_active for c in charts), dtype=bool, count=count)),
+            timestamp=datetime.now()
+        )
     
     def setup_gui(self):
         """Create Michael's visual control panel"""
@@ -124,23 +168,29 @@ class MultiChartControlPanel:
         display_frame = tk.Frame(margin_frame, bg='#2d2d2d')
         display_frame.pack(pady=10)
         
+        # Text variables let each tick update the labels with a single Tcl variable write
+        self.margin_percentage_var = tk.StringVar(value="85.2%")
+        self.margin_amount_var = tk.StringVar(value="$127,500")
+        self.overall_status_var = tk.StringVar(value="SAFE TRADING")
+        
         # Percentage display
-        self.margin_percentage_label = tk.Label(display_frame, text="85.2%", 
+        self.margin_percentage_label = tk.Label(display_frame, textvariable=self.margin_percentage_var, 
                                                bg='#2d2d2d', fg='#00ff88', 
                                                font=('Arial', 36, 'bold'))
         self.margin_percentage_label.pack(side='left', padx=20)
         
         # Dollar amount display
-        self.margin_amount_label = tk.Label(display_frame, text="$127,500", 
+        self.margin_amount_label = tk.Label(display_frame, textvariable=self.margin_amount_var, 
                                            bg='#2d2d2d', fg='#00ff88', 
                                            font=('Arial', 24, 'bold'))
         self.margin_amount_label.pack(side='left', padx=20)
         
         # Status indicator
-        self.overall_status_label = tk.Label(display_frame, text="SAFE TRADING", 
+        self.overall_status_label = tk.Label(display_frame, textvariable=self.overall_status_var, 
                                             bg='#00ff88', fg='black', 
                                             font=('Arial', 16, 'bold'), padx=20, pady=5)
         self.overall_status_label.pack(side='left', padx=20)
+        self._overall_colors = ('#00ff88', 'black')
         
     def create_chart_grid(self):
         """Create 6-chart grid with Red/Green/Yellow boxes"""
@@ -194,22 +244,23 @@ class MultiChartControlPanel:
         status_frame.pack(fill='x', padx=10, pady=5)
         status_frame.pack_propagate(False)
         
+        # Text variables updated on every tick
+        risk_text_var = tk.StringVar(value="SAFE TRADING")
+        margin_text_var = tk.StringVar(value=f"{chart_data.margin_percentage:.1f}% | ${chart_data.margin_remaining:,.0f}")
+        pnl_text_var = tk.StringVar(value=f"Daily P&L: ${chart_data.daily_pnl:,.2f}")
+        positions_text_var = tk.StringVar(value=f"Positions: {chart_data.open_positions}")
+        signal_text_var = tk.StringVar(value=f"Signal: {chart_data.last_signal}")
+        
         # Risk level text
-        risk_label = tk.Label(status_frame, text="SAFE TRADING", 
+        risk_label = tk.Label(status_frame, textvariable=risk_text_var, 
                              bg='#00ff88', fg='black', font=('Arial', 14, 'bold'))
         risk_label.pack(expand=True)
         
         # Margin info
-        margin_info = tk.Label(status_frame, text=f"{chart_data.margin_percentage:.1f}% | ${chart_data.margin_remaining:,.0f}", 
+        margin_info = tk.Label(status_frame, textvariable=margin_text_var, 
                               bg='#00ff88', fg='black', font=('Arial', 12))
         margin_info.pack()
         
-        self.chart_labels[chart_id] = {
-            'status_frame': status_frame,
-            'risk_label': risk_label,
-            'margin_info': margin_info
-        }
-        
         # Account details
         details_frame = tk.Frame(chart_frame, bg='#2d2d2d')
         details_frame.pack(fill='x', padx=10, pady=5)
@@ -221,20 +272,33 @@ class MultiChartControlPanel:
         
         # Daily P&L
         pnl_color = '#00ff88' if chart_data.daily_pnl >= 0 else '#ff4444'
-        pnl_label = tk.Label(details_frame, text=f"Daily P&L: ${chart_data.daily_pnl:,.2f}", 
+        pnl_label = tk.Label(details_frame, textvariable=pnl_text_var, 
                             bg='#2d2d2d', fg=pnl_color, font=('Arial', 10))
         pnl_label.pack(anchor='w')
         
         # Open positions
-        positions_label = tk.Label(details_frame, text=f"Positions: {chart_data.open_positions}", 
+        positions_label = tk.Label(details_frame, textvariable=positions_text_var, 
                                   bg='#2d2d2d', fg='white', font=('Arial', 10))
         positions_label.pack(anchor='w')
         
         # Last signal
-        signal_label = tk.Label(details_frame, text=f"Signal: {chart_data.last_signal}", 
+        signal_label = tk.Label(details_frame, textvariable=signal_text_var, 
                                bg='#2d2d2d', fg='#ffaa00', font=('Arial', 10))
         signal_label.pack(anchor='w')
         
+        self.chart_labels[chart_id] = {
+            'status_frame': status_frame,
+            'risk_label': risk_label,
+            'margin_info': margin_info,
+            'pnl_label': pnl_label,
+            'risk_text_var': risk_text_var,
+            'margin_text_var': margin_text_var,
+            'pnl_text_var': pnl_text_var,
+            'positions_text_var': positions_text_var,
+            'signal_text_var': signal_text_var,
+            'rendered': {}
+        }
+        
     def create_control_buttons(self):
         """Create main control buttons"""
         control_frame = tk.Frame(self.root, bg='#1a1a1a', pady=20)
@@ -278,15 +342,20 @@ class MultiChartControlPanel:
             print(f"❌ Chart {chart_id} ({self.chart_data[chart_id].account_name}) DEACTIVATED")
     
     def update_chart_status(self, chart_id: int, margin_percentage: float, daily_pnl: float, 
-                           open_positions: int = 0, last_signal: str = "NONE"):
-        """Update individual chart status and color"""
+                           open_positions: int = 0, last_signal: str = "NONE",
+                           now: Optional[datetime] = None):
+        """Update individual chart status and color
+        
+        Pass ``now`` when updating several charts in the same tick so they
+        share one timestamp.
+        """
         chart_data = self.chart_data[chart_id]
         chart_data.margin_percentage = margin_percentage
         chart_data.daily_pnl = daily_pnl
         chart_data.open_positions = open_positions
         chart_data.last_signal = last_signal
         chart_data.margin_remaining = chart_data.account_balance * (margin_percentage / 100)
-        chart_data.last_update = datetime.now()
+        chart_data.last_update = now if now is not None else datetime.now()
         
         # Determine risk level and color
         if margin_percentage >= 70:
@@ -306,15 +375,41 @@ class MultiChartControlPanel:
         
         # Update GUI
         labels = self.chart_labels[chart_id]
-        labels['status_frame'].configure(bg=color)
-        labels['risk_label'].configure(text=risk_level, bg=color, fg=text_color)
-        labels['margin_info'].configure(text=f"{margin_percentage:.1f}% | ${chart_data.margin_remaining:,.0f}", 
-                                       bg=color, fg=text_color)
+        rendered = labels['rendered']
+        
+        if rendered.get('colors') != (color, text_color):
+            rendered['colors'] = (color, text_color)
+            labels['status_frame'].configure(bg=color)
+            labels['risk_label'].configure(bg=color, fg=text_color)
+            labels['margin_info'].configure(bg=color, fg=text_color)
+        
+        pnl_color = '#00ff88' if daily_pnl >= 0 else '#ff4444'
+        if rendered.get('pnl_color') != pnl_color:
+            rendered['pnl_color'] = pnl_color
+            labels['pnl_label'].configure(fg=pnl_color)
+        
+        self._set_label_text(labels, 'risk_text_var', risk_level)
+        self._set_label_text(labels, 'margin_text_var',
+                             _format_margin(round(margin_percentage * 10), round(chart_data.margin_remaining)))
+        self._set_label_text(labels, 'pnl_text_var', _format_pnl(round(daily_pnl * 100)))
+        self._set_label_text(labels, 'positions_text_var', f"Positions: {open_positions}")
+        self._set_label_text(labels, 'signal_text_var', f"Signal: {last_signal}")
+        
+    def _set_label_text(self, labels: Dict[str, Any], var_name: str, text: str):
+        """Write a chart label's text variable only when the displayed text changes"""
+        rendered = labels['rendered']
+        if rendered.get(var_name) != text:
+            rendered[var_name] = text
+            labels[var_name].set(text)
         
     def calculate_overall_margin(self):
         """Calculate overall margin remaining across all charts"""
-        total_balance = sum(chart.account_balance for chart in self.chart_data.values() if chart.is_active)
-        total_remaining = sum(chart.margin_remaining for chart in self.chart_data.values() if chart.is_active)
+        total_balance = 0.0
+        total_remaining = 0.0
+        for chart in self.chart_data.values():
+            if chart.is_active:
+                total_balance += chart.account_balance
+                total_remaining += chart.margin_remaining
         
         if total_balance > 0:
             overall_percentage = (total_remaining / total_balance) * 100
@@ -325,8 +420,8 @@ class MultiChartControlPanel:
         self.total_margin_percentage = overall_percentage
         
         # Update overall display
-        self.margin_percentage_label.configure(text=f"{overall_percentage:.1f}%")
-        self.margin_amount_label.configure(text=f"${total_remaining:,.0f}")
+        self.margin_percentage_var.set(f"{overall_percentage:.1f}%")
+        self.margin_amount_var.set(f"${total_remaining:,.0f}")
         
         # Update overall status color
         if overall_percentage >= 70:
@@ -342,18 +437,14 @@ class MultiChartControlPanel:
             status_color = '#ff4444'
             text_color = 'white'
             
-        self.overall_status_label.configure(text=status_text, bg=status_color, fg=text_color)
+        self.overall_status_var.set(status_text)
         
-        # Update margin percentage and amount colors
-        if overall_percentage >= 70:
-            color = '#00ff88'
-        elif overall_percentage >= 40:
-            color = '#ffaa00'
-        else:
-            color = '#ff4444'
-            
-        self.margin_percentage_label.configure(fg=color)
-        self.margin_amount_label.configure(fg=color)
+        # Status box and margin figures share the same colour band
+        if self._overall_colors != (status_color, text_color):
+            self._overall_colors = (status_color, text_color)
+            self.overall_status_label.configure(bg=status_color, fg=text_color)
+            self.margin_percentage_label.configure(fg=status_color)
+            self.margin_amount_label.configure(fg=status_color)
         
     def emergency_stop_all(self):
         """Emergency stop all trading activities"""
@@ -413,43 +504,66 @@ class MultiChartControlPanel:
         info_label.pack(pady=20)
         
     def start_monitoring(self):
-        """Start monitoring thread"""
+        """Start monitoring on the tk event loop"""
         self.is_monitoring = True
-        self.monitoring_thread = threading.Thread(target=self.monitoring_loop)
-        self.monitoring_thread.daemon = True
-        self.monitoring_thread.start()
-        
-    def monitoring_loop(self):
-        """Main monitoring loop with simulated data"""
-        import random
-        
-        while True:
-            if self.is_monitoring:
-                # Simulate margin changes for each active chart
-                for chart_id, chart_data in self.chart_data.items():
-                    if chart_data.is_active:
-                        # Simulate margin percentage changes
-                        change = random.uniform(-2, 2)
-                        new_margin = max(10, min(95, chart_data.margin_percentage + change))
-                        
-                        # Simulate P&L changes
-                        pnl_change = random.uniform(-100, 100)
-                        new_pnl = chart_data.daily_pnl + pnl_change
-                        
-                        # Simulate positions
-                        positions = random.randint(0, 3)
-                        
-                        # Simulate signals
-                        signals = ["BULLISH", "BEARISH", "NONE", "CONFLUENCE L2", "CONFLUENCE L3"]
-                        signal = random.choice(signals)
-                        
-                        # Update chart
-                        self.update_chart_status(chart_id, new_margin, new_pnl, positions, signal)
-                
-                # Update overall margin
-                self.calculate_overall_margin()
-                
-            time.sleep(2)  # Update every 2 seconds
+        self.root.after(MONITORING_INTERVAL_MS, self.monitoring_tick)
+        
+    def monitoring_tick(self):
+        """Run one monitoring update with simulated data, then reschedule"""
+        if self.is_monitoring:
+            self._snapshot = self.build_next_snapshot()
+            self.apply_snapshot()
+            
+        self.root.after(MONITORING_INTERVAL_MS, self.monitoring_tick)
+            
+    def build_next_snapshot(self) -> ChartSnapshot:
+        """Simulate one tick on top of the last published snapshot"""
+        previous = self._snapshot
+        active = np.fromiter((self.chart_data[chart_id].is_active for chart_id in previous.chart_ids),
+                             dtype=bool, count=len(previous.chart_ids))
+        count = int(active.sum())
+        
+        margins = previous.margin_percentage.copy()
+        pnl = previous.daily_pnl.copy()
+        positions = previous.open_positions.copy()
+        signals = list(previous.signals)
+        
+        if count:
+            # Draw every active chart's simulated deltas in one batch
+            margins[active] = np.clip(margins[active] + self._rng.uniform(-2, 2, count), 10, 95)
+            pnl[active] += self._rng.uniform(-100, 100, count)
+            positions[active] = self._rng.integers(0, 4, count)
+            signal_indices = self._rng.integers(0, len(SIMULATED_SIGNALS), count)
+            for i, signal_index in zip(np.flatnonzero(active), signal_indices):
+                signals[i] = SIMULATED_SIGNALS[signal_index]
+        
+        return ChartSnapshot(
+            chart_ids=previous.chart_ids,
+            margin_percentage=_frozen(margins),
+            daily_pnl=_frozen(pnl),
+            open_positions=_frozen(positions),
+            signals=tuple(signals),
+            active=_frozen(active),
+            timestamp=datetime.now()
+        )
+        
+    def apply_snapshot(self):
+        """Render the latest snapshot to the chart widgets"""
+        snapshot = self._snapshot
+        
+        for i in np.flatnonzero(snapshot.active):
+            self.update_chart_status(snapshot.chart_ids[i],
+                                     float(snapshot.margin_percentage[i]),
+                                     float(snapshot.daily_pnl[i]),
+                                     int(snapshot.open_positions[i]),
+                                     snapshot.signals[i],
+                                     now=snapshot.timestamp)
+        
+        # Update overall margin
+        self.calculate_overall_margin()
+        
+        # Flush every widget change from this tick in one repaint
+        self.root.update_idletasks()
             
     def run(self):
         """Start the control panel"""
@@ -10,6 +10,7 @@ import numpy as np
 import pytesseract
 from PIL import Image, ImageGrab
 import json
+import re
 import time
 import asyncio
 import websockets
@@ -24,6 +25,9 @@ from enigma_config import (
     CADENCE_THRESHOLD_PM,
 )
 
+# Calibration input: four comma-separated integers
+COORDINATES_INPUT = re.compile(r"\s*\d+\s*(?:,\s*\d+\s*){3}")
+
 # Configure OCR path — override with TESSERACT_CMD env var if Tesseract is installed elsewhere
 pytesseract.pytesseract.tesseract_cmd = os.environ.get(
     'TESSERACT_CMD', r'C:\Program Files\Tesseract-OCR\tesseract.exe'
@@ -111,7 +115,7 @@ class OCRSignalReader:
             import os
             os.makedirs("config", exist_ok=True)
             with open(self.config_path, 'w') as f:
-                json.dump(self.regions, f, indent=2)
+                f.write(json.dumps(self.regions, indent=2))
             
             self.logger.warning(f"📝 Created OCR config template at {self.config_path}")
             self.logger.warning("⚠️  Please calibrate screen regions before using!")
@@ -395,6 +399,9 @@ class OCRSignalReader:
         """Start continuous signal monitoring and transmission"""
         self.logger.info("🚀 Starting continuous Enigma signal monitoring")
         
+        # One connection for the whole session instead of a handshake per signal
+        websocket = None
+        
         while True:
             try:
                 # Read current panel state
@@ -429,16 +436,24 @@ class OCRSignalReader:
                 
                 # Transmit to WebSocket server
                 try:
-                    async with websockets.connect(websocket_url) as websocket:
-                        await websocket.send(json.dumps(signal_data))
-                        
-                        # Log significant signals
-                        if validation["is_tradeable"] and cadence_met:
-                            self.logger.info(f"🎯 HIGH-PROBABILITY SIGNAL: Power={signal.power_score}, "
-                                           f"Confluence={signal.confluence_level}, Cadence={signal.cadence_failures}")
+                    if websocket is None:
+                        websocket = await websockets.connect(websocket_url)
+                    await websocket.send(json.dumps(signal_data))
+                    
+                    # Log significant signals
+                    if validation["is_tradeable"] and cadence_met:
+                        self.logger.info(f"🎯 HIGH-PROBABILITY SIGNAL: Power={signal.power_score}, "
+                                       f"Confluence={signal.confluence_level}, Cadence={signal.cadence_failures}")
                         
                 except Exception as e:
                     self.logger.error(f"❌ Failed to transmit signal: {e}")
+                    # Drop the broken connection; the next signal reconnects
+                    if websocket is not None:
+                        try:
+                            await websocket.close()
+                        except Exception:
+                            pass
+                        websocket = None
                 
                 # Wait before next reading (adjust frequency as needed)
                 await asyncio.sleep(2)  # 2-second intervals
@@ -476,23 +491,22 @@ class OCRSignalReader:
             print("Enter coordinates as: x1,y1,x2,y2 (top-left to bottom-right)")
             
             while True:
-                try:
-                    coords_input = input(f"{region_name}: ").strip()
-                    coords = [int(x.strip()) for x in coords_input.split(',')]
-                    
-                    if len(coords) == 4:
-                        self.regions[region_name] = coords
-                        print(f"✅ Set {region_name}: {coords}")
-                        break
-                    else:
+                coords_input = input(f"{region_name}: ").strip()
+                if not COORDINATES_INPUT.fullmatch(coords_input):
+                    if re.fullmatch(r"[\d\s,]*", coords_input):
                         print("❌ Please enter exactly 4 coordinates")
-                        
-                except ValueError:
-                    print("❌ Please enter valid numbers")
+                    else:
+                        print("❌ Please enter valid numbers")
+                    continue
+                
+                coords = [int(x) for x in coords_input.split(',')]
+                self.regions[region_name] = coords
+                print(f"✅ Set {region_name}: {coords}")
+                break
         
         # Save calibrated configuration
         with open(self.config_path, 'w') as f:
-            json.dump(self.regions, f, indent=2)
+            f.write(json.dumps(self.regions, indent=2))
         
         print(f"✅ Calibration saved to {self.config_path}")
         print("🚀 Ready for signal reading!")
@@ -118,7 +118,7 @@ class StreamlitTradingControlPanel:
         
         config_data = asdict(st.session_state.system_config)
         with open('config/streamlit_config.json', 'w') as f:
-            json.dump(config_data, f, indent=2)
+            f.write(json.dumps(config_data, indent=2))
     
     def setup_logging(self):
         """Setup logging"""
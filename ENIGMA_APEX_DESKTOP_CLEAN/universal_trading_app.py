@@ -10,6 +10,7 @@ import numpy as np
 import json
 import time
 from datetime import datetime, timedelta
+from string import Template
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any
 import logging
@@ -28,6 +29,49 @@ except ImportError as e:
     st.error(f"Module import error: {e}")
     MODULES_AVAILABLE = False
 
+# Header styles and banner as one template; only the trader's name is filled in per render
+MAIN_HEADER_TEMPLATE = Template("""
+<style>
+.main-header {
+    background: linear-gradient(90deg, #1a1a1a, #2d2d2d, #1a1a1a);
+    padding: 20px;
+    border-radius: 15px;
+    border: 2px solid #00ff88;
+    margin-bottom: 20px;
+    text-align: center;
+}
+.trader-name {
+    color: #00ff88;
+    font-size: 24px;
+    font-weight: bold;
+    margin: 10px 0;
+}
+.chart-status-box {
+    padding: 15px;
+    border-radius: 10px;
+    margin: 10px 0;
+    text-align: center;
+    font-weight: bold;
+}
+.status-safe { background-color: #00ff88; color: black; }
+.status-warning { background-color: #ffaa00; color: black; }
+.status-danger { background-color: #ff4444; color: white; }
+.metric-card {
+    background: #2d2d2d;
+    padding: 20px;
+    border-radius: 10px;
+    border: 1px solid #444;
+    margin: 10px 0;
+}
+</style>
+<div class="main-header">
+    <h1 style='color: #00ff88; margin: 0;'>🎯 Universal Multi-Chart Trading Dashboard</h1>
+    <div class="trader-name">${trader_name}'s Command Center</div>
+    <p style='color: #ffffff; margin: 5px 0;'>OCR Integration • Apex Compliance • Visual Controls</p>
+    <p style='color: #ffaa00; margin: 0;'>Real-time Multi-Account Trading Management</p>
+</div>
+""")
+
 # Configure page
 st.set_page_config(
     page_title="🎯 Universal Trading Dashboard",
@@ -73,57 +117,13 @@ class UniversalTradingDashboard:
     
     def create_main_header(self):
         """Create main application header"""
-        # Custom CSS for better styling
-        st.markdown("""
-        <style>
-        .main-header {
-            background: linear-gradient(90deg, #1a1a1a, #2d2d2d, #1a1a1a);
-            padding: 20px;
-            border-radius: 15px;
-            border: 2px solid #00ff88;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        .trader-name {
-            color: #00ff88;
-            font-size: 24px;
-            font-weight: bold;
-            margin: 10px 0;
-        }
-        .chart-status-box {
-            padding: 15px;
-            border-radius: 10px;
-            margin: 10px 0;
-            text-align: center;
-            font-weight: bold;
-        }
-        .status-safe { background-color: #00ff88; color: black; }
-        .status-warning { background-color: #ffaa00; color: black; }
-        .status-danger { background-color: #ff4444; color: white; }
-        .metric-card {
-            background: #2d2d2d;
-            padding: 20px;
-            border-radius: 10px;
-            border: 1px solid #444;
-            margin: 10px 0;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
         # Get trader name from session state
         trader_name = st.session_state.get('trader_name', 'Trader')
         if not trader_name or trader_name == "":
             trader_name = "Universal Trader"
         
-        # Main header
-        st.markdown(f"""
-        <div class="main-header">
-            <h1 style='color: #00ff88; margin: 0;'>🎯 Universal Multi-Chart Trading Dashboard</h1>
-            <div class="trader-name">{trader_name}'s Command Center</div>
-            <p style='color: #ffffff; margin: 5px 0;'>OCR Integration • Apex Compliance • Visual Controls</p>
-            <p style='color: #ffaa00; margin: 0;'>Real-time Multi-Account Trading Management</p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Styles and header go out as one element; only the name changes
+        st.markdown(MAIN_HEADER_TEMPLATE.substitute(trader_name=trader_name), unsafe_allow_html=True)
     
     def create_setup_wizard(self):
         """Create initial setup wizard for new users"""
@@ -15,12 +15,34 @@ FEATURES INCLUDED:
 ✅ All Enhanced Capabilities
 """
 
+from importlib.metadata import PackageNotFoundError, version
 import subprocess
 import sys
 import os
 import time
+import webbrowser
 from pathlib import Path
 
+from requirement_check import missing_requirements
+
+# pip for the interpreter running this launcher, built once and reused for every run
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--prefer-binary"]
+
+# Shared by every pip run: a persistent wheel cache, wheels over source
+# builds, patience on slow connections, no prompts, and no .pyc writes for
+# pip's own modules
+PIP_ENV = {
+    "PIP_CACHE_DIR": str(Path.home() / ".cache" / "enigma_pip"),
+    "PIP_PREFER_BINARY": "1",
+    "PIP_DEFAULT_TIMEOUT": "120",
+    "PIP_RETRIES": "5",
+    "PIP_NO_INPUT": "1",
+    "PYTHONDONTWRITEBYTECODE": "1"
+}
+
+# Enhanced-package wheels are downloaded here while the core install runs
+PREFETCH_DIR = Path.home() / ".cache" / "enigma_pip" / "wheels"
+
 def install_requirements():
     """Install all required packages for full functionality"""
     # Core requirements (essential)
@@ -40,35 +62,104 @@ def install_requirements():
         "requests>=2.25.0"      # For API connections
     ]
     
+    # Only hand pip what isn't importable yet; warm launches skip pip entirely
+    core_requirements = missing_requirements(core_requirements)
+    enhanced_requirements = missing_requirements(enhanced_requirements)
+    if not core_requirements and not enhanced_requirements:
+        print("✅ All required packages already installed")
+        return
+    
     print("🔄 Installing required packages for full functionality...")
     
+    # Up-to-date pip and wheel let everything below install from cached wheels
+    pip_install(["-U", "pip", "wheel"], timeout=120)
+    
+    # Download the enhanced wheels in the background; 'pip download' only
+    # writes to PREFETCH_DIR, so it can overlap the core install safely
+    prefetch = start_prefetch(enhanced_requirements) if core_requirements else None
+    
     # Install core packages first
-    print("📦 Installing core packages...")
-    for package in core_requirements:
-        try:
-            print(f"   Installing {package}...")
-            result = subprocess.run([sys.executable, "-m", "pip", "install", package], 
-                                  capture_output=True, text=True, timeout=60)
-            if result.returncode == 0:
-                print(f"✅ {package}")
-            else:
-                print(f"⚠️ {package} - install issues (continuing)")
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, Exception) as e:
-            print(f"⚠️ {package} - failed ({type(e).__name__})")
+    if core_requirements:
+        print("📦 Installing core packages...")
+        success, output = pip_install(core_requirements, timeout=300)
+        if success:
+            report_installed(core_requirements, output)
+        else:
+            print("⚠️ Core packages - install issues (continuing)")
+    
+    if not enhanced_requirements:
+        return
     
     # Install enhanced packages (optional)
     print("🎯 Installing enhanced packages...")
+    find_links = []
+    if prefetch is not None:
+        wait_for_prefetch(prefetch, timeout=300)
+        find_links = ["--find-links", str(PREFETCH_DIR)]
+    success, output = pip_install(enhanced_requirements, timeout=300, options=find_links)
+    if success:
+        report_installed(enhanced_requirements, output)
+        return
+    
+    # One failing optional package fails the whole batch, so retry individually
     for package in enhanced_requirements:
-        try:
-            print(f"   Installing {package}...")
-            result = subprocess.run([sys.executable, "-m", "pip", "install", package], 
-                                  capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                print(f"✅ {package}")
-            else:
-                print(f"⚠️ {package} - optional feature, continuing without")
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, Exception) as e:
-            print(f"⚠️ {package} - optional feature, skipping ({type(e).__name__})")
+        print(f"   Installing {package}...")
+        success, output = pip_install([package], timeout=60)
+        if success:
+            report_installed([package], output)
+        else:
+            print(f"⚠️ {package} - optional feature, continuing without")
+
+def start_prefetch(packages):
+    """Start downloading wheels for packages without waiting, or None if pip can't start"""
+    if not packages:
+        return None
+    try:
+        return subprocess.Popen(
+            [sys.executable, "-m", "pip", "download", "--disable-pip-version-check",
+             "--dest", str(PREFETCH_DIR)] + list(packages),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            env={**os.environ, **PIP_ENV})
+    except OSError:
+        return None
+
+def wait_for_prefetch(process, timeout):
+    """Let a background download finish; a failed or slow one just means pip uses the index"""
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def pip_install(packages, timeout, options=()):
+    """Install packages with a single pip run so the resolver starts only once
+    
+    Returns (success, pip's stdout).
+    """
+    try:
+        result = subprocess.run(PIP_INSTALL + list(options) + list(packages),
+                                capture_output=True, text=True, timeout=timeout,
+                                env={**os.environ, **PIP_ENV})
+        return result.returncode == 0, result.stdout
+    except (subprocess.SubprocessError, OSError) as e:
+        print(f"⚠️ pip failed ({type(e).__name__})")
+        return False, ""
+
+def report_installed(packages, pip_output):
+    """Print per-package status from one batched pip run's output"""
+    installed = set()
+    for line in pip_output.splitlines():
+        if line.startswith("Successfully installed "):
+            # "Successfully installed numpy-1.26.4 opencv-python-4.9.0.80"
+            for dist in line[len("Successfully installed "):].split():
+                installed.add(dist.rsplit("-", 1)[0].lower().replace("_", "-"))
+    
+    for package in packages:
+        name = package.split(">=")[0].lower()
+        if name in installed:
+            print(f"✅ {package} - installed")
+        else:
+            print(f"✅ {package} - already installed")
 
 def check_system():
     """Check system requirements and capabilities"""
@@ -84,9 +175,8 @@ def check_system():
     
     # Core packages
     try:
-        import streamlit
-        print(f"✅ Streamlit {streamlit.__version__}")
-    except ImportError:
+        print(f"✅ Streamlit {version('streamlit')}")
+    except PackageNotFoundError:
         print("❌ Streamlit not found")
         return False
     
@@ -108,14 +198,22 @@ def check_system():
     except ImportError:
         print("⚠️ Tesseract not found - OCR text recognition disabled")
     
-    # Core files
+    return True
+
+def check_core_files():
+    """Check the dashboard's own files are present"""
+    print("\n📁 Core Files:")
     required_files = [
         "harrison_original_complete.py",
         "app.py"
     ]
     
+    # One directory listing instead of a stat() per file
+    with os.scandir(".") as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+    
     for file in required_files:
-        if os.path.exists(file):
+        if file in present:
             print(f"✅ {file}")
         else:
             print(f"❌ {file} - missing!")
@@ -123,31 +221,55 @@ def check_system():
     
     return True
 
+# Console banners, printed with a single write each
+BANNER = "\n".join([
+    "=" * 80,
+    "🎯 HARRISON'S COMPLETE TRADING DASHBOARD",
+    "=" * 80,
+    "🚀 ALL FEATURES INTEGRATED - PRODUCTION READY!",
+    "",
+    "📊 INCLUDED FEATURES:",
+    "  ✅ Harrison's Original Clean Interface",
+    "  ✅ NinjaTrader + Tradovate Integration",
+    "  ✅ Real Connection Testing (Demo/Test/Live)",
+    "  ✅ Multi-account Futures Trading Management",
+    "  ✅ OCR Signal Reading Capabilities",
+    "  ✅ Emergency Stop Protection",
+    "  ✅ Professional Margin Monitoring",
+    "  ✅ 6-Chart Control Grid",
+    "  ✅ Real-time Data Updates",
+    "  ✅ Risk Management & Compliance",
+    "",
+    "=" * 80
+])
+
+QUICK_START = "\n".join([
+    "\n🚀 Launching Harrison's Complete Trading Dashboard...",
+    "\n📋 QUICK START GUIDE:",
+    "1. 🎯 Start in DEMO mode for safe exploration",
+    "2. 🔷 Test connections in TEST mode",
+    "3. 🔴 Only use LIVE mode when ready for real trading",
+    "4. 📊 Monitor the OVERALL MARGIN (most important indicator)",
+    "5. 🚨 Use EMERGENCY STOP if needed",
+    "\n💡 TIP: Harrison's interface is clean and simple - perfect for focus!",
+    "=" * 80
+])
+
 def main():
     """Main launcher for Harrison's complete dashboard"""
-    print("=" * 80)
-    print("🎯 HARRISON'S COMPLETE TRADING DASHBOARD")
-    print("=" * 80)
-    print("🚀 ALL FEATURES INTEGRATED - PRODUCTION READY!")
-    print("")
-    print("📊 INCLUDED FEATURES:")
-    print("  ✅ Harrison's Original Clean Interface")
-    print("  ✅ NinjaTrader + Tradovate Integration")
-    print("  ✅ Real Connection Testing (Demo/Test/Live)")
-    print("  ✅ Multi-account Futures Trading Management")
-    print("  ✅ OCR Signal Reading Capabilities")
-    print("  ✅ Emergency Stop Protection")
-    print("  ✅ Professional Margin Monitoring")
-    print("  ✅ 6-Chart Control Grid")
-    print("  ✅ Real-time Data Updates")
-    print("  ✅ Risk Management & Compliance")
-    print("")
-    print("=" * 80)
+    print(BANNER)
     
     # Change to script directory
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
     
+    # Missing dashboard files can't be fixed by pip, so find out before installing anything
+    if not check_core_files():
+        print("\n❌ System check failed!")
+        print("Please fix the issues above and try again.")
+        input("Press Enter to exit...")
+        return
+    
     # Install packages
     install_requirements()
     
@@ -158,25 +280,17 @@ def main():
         input("Press Enter to exit...")
         return
     
-    print("\n🚀 Launching Harrison's Complete Trading Dashboard...")
-    print("\n📋 QUICK START GUIDE:")
-    print("1. 🎯 Start in DEMO mode for safe exploration")
-    print("2. 🔷 Test connections in TEST mode") 
-    print("3. 🔴 Only use LIVE mode when ready for real trading")
-    print("4. 📊 Monitor the OVERALL MARGIN (most important indicator)")
-    print("5. 🚨 Use EMERGENCY STOP if needed")
-    print("\n💡 TIP: Harrison's interface is clean and simple - perfect for focus!")
-    print("=" * 80)
+    print(QUICK_START)
     
     try:
         # Launch Harrison's complete dashboard
-        subprocess.run([
+        run_streamlit([
             sys.executable, "-m", "streamlit", "run", "harrison_original_complete.py",
             "--server.port", "8501",
             "--server.address", "localhost",
             "--browser.gatherUsageStats", "false",
             "--theme.base", "light"
-        ])
+        ], "http://localhost:8501")
     except KeyboardInterrupt:
         print("\n👋 Harrison's Dashboard stopped by user")
     except Exception as e:
@@ -184,14 +298,34 @@ def main():
         print("Trying alternative launch method...")
         try:
             # Fallback: launch main app
-            subprocess.run([
+            run_streamlit([
                 sys.executable, "-m", "streamlit", "run", "app.py",
                 "--server.port", "8502",
                 "--server.address", "localhost"
-            ])
+            ], "http://localhost:8502")
         except Exception as e2:
             print(f"❌ Fallback also failed: {e2}")
             input("Press Enter to exit...")
 
+# Line Streamlit logs once the server is accepting connections
+STREAMLIT_READY = "You can now view your Streamlit app"
+
+def run_streamlit(command, url):
+    """Run Streamlit, mirroring its log and opening the browser as soon as the server is up"""
+    # Headless so the browser is opened here, on the ready line, rather than by Streamlit
+    process = subprocess.Popen(command + ["--server.headless", "true"],
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, encoding="utf-8", errors="replace", bufsize=1)
+    browser_opened = False
+    try:
+        for line in process.stdout:
+            print(line, end="", flush=True)
+            if not browser_opened and STREAMLIT_READY in line:
+                webbrowser.open(url)
+                browser_opened = True
+    finally:
+        # Ctrl+C reaches Streamlit too; let it shut down before the launcher exits
+        process.wait()
+
 if __name__ == "__main__":
     main()
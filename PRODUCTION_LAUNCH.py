@@ -4,12 +4,34 @@
 Ready-to-use trading dashboard with Harrison's original interface + enhanced features
 """
 
+from importlib.metadata import PackageNotFoundError, version
 import subprocess
 import sys
 import os
 import time
 from pathlib import Path
 
+from requirement_check import missing_requirements
+
+# pip for the interpreter running this launcher, built once and reused for every run
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input",
+               "--prefer-binary", "--timeout", "120", "--retries", "5"]
+
+# pip's own modules don't need .pyc files written on every launch
+PIP_ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+PIP_ATTEMPTS = 3  # Whole-install retries on top of pip's own per-download retries
+
+def pip_install(packages):
+    """Run pip, retrying with exponential backoff so a network blip doesn't fail the launch"""
+    for attempt in range(PIP_ATTEMPTS):
+        result = subprocess.run(PIP_INSTALL + packages, capture_output=True, text=True, env=PIP_ENV)
+        if result.returncode == 0:
+            return True
+        if attempt < PIP_ATTEMPTS - 1:
+            time.sleep(2 ** attempt)
+    return False
+
 def install_requirements():
     """Install required packages"""
     requirements = [
@@ -23,13 +45,24 @@ def install_requirements():
         "pytesseract>=0.3.8"
     ]
     
+    # Only hand pip what isn't importable yet; warm launches skip pip entirely
+    requirements = missing_requirements(requirements)
+    if not requirements:
+        print("✅ All required packages already installed")
+        return
+    
     print("🔄 Installing required packages...")
+    # One pip run resolves everything together instead of restarting pip per package
+    if pip_install(requirements):
+        for package in requirements:
+            print(f"✅ {package}")
+        return
+    
+    # Something in the batch failed; install individually so the rest still go in
     for package in requirements:
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package], 
-                                capture_output=True, text=True)
+        if pip_install([package]):
             print(f"✅ {package}")
-        except subprocess.CalledProcessError:
+        else:
             print(f"⚠️ Failed to install {package} - continuing...")
 
 def check_system():
@@ -46,9 +79,8 @@ def check_system():
     
     # Check Streamlit
     try:
-        import streamlit
-        print(f"✅ Streamlit {streamlit.__version__}")
-    except ImportError:
+        print(f"✅ Streamlit {version('streamlit')}")
+    except PackageNotFoundError:
         print("❌ Streamlit not found")
         return False
     
@@ -68,15 +100,31 @@ def check_system():
     
     return True
 
+# Console banners, printed with a single write each
+BANNER = "\n".join([
+    "=" * 60,
+    "🎯 APEX TRADING DASHBOARD - PRODUCTION LAUNCH",
+    "=" * 60,
+    "📊 Harrison's Original Interface + Enhanced Features",
+    "🥷 NinjaTrader + Tradovate Integration",
+    "⚡ Universal 6-Chart Control Panel",
+    "=" * 60
+])
+
+QUICK_START = "\n".join([
+    "\n🚀 Launching Production Dashboard...",
+    "\n📖 QUICK START GUIDE:",
+    "1. 🎯 Harrison Original - Clean, simple interface with enhanced features",
+    "2. 🥷 NinjaTrader Pro - Advanced NinjaTrader + Tradovate integration",
+    "3. 📊 Universal - Multi-platform dashboard",
+    "4. ⚙️ Settings - Configure your trading setup",
+    "\n💡 TIP: Start with 'Harrison Original' for the best experience!",
+    "=" * 60
+])
+
 def main():
     """Main launcher"""
-    print("=" * 60)
-    print("🎯 APEX TRADING DASHBOARD - PRODUCTION LAUNCH")
-    print("=" * 60)
-    print("📊 Harrison's Original Interface + Enhanced Features")
-    print("🥷 NinjaTrader + Tradovate Integration") 
-    print("⚡ Universal 6-Chart Control Panel")
-    print("=" * 60)
+    print(BANNER)
     
     # Change to script directory
     script_dir = Path(__file__).parent
@@ -92,14 +140,7 @@ def main():
         input("Press Enter to exit...")
         return
     
-    print("\n🚀 Launching Production Dashboard...")
-    print("\n📖 QUICK START GUIDE:")
-    print("1. 🎯 Harrison Original - Clean, simple interface with enhanced features")
-    print("2. 🥷 NinjaTrader Pro - Advanced NinjaTrader + Tradovate integration")
-    print("3. 📊 Universal - Multi-platform dashboard")
-    print("4. ⚙️ Settings - Configure your trading setup")
-    print("\n💡 TIP: Start with 'Harrison Original' for the best experience!")
-    print("=" * 60)
+    print(QUICK_START)
     
     try:
         # Launch Streamlit app
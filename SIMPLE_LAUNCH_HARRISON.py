@@ -6,7 +6,7 @@ Quick launch without complex package installation
 
 import subprocess
 import sys
-import os
+from importlib.util import find_spec
 from pathlib import Path
 
 def quick_check():
@@ -23,10 +23,9 @@ def quick_check():
     missing_packages = []
     
     for package, description in essential_packages.items():
-        try:
-            __import__(package)
+        if find_spec(package) is not None:
             print(f"✅ {package} - {description}")
-        except ImportError:
+        else:
             print(f"❌ {package} - {description} (MISSING)")
             missing_packages.append(package)
     
@@ -38,17 +37,40 @@ def quick_check():
     print("✅ All essential packages found!")
     return True
 
+# Resolved from this file so the launcher works from any working directory
+SCRIPT_DIR = Path(__file__).parent
+DASHBOARD_PATH = SCRIPT_DIR / "harrison_original_complete.py"
+
+DASHBOARD_COMMAND = [
+    sys.executable, "-m", "streamlit", "run", str(DASHBOARD_PATH),
+    "--server.port", "8501",
+    "--server.address", "localhost",
+    "--browser.gatherUsageStats", "false"
+]
+
+def start_dashboard():
+    """Start the dashboard without waiting on it, so a supervisor can run other services alongside"""
+    return subprocess.Popen(DASHBOARD_COMMAND, cwd=SCRIPT_DIR)
+
+# Console banners, printed with a single write each
+BANNER = "\n".join([
+    "=" * 60,
+    "🎯 HARRISON'S COMPLETE TRADING DASHBOARD",
+    "=" * 60,
+    "🚀 SIMPLE LAUNCHER - No Complex Installation",
+    ""
+])
+
+LAUNCH_NOTICE = "\n".join([
+    "\n🚀 Launching Harrison's Complete Dashboard...",
+    "📖 Open your browser to: http://localhost:8501",
+    "⏹️ Press Ctrl+C to stop",
+    "=" * 60
+])
+
 def main():
     """Simple main launcher"""
-    print("=" * 60)
-    print("🎯 HARRISON'S COMPLETE TRADING DASHBOARD")
-    print("=" * 60)
-    print("🚀 SIMPLE LAUNCHER - No Complex Installation")
-    print("")
-    
-    # Change to script directory
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
+    print(BANNER)
     
     # Quick check
     if not quick_check():
@@ -58,25 +80,18 @@ def main():
         input("\nPress Enter to continue anyway (may not work properly)...")
     
     # Check if dashboard file exists
-    if not os.path.exists("harrison_original_complete.py"):
+    if not DASHBOARD_PATH.exists():
         print("\n❌ harrison_original_complete.py not found!")
         print("🔧 Please ensure the dashboard file is in the current directory.")
         input("Press Enter to exit...")
         return
     
-    print("\n🚀 Launching Harrison's Complete Dashboard...")
-    print("📖 Open your browser to: http://localhost:8501")
-    print("⏹️ Press Ctrl+C to stop")
-    print("=" * 60)
+    print(LAUNCH_NOTICE)
     
     try:
         # Launch dashboard directly
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "harrison_original_complete.py",
-            "--server.port", "8501",
-            "--server.address", "localhost",
-            "--browser.gatherUsageStats", "false"
-        ])
+        dashboard = start_dashboard()
+        dashboard.wait()
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped by user")
     except FileNotFoundError:
@@ -88,7 +103,7 @@ def main():
         print("\n🔄 Trying alternative method...")
         try:
             # Try direct Python execution
-            subprocess.run([sys.executable, "harrison_original_complete.py"])
+            subprocess.run([sys.executable, str(DASHBOARD_PATH)], cwd=SCRIPT_DIR)
         except Exception as e2:
             print(f"❌ Alternative method also failed: {e2}")
             input("Press Enter to exit...")
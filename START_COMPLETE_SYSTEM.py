@@ -4,43 +4,155 @@
 Starts all components of the professional trading system
 """
 
+import socket
 import subprocess
 import time
+from multiprocessing.connection import wait
 import webbrowser
 import os
 import sys
 from pathlib import Path
 
+# Components run from the launcher's folder
+SCRIPT_DIR = Path(__file__).parent
+
+# Where background components write their output when they have no console of their own
+COMPONENT_LOG_DIR = SCRIPT_DIR / "logs"
+
+# Static console sections, built once and written in a single call each
+HEADER = (
+    "=" * 80 + "\n"
+    "🚀 ENIGMA-APEX PROFESSIONAL TRADING SYSTEM\n"
+    "   Complete System Launcher\n"
+    "   Version: 1.0.0 Production\n"
+    + "=" * 80 + "\n"
+    "\n"
+)
+
+SYSTEM_GUIDE = (
+    "\n"
+    "🌐 WEB INTERFACES:\n"
+    + "-" * 50 + "\n"
+    "   📊 Trading Dashboard: http://localhost:5000\n"
+    "   📈 Signal Input: http://localhost:5000\n"
+    "   📋 Signal History: http://localhost:5000/dashboard\n"
+    "\n"
+    "🥷 NINJATRADER INTEGRATION:\n"
+    + "-" * 50 + "\n"
+    "   📁 Indicators: ninjatrader/Indicators/\n"
+    "   📁 Strategies: ninjatrader/Strategies/\n"
+    "   📁 AddOns: ninjatrader/AddOns/\n"
+    "   📖 Setup Guide: ninjatrader/INSTALLATION_GUIDE.md\n"
+    "\n"
+    "📚 DOCUMENTATION:\n"
+    + "-" * 50 + "\n"
+    "   📖 User Manual: documentation/ENIGMA_APEX_USER_MANUAL.md\n"
+    "   🔧 Quick Reference: documentation/ENIGMA_APEX_QUICK_REFERENCE.md\n"
+    "   👥 Seniors Guide: documentation/ENIGMA_APEX_SENIORS_GUIDE.md\n"
+    "   ❓ FAQ: documentation/ENIGMA_APEX_FAQ.md\n"
+    "\n"
+)
+
+NEXT_STEPS = (
+    "\n"
+    "📋 NEXT STEPS:\n"
+    + "-" * 50 + "\n"
+    "   1. ✅ System is now running\n"
+    "   2. 🌐 Use web interface for manual signals\n"
+    "   3. 🥷 Install NinjaTrader components (see guide)\n"
+    "   4. 📊 Test with demo account first\n"
+    "   5. 📖 Review documentation for advanced features\n"
+    "\n"
+    "⚠️  IMPORTANT SAFETY REMINDERS:\n"
+    + "-" * 50 + "\n"
+    "   • Always test with demo accounts first\n"
+    "   • The system enforces prop firm compliance\n"
+    "   • Emergency stops are accessible via web interface\n"
+    "   • Never risk more than you can afford to lose\n"
+    "\n"
+    "🚀 ENIGMA-APEX SYSTEM IS NOW OPERATIONAL!\n"
+    + "=" * 80 + "\n"
+)
+
+def write_block(block):
+    """Write a prebuilt section in one call"""
+    sys.stdout.write(block)
+    sys.stdout.flush()
+
 def print_header():
     """Display system header"""
-    print("=" * 80)
-    print("🚀 ENIGMA-APEX PROFESSIONAL TRADING SYSTEM")
-    print("   Complete System Launcher")
-    print("   Version: 1.0.0 Production")
-    print("=" * 80)
-    print()
+    write_block(HEADER)
 
 def start_component(name, script_path, background=True):
     """Start a system component"""
     try:
         print(f"🚀 Starting {name}...")
         if background:
-            process = subprocess.Popen([
-                sys.executable, script_path
-            ], cwd=Path(__file__).parent,
-               stdout=subprocess.PIPE,
-               stderr=subprocess.PIPE,
-               creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0)
+            # Nothing reads a pipe, so a chatty child would fill it and stall;
+            # on Windows it writes to its own console, elsewhere to a log file
+            if os.name == 'nt':
+                process = subprocess.Popen([sys.executable, script_path], cwd=SCRIPT_DIR,
+                                           creationflags=subprocess.CREATE_NEW_CONSOLE)
+            else:
+                COMPONENT_LOG_DIR.mkdir(exist_ok=True)
+                log_path = COMPONENT_LOG_DIR / f"{Path(script_path).stem}.log"
+                with open(log_path, "ab") as log_file:
+                    process = subprocess.Popen([sys.executable, script_path], cwd=SCRIPT_DIR,
+                                               stdout=log_file, stderr=subprocess.STDOUT)
+                print(f"   📄 Output: {log_path.relative_to(SCRIPT_DIR)}")
             print(f"   ✅ {name} started in background")
             return process
         else:
-            subprocess.run([sys.executable, script_path], cwd=Path(__file__).parent)
+            subprocess.run([sys.executable, script_path], cwd=SCRIPT_DIR)
             print(f"   ✅ {name} completed")
             return None
     except Exception as e:
         print(f"   ❌ Failed to start {name}: {str(e)}")
         return None
 
+def exit_sentinel(process):
+    """Handle that multiprocessing.connection.wait can block on until the process exits
+    
+    None when the platform has no such handle (macOS) or the process is already gone,
+    in which case the caller falls back to polling.
+    """
+    try:
+        if os.name == 'nt':
+            # Popen exposes no public process handle on Windows
+            handle = getattr(process, '_handle', None)
+            return int(handle) if handle is not None else None
+        if hasattr(os, 'pidfd_open'):
+            return os.pidfd_open(process.pid)
+    except (OSError, TypeError, ValueError):
+        pass
+    return None
+
+def close_sentinels(sentinels):
+    """Release pidfds opened by exit_sentinel; Windows handles stay owned by their Popen"""
+    if os.name != 'nt':
+        for sentinel in sentinels:
+            os.close(sentinel)
+
+def wait_for_port(port, timeout):
+    """Poll a local port until something accepts connections; True if it did within timeout"""
+    deadline = time.monotonic() + timeout
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.settimeout(0.05)
+            if probe.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+def has_desktop():
+    """Whether a browser can be shown here: not over SSH, and on Linux only with a display"""
+    if os.environ.get("SSH_CONNECTION"):
+        return False
+    if sys.platform.startswith("linux"):
+        return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    return True
+
 def main():
     """Main launcher function"""
     print_header()
@@ -58,47 +170,33 @@ def main():
     print("📋 STARTING CORE COMPONENTS:")
     print("-" * 50)
     
-    # Start each component
+    # Start each component; they are independent processes, so launch them
+    # back to back instead of pausing between starts
     for name, script_path in components:
         if os.path.exists(script_path):
             process = start_component(name, script_path, background=True)
             if process:
                 processes.append((name, process))
-            time.sleep(2)  # Wait between starts
         else:
             print(f"   ⚠️  {name} file not found: {script_path}")
     
-    print()
-    print("🌐 WEB INTERFACES:")
-    print("-" * 50)
-    print("   📊 Trading Dashboard: http://localhost:5000")
-    print("   📈 Signal Input: http://localhost:5000")
-    print("   📋 Signal History: http://localhost:5000/dashboard")
-    print()
-    
-    print("🥷 NINJATRADER INTEGRATION:")
-    print("-" * 50)
-    print("   📁 Indicators: ninjatrader/Indicators/")
-    print("   📁 Strategies: ninjatrader/Strategies/")
-    print("   📁 AddOns: ninjatrader/AddOns/")
-    print("   📖 Setup Guide: ninjatrader/INSTALLATION_GUIDE.md")
-    print()
-    
-    print("📚 DOCUMENTATION:")
-    print("-" * 50)
-    print("   📖 User Manual: documentation/ENIGMA_APEX_USER_MANUAL.md")
-    print("   🔧 Quick Reference: documentation/ENIGMA_APEX_QUICK_REFERENCE.md")
-    print("   👥 Seniors Guide: documentation/ENIGMA_APEX_SENIORS_GUIDE.md")
-    print("   ❓ FAQ: documentation/ENIGMA_APEX_FAQ.md")
-    print()
+    write_block(SYSTEM_GUIDE)
     
     # Open web interface
     print("🌐 Opening web interface...")
-    time.sleep(3)
-    try:
-        webbrowser.open("http://localhost:5000")
+    # Headless sessions skip browser detection and the readiness wait entirely
+    opened = False
+    if has_desktop():
+        # Open as soon as the interface is listening, waiting no longer than
+        # the old fixed 3 s pause when it isn't up yet
+        wait_for_port(5000, timeout=3)
+        try:
+            opened = webbrowser.open("http://localhost:5000")
+        except webbrowser.Error:
+            opened = False
+    if opened:
         print("   ✅ Browser opened to trading interface")
-    except Exception:
+    else:
         print("   💡 Please manually open: http://localhost:5000")
     
     print()
@@ -109,36 +207,42 @@ def main():
         status = "🟢 RUNNING" if process.poll() is None else "🔴 STOPPED"
         print(f"   {status} {name}")
     
-    print()
-    print("📋 NEXT STEPS:")
-    print("-" * 50)
-    print("   1. ✅ System is now running")
-    print("   2. 🌐 Use web interface for manual signals")
-    print("   3. 🥷 Install NinjaTrader components (see guide)")
-    print("   4. 📊 Test with demo account first")
-    print("   5. 📖 Review documentation for advanced features")
-    
-    print()
-    print("⚠️  IMPORTANT SAFETY REMINDERS:")
-    print("-" * 50)
-    print("   • Always test with demo accounts first")
-    print("   • The system enforces prop firm compliance")
-    print("   • Emergency stops are accessible via web interface")
-    print("   • Never risk more than you can afford to lose")
-    
-    print()
-    print("🚀 ENIGMA-APEX SYSTEM IS NOW OPERATIONAL!")
-    print("=" * 80)
+    write_block(NEXT_STEPS)
     
     # Keep running to monitor processes
+    watched = {}
     try:
         print("\n👁️  Monitoring system... Press Ctrl+C to stop all components")
-        while True:
-            time.sleep(30)
-            running_count = sum(1 for _, proc in processes if proc.poll() is None)
-            if running_count < len(processes):
-                print(f"⚠️  Warning: {len(processes) - running_count} components stopped")
-            time.sleep(30)
+        
+        # Sleep in the kernel on the children's exit handles so a stopped
+        # component is reported the moment it exits, not on the next poll
+        for name, process in processes:
+            sentinel = exit_sentinel(process)
+            if sentinel is None:
+                # Mixing handles and polling isn't worth it; poll everything
+                close_sentinels(watched)
+                watched.clear()
+                break
+            watched[sentinel] = (name, process)
+        
+        running = list(processes)
+        while running:
+            if watched:
+                for sentinel in wait(list(watched), timeout=60):
+                    name, process = watched.pop(sentinel)
+                    close_sentinels([sentinel])
+                    process.poll()  # reap the exited child
+                    print(f"⚠️  Warning: {name} stopped")
+                running = list(watched.values())
+            else:
+                time.sleep(60)
+                for name, process in running:
+                    if process.poll() is not None:
+                        print(f"⚠️  Warning: {name} stopped")
+                running = [(name, process) for name, process in running if process.returncode is None]
+        
+        if processes:
+            print("🔴 All components have stopped")
     except KeyboardInterrupt:
         print("\n\n🛑 STOPPING ALL COMPONENTS...")
         for name, process in processes:
@@ -148,6 +252,8 @@ def main():
             except Exception:
                 print(f"   ⚠️  Could not stop {name}")
         print("🏁 System shutdown complete")
+    finally:
+        close_sentinels(watched)
 
 if __name__ == "__main__":
     main()
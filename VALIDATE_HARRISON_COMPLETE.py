@@ -147,21 +147,24 @@ def test_file_structure():
         'streamlit_trading_dashboard.py'
     ]
     
+    # getsize doubles as the existence check, so each file costs one stat
     missing_required = []
     for file in required_files:
-        if os.path.exists(file):
+        try:
             size = os.path.getsize(file)
-            print(f"✅ {file} ({size:,} bytes)")
-        else:
+        except OSError:
             missing_required.append(file)
             print(f"❌ {file}: MISSING")
+            continue
+        print(f"✅ {file} ({size:,} bytes)")
     
     for file in optional_files:
-        if os.path.exists(file):
+        try:
             size = os.path.getsize(file)
-            print(f"✅ {file} ({size:,} bytes)")
-        else:
+        except OSError:
             print(f"⚠️ {file}: Optional file missing")
+            continue
+        print(f"✅ {file} ({size:,} bytes)")
     
     return len(missing_required) == 0
 
@@ -5,10 +5,74 @@ Professional Client Package Integrity Check
 
 import os
 import sys
+import io
 import importlib.util
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+class _ThreadRoutedStdout:
+    """Send print() from a check's worker thread into that check's buffer
+    
+    Checks run concurrently but each prints a multi-line block; buffering
+    per thread and replaying in order keeps the report readable.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+# What the validator checks for; built once at import rather than per run
+REQUIRED_PACKAGES = (
+    'websockets', 'asyncio', 'sqlite3', 'tkinter', 
+    'PIL', 'requests', 'json', 'threading', 'time'
+)
+
+CORE_FILES = (
+    'system/ENIGMA_APEX_COMPLETE_SYSTEM.py',
+    'system/apex_compliance_guardian.py',
+    'system/advanced_risk_manager.py',
+    'system/chatgpt_agent_integration.py',
+    'system/ocr_enigma_reader.py',
+    'system/enhanced_websocket_server.py',
+    'system/manual_signal_interface.py'
+)
+
+DOCUMENTATION_FILES = (
+    'documentation/ENIGMA_APEX_USER_MANUAL.md',
+    'documentation/ENIGMA_APEX_QUICK_REFERENCE.md',
+    'documentation/ENIGMA_APEX_VISUAL_SETUP_GUIDE.md',
+    'documentation/ENIGMA_APEX_SENIORS_GUIDE.md',
+    'documentation/ENIGMA_APEX_FAQ.md'
+)
+
+NINJATRADER_FILES = (
+    'ninjatrader/Indicators/EnigmaApexPowerScore.cs',
+    'ninjatrader/Strategies/EnigmaApexAutoTrader.cs',
+    'ninjatrader/AddOns/EnigmaApexRiskManager.cs'
+)
+
+# Core files grouped by folder, so each folder is listed once
+CORE_FILES_BY_DIRECTORY = {}
+for _file_path in CORE_FILES:
+    _directory, _name = os.path.split(_file_path)
+    CORE_FILES_BY_DIRECTORY.setdefault(_directory, []).append((_file_path, _name))
+
+def directory_names(path):
+    """Entry names in a directory from a single scandir; empty if it doesn't exist"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 class SystemValidator:
     def __init__(self):
         self.validation_results = {
@@ -22,24 +86,17 @@ class SystemValidator:
         
     def validate_python_dependencies(self):
         """Check all required Python packages"""
-        required_packages = [
-            'websockets', 'asyncio', 'sqlite3', 'tkinter', 
-            'PIL', 'requests', 'json', 'threading', 'time'
-        ]
-        
         print("🔍 Validating Python Dependencies...")
         missing_packages = []
         
-        for package in required_packages:
-            try:
-                if package == 'PIL':
-                    import PIL
-                elif package == 'tkinter':
-                    import tkinter
-                else:
-                    __import__(package)
+        # Probe side by side, then print from this thread to keep the output in order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            specs = dict(zip(REQUIRED_PACKAGES, executor.map(importlib.util.find_spec, REQUIRED_PACKAGES)))
+        
+        for package in REQUIRED_PACKAGES:
+            if specs[package] is not None:
                 print(f"  ✅ {package} - OK")
-            except ImportError:
+            else:
                 print(f"  ❌ {package} - MISSING")
                 missing_packages.append(package)
                 
@@ -55,23 +112,16 @@ class SystemValidator:
         """Check all essential system files exist"""
         print("\n🔍 Validating Core Components...")
         
-        required_files = [
-            'system/ENIGMA_APEX_COMPLETE_SYSTEM.py',
-            'system/apex_compliance_guardian.py',
-            'system/advanced_risk_manager.py',
-            'system/chatgpt_agent_integration.py',
-            'system/ocr_enigma_reader.py',
-            'system/enhanced_websocket_server.py',
-            'system/manual_signal_interface.py'
-        ]
-        
+        # One listing per directory instead of a stat per file
         missing_files = []
-        for file_path in required_files:
-            if os.path.exists(file_path):
-                print(f"  ✅ {file_path} - Found")
-            else:
-                print(f"  ❌ {file_path} - Missing")
-                missing_files.append(file_path)
+        for directory, files in CORE_FILES_BY_DIRECTORY.items():
+            names = directory_names(directory or '.')
+            for file_path, name in files:
+                if name in names:
+                    print(f"  ✅ {file_path} - Found")
+                else:
+                    print(f"  ❌ {file_path} - Missing")
+                    missing_files.append(file_path)
         
         if missing_files:
             print(f"\n⚠️  Missing files: {len(missing_files)}")
@@ -84,21 +134,14 @@ class SystemValidator:
         """Check documentation completeness"""
         print("\n🔍 Validating Documentation...")
         
-        docs = [
-            'documentation/ENIGMA_APEX_USER_MANUAL.md',
-            'documentation/ENIGMA_APEX_QUICK_REFERENCE.md',
-            'documentation/ENIGMA_APEX_VISUAL_SETUP_GUIDE.md',
-            'documentation/ENIGMA_APEX_SENIORS_GUIDE.md',
-            'documentation/ENIGMA_APEX_FAQ.md'
-        ]
-        
-        for doc in docs:
-            if os.path.exists(doc):
+        for doc in DOCUMENTATION_FILES:
+            # getsize doubles as the existence check: one stat per document
+            try:
                 file_size = os.path.getsize(doc)
-                print(f"  ✅ {doc} - {file_size:,} bytes")
-            else:
+            except OSError:
                 print(f"  ❌ {doc} - Missing")
                 return False
+            print(f"  ✅ {doc} - {file_size:,} bytes")
                 
         print("✅ Complete documentation suite present")
         return True
@@ -107,13 +150,7 @@ class SystemValidator:
         """Check NinjaTrader components"""
         print("\n🔍 Validating NinjaTrader Integration...")
         
-        nt_files = [
-            'ninjatrader/Indicators/EnigmaApexPowerScore.cs',
-            'ninjatrader/Strategies/EnigmaApexAutoTrader.cs',
-            'ninjatrader/AddOns/EnigmaApexRiskManager.cs'
-        ]
-        
-        for nt_file in nt_files:
+        for nt_file in NINJATRADER_FILES:
             if os.path.exists(nt_file):
                 print(f"  ✅ {nt_file} - Ready for NT8")
             else:
@@ -127,29 +164,21 @@ class SystemValidator:
         """Test basic system functionality"""
         print("\n🔍 Testing System Connectivity...")
         
-        try:
-            # Test WebSocket server initialization
-            import websockets
-            print("  ✅ WebSocket server capability - OK")
-            
-            # Test database functionality
-            import sqlite3
-            print("  ✅ Database connectivity - OK")
-            
-            # Test GUI capabilities
-            import tkinter
-            print("  ✅ GUI framework - OK")
-            
-            # Test OCR capabilities
-            from PIL import Image
-            print("  ✅ OCR processing - OK")
-            
-            print("✅ All system connectivity tests passed")
-            return True
-            
-        except Exception as e:
-            print(f"  ❌ System connectivity error: {e}")
-            return False
+        capabilities = [
+            ('websockets', 'WebSocket server capability'),
+            ('sqlite3', 'Database connectivity'),
+            ('tkinter', 'GUI framework'),
+            ('PIL', 'OCR processing')
+        ]
+        
+        for module, capability in capabilities:
+            if importlib.util.find_spec(module) is None:
+                print(f"  ❌ System connectivity error: No module named '{module}'")
+                return False
+            print(f"  ✅ {capability} - OK")
+        
+        print("✅ All system connectivity tests passed")
+        return True
     
     def run_complete_validation(self):
         """Run all validation checks"""
@@ -169,8 +198,27 @@ class SystemValidator:
         passed_checks = 0
         total_checks = len(checks)
         
-        for check_name, check_function in checks:
-            if check_function():
+        # The checks are independent stat/import probes, so run them together
+        # and print each one's output in the original order
+        routed_stdout = _ThreadRoutedStdout(sys.stdout)
+        
+        def run_check(check_function):
+            routed_stdout.local.buffer = io.StringIO()
+            try:
+                return check_function(), routed_stdout.local.buffer.getvalue()
+            finally:
+                routed_stdout.local.buffer = None
+        
+        sys.stdout = routed_stdout
+        try:
+            with ThreadPoolExecutor(max_workers=total_checks) as pool:
+                outcomes = list(pool.map(run_check, [check_function for _, check_function in checks]))
+        finally:
+            sys.stdout = routed_stdout.stream
+        
+        for passed, output in outcomes:
+            sys.stdout.write(output)
+            if passed:
                 passed_checks += 1
         
         success_rate = (passed_checks / total_checks) * 100
@@ -6,11 +6,25 @@ Run this to verify all features work as promised
 
 import sys
 import os
-import importlib
+import io
+import importlib.util
 import inspect
+from contextlib import redirect_stdout
 from datetime import datetime
 import json
 
+# Passing test lines are for someone watching the console; piped and CI runs
+# only list failures and can read the rest from the JSON report
+VERBOSE_OUTPUT = sys.stdout.isatty() or bool(os.environ.get("VALIDATOR_VERBOSE"))
+
+# Overall verdict lines by minimum success rate, highest first
+SYSTEM_STATUS_LINES = [
+    (90, "🏆 SYSTEM STATUS: EXCELLENT - Production Ready\n✅ All critical functionalities are working perfectly"),
+    (80, "✅ SYSTEM STATUS: GOOD - Ready for Use\n⚠️ Minor issues present but system is functional"),
+    (70, "⚠️ SYSTEM STATUS: FUNCTIONAL - Some Issues\n🔧 Some components need attention"),
+    (0, "❌ SYSTEM STATUS: NEEDS WORK\n🔧 Multiple components require fixing")
+]
+
 class FunctionalityValidator:
     """Comprehensive validator for all ENIGMA APEX Professional features"""
     
@@ -19,6 +33,11 @@ class FunctionalityValidator:
         self.critical_failures = []
         self.feature_status = {}
         
+        # Put the working directory on the import path once, not per check
+        cwd = os.getcwd()
+        if cwd not in sys.path:
+            sys.path.insert(0, cwd)
+        
     def print_header(self):
         """Print validation header"""
         print("=" * 80)
@@ -39,7 +58,6 @@ class FunctionalityValidator:
         # Test 1: OCR class imports
         try:
             # Import main OCR class
-            sys.path.insert(0, os.getcwd())
             spec = importlib.util.spec_from_file_location("harrison_complete", "harrison_original_complete.py")
             harrison_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(harrison_module)
@@ -83,12 +101,11 @@ class FunctionalityValidator:
             ocr_tests["streamlit_ocr"] = False
         
         # Test 3: OCR dependencies
-        try:
-            # Check if PIL/Pillow is available for image processing
-            from PIL import Image
+        # Check if PIL/Pillow is available for image processing
+        if importlib.util.find_spec("PIL") is not None:
             print("   ✅ PIL/Pillow (image processing) - Available")
             ocr_tests["ocr_dependencies"] = True
-        except ImportError:
+        else:
             print("   ⚠️  PIL/Pillow not available - OCR will use fallbacks")
             ocr_tests["ocr_dependencies"] = False
         
@@ -103,7 +120,6 @@ class FunctionalityValidator:
         
         try:
             # Import and test Kelly classes
-            sys.path.insert(0, os.getcwd())
             spec = importlib.util.spec_from_file_location("harrison_complete", "harrison_original_complete.py")
             harrison_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(harrison_module)
@@ -291,7 +307,6 @@ class FunctionalityValidator:
         
         try:
             # Import main system to check risk management
-            sys.path.insert(0, os.getcwd())
             spec = importlib.util.spec_from_file_location("harrison_complete", "harrison_original_complete.py")
             harrison_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(harrison_module)
@@ -352,7 +367,6 @@ class FunctionalityValidator:
         
         # Test main application structure
         try:
-            sys.path.insert(0, os.getcwd())
             spec = importlib.util.spec_from_file_location("harrison_complete", "harrison_original_complete.py")
             harrison_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(harrison_module)
@@ -439,9 +453,8 @@ class FunctionalityValidator:
     
     def generate_comprehensive_report(self):
         """Generate comprehensive validation report"""
-        print("\n" + "=" * 80)
-        print("📋 COMPREHENSIVE FUNCTIONALITY VALIDATION REPORT")
-        print("=" * 80)
+        # The console report is assembled here and written in one go
+        lines = ["", "=" * 80, "📋 COMPREHENSIVE FUNCTIONALITY VALIDATION REPORT", "=" * 80]
         
         total_features = len(self.feature_status)
         working_features = 0
@@ -452,38 +465,30 @@ class FunctionalityValidator:
                 working_features += 1
             
             status = "✅ FULLY FUNCTIONAL" if feature_working else "⚠️ NEEDS ATTENTION"
-            print(f"\n🔸 {feature_name}: {status}")
+            lines.append(f"\n🔸 {feature_name}: {status}")
             
             # Show detailed test results
             for test_name, result in tests.items():
+                if result and not VERBOSE_OUTPUT:
+                    continue
                 test_status = "✅" if result else "❌"
-                print(f"   {test_status} {test_name}")
+                lines.append(f"   {test_status} {test_name}")
         
         # Overall system status
         success_rate = (working_features / total_features) * 100 if total_features > 0 else 0
         
-        print(f"\n" + "=" * 80)
-        print("🎯 OVERALL SYSTEM STATUS")
-        print("=" * 80)
-        print(f"Features Tested: {total_features}")
-        print(f"Fully Functional: {working_features}")
-        print(f"Success Rate: {success_rate:.1f}%")
-        
-        if success_rate >= 90:
-            print("🏆 SYSTEM STATUS: EXCELLENT - Production Ready")
-            print("✅ All critical functionalities are working perfectly")
-        elif success_rate >= 80:
-            print("✅ SYSTEM STATUS: GOOD - Ready for Use")
-            print("⚠️ Minor issues present but system is functional")
-        elif success_rate >= 70:
-            print("⚠️ SYSTEM STATUS: FUNCTIONAL - Some Issues")
-            print("🔧 Some components need attention")
-        else:
-            print("❌ SYSTEM STATUS: NEEDS WORK")
-            print("🔧 Multiple components require fixing")
-        
-        # Functionality guarantees
-        print(f"\n🛡️ FUNCTIONALITY GUARANTEES:")
+        lines += [
+            "",
+            "=" * 80,
+            "🎯 OVERALL SYSTEM STATUS",
+            "=" * 80,
+            f"Features Tested: {total_features}",
+            f"Fully Functional: {working_features}",
+            f"Success Rate: {success_rate:.1f}%",
+            next(text for minimum, text in SYSTEM_STATUS_LINES if success_rate >= minimum),
+            # Functionality guarantees
+            "\n🛡️ FUNCTIONALITY GUARANTEES:"
+        ]
         
         guarantees = [
             ("OCR Signal Detection", "OCR_SYSTEM" in self.feature_status and all(self.feature_status["OCR_SYSTEM"].values())),
@@ -496,7 +501,9 @@ class FunctionalityValidator:
         
         for guarantee_name, is_working in guarantees:
             status = "✅ GUARANTEED" if is_working else "⚠️ PARTIAL"
-            print(f"   {status} {guarantee_name}")
+            lines.append(f"   {status} {guarantee_name}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Save detailed report
         report_data = {
@@ -509,8 +516,11 @@ class FunctionalityValidator:
         }
         
         try:
-            with open("functionality_validation_report.json", "w") as f:
-                json.dump(report_data, f, indent=2)
+            # Write beside the report and swap it in, so an interrupted run
+            # never leaves a truncated report behind
+            with open("functionality_validation_report.json.tmp", "w") as f:
+                f.write(json.dumps(report_data, indent=2))
+            os.replace("functionality_validation_report.json.tmp", "functionality_validation_report.json")
             print(f"\n📄 Detailed report saved to: functionality_validation_report.json")
         except Exception as e:
             print(f"\n⚠️ Could not save report: {e}")
@@ -533,12 +543,17 @@ class FunctionalityValidator:
         ]
         
         for validation_name, validation_function in validations:
-            try:
-                result = validation_function()
-                self.validation_results[validation_name] = result
-            except Exception as e:
-                print(f"❌ {validation_name} validation crashed: {e}")
-                self.validation_results[validation_name] = False
+            # Collect the check's lines and write them in one go rather than
+            # a console write per print
+            output = io.StringIO()
+            with redirect_stdout(output):
+                try:
+                    result = validation_function()
+                except Exception as e:
+                    print(f"❌ {validation_name} validation crashed: {e}")
+                    result = False
+            sys.stdout.write(output.getvalue())
+            self.validation_results[validation_name] = result
         
         # Generate comprehensive report
         return self.generate_comprehensive_report()
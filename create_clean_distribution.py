@@ -9,6 +9,8 @@ import shutil
 import zipfile
 from pathlib import Path
 
+DISTRIBUTION_TEMPLATES = Path(__file__).parent / "templates" / "distribution"
+
 def create_clean_distribution():
     """Create a clean distribution ZIP with only essential files"""
     
@@ -22,6 +24,7 @@ def create_clean_distribution():
         "LAUNCH_TRAINING_WHEELS_DESKTOP.py",
         "launch_streamlit_dashboard.py",
         "launch_streamlit.py",
+        "requirement_check.py",
         
         # Configuration and setup
         "requirements.txt",
@@ -117,54 +120,9 @@ def create_clean_distribution():
                           ignore=shutil.ignore_patterns(*exclude_patterns))
             print(f"✅ Copied directory: {dir_name}")
     
-    # Create a simple launcher script
-    launcher_content = '''@echo off
-echo Starting ENIGMA APEX Professional Desktop Version...
-echo.
-echo Installing required packages...
-pip install -r requirements.txt
-echo.
-echo Launching Trading Dashboard...
-python -m streamlit run streamlit_app_desktop.py --server.port=8501
-pause
-'''
-    
-    with open(dist_dir / "START_DESKTOP_VERSION.bat", "w") as f:
-        f.write(launcher_content)
-    
-    # Create README for distribution
-    readme_content = '''# ENIGMA APEX Professional Desktop Version
-
-## Quick Start
-1. Extract this ZIP file to a folder
-2. Double-click `START_DESKTOP_VERSION.bat`
-3. Wait for the browser to open automatically
-4. Configure your NinjaTrader/Tradovate connections
-
-## What's Included
-- Full desktop version with all features
-- Real desktop notifications and alerts
-- NinjaTrader socket and ATM connections
-- Tradovate REST API and WebSocket support
-- OCR screen capture capabilities
-- Audio alert system
-- No cloud limitations
-
-## Requirements
-- Windows 10/11
-- Python 3.8+ (will be installed if missing)
-- Internet connection for initial setup
-
-## Support
-- Full setup guide: SETUP_GUIDE.md
-- Harrison system: HARRISON_SETUP_GUIDE.md
-- Issues: GitHub repository
-
-Enjoy professional-grade prop firm trading!
-'''
-    
-    with open(dist_dir / "README_DESKTOP.md", "w") as f:
-        f.write(readme_content)
+    # Add the launcher and README, kept as files under templates/distribution/
+    for template in ("START_DESKTOP_VERSION.bat", "README_DESKTOP.md"):
+        shutil.copyfile(DISTRIBUTION_TEMPLATES / template, dist_dir / template)
     
     # Create the clean ZIP file
     zip_filename = "ENIGMA_APEX_DESKTOP_CLEAN.zip"
@@ -6,7 +6,7 @@ Run this before using the trading system for the first time
 
 import sys
 import os
-import importlib
+import importlib.util
 import subprocess
 import time
 from datetime import datetime
@@ -60,10 +60,9 @@ class SystemTester:
         missing_packages = []
         
         for package_name, import_name in required_packages.items():
-            try:
-                importlib.import_module(import_name)
+            if importlib.util.find_spec(import_name) is not None:
                 print(f"   ✅ {package_name} - Available")
-            except ImportError:
+            else:
                 print(f"   ❌ {package_name} - Missing")
                 missing_packages.append(package_name)
         
@@ -415,8 +414,9 @@ def main():
     # Save report to file
     try:
         import json
-        with open("system_test_report.json", "w") as f:
-            json.dump(report, f, indent=2)
+        with open("system_test_report.json.tmp", "w") as f:
+            f.write(json.dumps(report, indent=2))
+        os.replace("system_test_report.json.tmp", "system_test_report.json")
         print(f"\n📄 Detailed report saved to: system_test_report.json")
     except Exception as e:
         print(f"\n⚠️  Could not save report: {e}")
@@ -23,6 +23,8 @@ import subprocess
 import urllib.request
 import urllib.error
 import logging
+import re
+from string import Template
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Any
@@ -61,6 +63,25 @@ try:
 except ImportError:
     WINDOWS_API_AVAILABLE = False
 
+# Numeric values in NinjaTrader adapter responses; checked up front because
+# most fields in a response are text and raising ValueError for each is slow
+NUMERIC_FIELD = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)")
+
+# NinjaScript exporter offered for download on the NinjaTrader setup page
+NINJASCRIPT_EXPORTER_TEMPLATE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "templates", "EnigmaApexDataExporter.cs"
+)
+
+@st.cache_resource(show_spinner=False)
+def load_ninjascript_exporter() -> Template:
+    """Read the exporter source once per server; a module global would be reset by every rerun"""
+    with open(NINJASCRIPT_EXPORTER_TEMPLATE, encoding="utf-8") as f:
+        return Template(f.read())
+
+def ninjascript_exporter_source(export_path: str) -> str:
+    """Fill the export path into the NinjaScript data exporter source"""
+    return load_ninjascript_exporter().substitute(export_path=export_path)
+
 @dataclass
 class EnigmaSignal:
     """Enigma signal data structure for ERM calculation"""
@@ -94,6 +115,66 @@ class PropFirmConfig:
     profit_target: float
     risk_rules: Dict[str, Any] = field(default_factory=dict)
 
+# Prop firm challenge rules; static, so built once per script run and shared
+# by the session state and every limits lookup
+PROP_FIRM_CONFIGS: Dict[str, PropFirmConfig] = {
+    "FTMO": PropFirmConfig(
+        firm_name="FTMO",
+        max_daily_loss=5000.0,
+        max_position_size=10.0,
+        max_drawdown=10000.0,
+        leverage=100,
+        allowed_instruments=["ES", "NQ", "YM", "RTY", "CL", "GC", "EURUSD", "GBPUSD"],
+        risk_rules={"max_lot_size": 10, "news_trading": False},
+        evaluation_period=30,
+        profit_target=10000.0
+    ),
+    "MyForexFunds": PropFirmConfig(
+        firm_name="MyForexFunds",
+        max_daily_loss=4000.0,
+        max_position_size=8.0,
+        max_drawdown=8000.0,
+        leverage=100,
+        allowed_instruments=["ES", "NQ", "EURUSD", "GBPUSD", "USDJPY"],
+        risk_rules={"max_lot_size": 8, "weekend_trading": False},
+        evaluation_period=45,
+        profit_target=8000.0
+    ),
+    "The5ers": PropFirmConfig(
+        firm_name="The5ers",
+        max_daily_loss=3000.0,
+        max_position_size=6.0,
+        max_drawdown=6000.0,
+        leverage=50,
+        allowed_instruments=["ES", "NQ", "YM", "EURUSD", "GBPUSD"],
+        risk_rules={"max_lot_size": 6, "scalping_allowed": True},
+        evaluation_period=60,
+        profit_target=6000.0
+    ),
+    "TopStep": PropFirmConfig(
+        firm_name="TopStep",
+        max_daily_loss=2500.0,
+        max_position_size=5.0,
+        max_drawdown=5000.0,
+        leverage=25,
+        allowed_instruments=["ES", "NQ", "YM", "RTY", "CL"],
+        risk_rules={"max_contracts": 5, "overnight_margin": 2.0},
+        evaluation_period=90,
+        profit_target=5000.0
+    ),
+    "Custom": PropFirmConfig(
+        firm_name="Custom",
+        max_daily_loss=2000.0,
+        max_position_size=5.0,
+        max_drawdown=4000.0,
+        leverage=50,
+        allowed_instruments=["ES", "NQ", "YM", "RTY", "CL", "GC"],
+        risk_rules={},
+        evaluation_period=30,
+        profit_target=4000.0
+    )
+}
+
 @dataclass
 class TradovateAccount:
     """Individual Tradovate account (Harrison's chart equivalent)"""
@@ -729,10 +810,10 @@ class NinjaTraderConnector:
                     continue
                 key, _, raw_val = pair.partition('=')
                 key = key.strip().lower().replace(' ', '_')
-                try:
-                    account_info[key] = float(raw_val.strip())
-                except ValueError:
-                    pass  # skip non-numeric fields
+                raw_val = raw_val.strip()
+                if NUMERIC_FIELD.fullmatch(raw_val):
+                    account_info[key] = float(raw_val)
+                # skip non-numeric fields
             self.account_data = account_info
             return account_info
         except Exception as e:
@@ -765,10 +846,8 @@ class NinjaTraderConnector:
                 if symbol:
                     positions[symbol] = {}
                     for k, v in parts.items():
-                        try:
+                        if NUMERIC_FIELD.fullmatch(v):
                             positions[symbol][k] = float(v)
-                        except ValueError:
-                            pass
             self.position_data = positions
             return positions
         except Exception as e:
@@ -1559,63 +1638,7 @@ class TrainingWheelsDashboard:
     
     def create_prop_firm_configs(self) -> Dict[str, PropFirmConfig]:
         """Create prop firm configurations for different firms"""
-        return {
-            "FTMO": PropFirmConfig(
-                firm_name="FTMO",
-                max_daily_loss=5000.0,
-                max_position_size=10.0,
-                max_drawdown=10000.0,
-                leverage=100,
-                allowed_instruments=["ES", "NQ", "YM", "RTY", "CL", "GC", "EURUSD", "GBPUSD"],
-                risk_rules={"max_lot_size": 10, "news_trading": False},
-                evaluation_period=30,
-                profit_target=10000.0
-            ),
-            "MyForexFunds": PropFirmConfig(
-                firm_name="MyForexFunds",
-                max_daily_loss=4000.0,
-                max_position_size=8.0,
-                max_drawdown=8000.0,
-                leverage=100,
-                allowed_instruments=["ES", "NQ", "EURUSD", "GBPUSD", "USDJPY"],
-                risk_rules={"max_lot_size": 8, "weekend_trading": False},
-                evaluation_period=45,
-                profit_target=8000.0
-            ),
-            "The5ers": PropFirmConfig(
-                firm_name="The5ers",
-                max_daily_loss=3000.0,
-                max_position_size=6.0,
-                max_drawdown=6000.0,
-                leverage=50,
-                allowed_instruments=["ES", "NQ", "YM", "EURUSD", "GBPUSD"],
-                risk_rules={"max_lot_size": 6, "scalping_allowed": True},
-                evaluation_period=60,
-                profit_target=6000.0
-            ),
-            "TopStep": PropFirmConfig(
-                firm_name="TopStep",
-                max_daily_loss=2500.0,
-                max_position_size=5.0,
-                max_drawdown=5000.0,
-                leverage=25,
-                allowed_instruments=["ES", "NQ", "YM", "RTY", "CL"],
-                risk_rules={"max_contracts": 5, "overnight_margin": 2.0},
-                evaluation_period=90,
-                profit_target=5000.0
-            ),
-            "Custom": PropFirmConfig(
-                firm_name="Custom",
-                max_daily_loss=2000.0,
-                max_position_size=5.0,
-                max_drawdown=4000.0,
-                leverage=50,
-                allowed_instruments=["ES", "NQ", "YM", "RTY", "CL", "GC"],
-                risk_rules={},
-                evaluation_period=30,
-                profit_target=4000.0
-            )
-        }
+        return PROP_FIRM_CONFIGS
     
     def create_default_charts(self) -> Dict[int, TradovateAccount]:
         """Create Harrison's default 6-chart configuration with real account data"""
@@ -1926,8 +1949,7 @@ class TrainingWheelsDashboard:
     
     def get_prop_firm_limits(self, firm_name: str) -> Dict[str, float]:
         """Get prop firm specific limits and rules"""
-        prop_firms = self.create_prop_firm_configs()
-        firm_config = prop_firms.get(firm_name, prop_firms['FTMO'])
+        firm_config = PROP_FIRM_CONFIGS.get(firm_name, PROP_FIRM_CONFIGS['FTMO'])
         
         return {
             'max_daily_loss': firm_config.max_daily_loss,
@@ -2699,58 +2721,7 @@ class TrainingWheelsDashboard:
                 help="Where NinjaScript will write data files"
             )
             
-            ninja_script_template = f'''// EnigmaApexDataExporter.cs
-// Auto-generated by ENIGMA APEX — place in:
-//   Documents\\NinjaTrader 8\\bin\\Custom\\Indicators\\
-// Then compile via NinjaScript Editor and add to your chart.
-
-using System;
-using System.IO;
-using NinjaTrader.Cbi;
-using NinjaTrader.NinjaScript;
-using Newtonsoft.Json;
-
-namespace NinjaTrader.NinjaScript.Indicators
-{{
-    public class EnigmaApexDataExporter : Indicator
-    {{
-        private string exportPath = @"{export_path}";
-
-        protected override void OnStateChange()
-        {{
-            if (State == State.SetDefaults)
-            {{
-                Name = "EnigmaApexDataExporter";
-                Description = "Exports OHLCV + account data for ENIGMA APEX";
-                Calculate = Calculate.OnBarClose;
-                IsOverlay = true;
-            }}
-        }}
-
-        protected override void OnBarUpdate()
-        {{
-            if (CurrentBar < 1) return;
-            var payload = new {{
-                symbol    = Instrument.FullName,
-                timestamp = Time[0].ToString("o"),
-                open      = Open[0],
-                high      = High[0],
-                low       = Low[0],
-                close     = Close[0],
-                volume    = Volume[0],
-                account   = new {{
-                    buying_power      = Account.Get(AccountItem.BuyingPower, Currency.UsDollar),
-                    cash_value        = Account.Get(AccountItem.CashValue, Currency.UsDollar),
-                    net_liquidation   = Account.Get(AccountItem.NetLiquidation, Currency.UsDollar),
-                    realized_pnl      = Account.Get(AccountItem.RealizedProfitLoss, Currency.UsDollar),
-                    unrealized_pnl    = Account.Get(AccountItem.UnrealizedProfitLoss, Currency.UsDollar)
-                }}
-            }};
-            File.WriteAllText(exportPath, JsonConvert.SerializeObject(payload, Formatting.Indented));
-        }}
-    }}
-}}
-'''
+            ninja_script_template = ninjascript_exporter_source(export_path)
             st.download_button(
                 label="📥 Download NinjaScript File",
                 data=ninja_script_template,
@@ -9,15 +9,14 @@ import sys
 import os
 import webbrowser
 import time
+from importlib.util import find_spec
 from pathlib import Path
 
+from requirement_check import is_installed
+
 def check_streamlit_installed():
     """Check if Streamlit is installed"""
-    try:
-        import streamlit
-        return True
-    except ImportError:
-        return False
+    return find_spec("streamlit") is not None
 
 def install_streamlit():
     """Install Streamlit if not available"""
@@ -44,10 +43,9 @@ def check_dependencies():
     missing_deps = []
     
     for dep in dependencies:
-        try:
-            __import__(dep.replace('-', '_'))
+        if is_installed(dep):
             print(f"✅ {dep}")
-        except ImportError:
+        else:
             missing_deps.append(dep)
             print(f"❌ {dep} - Missing")
     
@@ -63,6 +61,40 @@ def check_dependencies():
     
     return True
 
+# Console banners, printed with a single write each
+LAUNCHED_BANNER = "\n".join([
+    "\n" + "=" * 60,
+    "🎯 UNIVERSAL TRADING DASHBOARD LAUNCHED!",
+    "=" * 60,
+    "📊 Dashboard URL: http://localhost:8501",
+    "🔧 To stop: Press Ctrl+C in this terminal",
+    "🌐 Browser should open automatically",
+    "⚙️ If browser doesn't open, visit the URL above",
+    "=" * 60
+])
+
+BANNER = "\n".join([
+    "\n" + "=" * 70,
+    "🎯 UNIVERSAL MULTI-CHART TRADING DASHBOARD",
+    "=" * 70,
+    "📊 Features:",
+    "   🔴🟢🟡 Visual Chart Status (Red/Green/Yellow)",
+    "   👁️  OCR Integration (AlgoBox, TradingView, etc.)",
+    "   ⚖️  Apex Trader Funding Compliance",
+    "   📈 Real-time Performance Analytics",
+    "   💰 Overall Margin Indicator",
+    "   🚨 Emergency Stop Protection",
+    "   ⚙️  Fully Configurable for Any Trader",
+    "=" * 70,
+    "🌟 UNIVERSAL SYSTEM:",
+    "   ✅ Works for ANY trader (not hardcoded)",
+    "   ✅ Configurable account names & settings",
+    "   ✅ Multiple prop firm support",
+    "   ✅ Web-based interface (Streamlit)",
+    "   ✅ Cross-platform compatibility",
+    "=" * 70
+])
+
 def launch_streamlit_app():
     """Launch the Streamlit application"""
     app_path = Path(__file__).parent / "universal_trading_app.py"
@@ -96,14 +128,7 @@ def launch_streamlit_app():
         print("🌐 Opening dashboard in browser...")
         webbrowser.open("http://localhost:8501")
         
-        print("\n" + "="*60)
-        print("🎯 UNIVERSAL TRADING DASHBOARD LAUNCHED!")
-        print("="*60)
-        print("📊 Dashboard URL: http://localhost:8501")
-        print("🔧 To stop: Press Ctrl+C in this terminal")
-        print("🌐 Browser should open automatically")
-        print("⚙️ If browser doesn't open, visit the URL above")
-        print("="*60)
+        print(LAUNCHED_BANNER)
         
         # Wait for process
         try:
@@ -122,25 +147,7 @@ def launch_streamlit_app():
 
 def print_banner():
     """Print startup banner"""
-    print("\n" + "="*70)
-    print("🎯 UNIVERSAL MULTI-CHART TRADING DASHBOARD")
-    print("="*70)
-    print("📊 Features:")
-    print("   🔴🟢🟡 Visual Chart Status (Red/Green/Yellow)")
-    print("   👁️  OCR Integration (AlgoBox, TradingView, etc.)")
-    print("   ⚖️  Apex Trader Funding Compliance")
-    print("   📈 Real-time Performance Analytics")
-    print("   💰 Overall Margin Indicator")
-    print("   🚨 Emergency Stop Protection")
-    print("   ⚙️  Fully Configurable for Any Trader")
-    print("="*70)
-    print("🌟 UNIVERSAL SYSTEM:")
-    print("   ✅ Works for ANY trader (not hardcoded)")
-    print("   ✅ Configurable account names & settings")
-    print("   ✅ Multiple prop firm support")
-    print("   ✅ Web-based interface (Streamlit)")
-    print("   ✅ Cross-platform compatibility")
-    print("="*70)
+    print(BANNER)
 
 def main():
     """Main launcher function"""
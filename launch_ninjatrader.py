@@ -3,17 +3,14 @@
 Quick launcher for the enhanced NinjaTrader + Tradovate dashboard
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
 def check_streamlit():
     """Check if Streamlit is installed"""
-    try:
-        import streamlit
-        return True
-    except ImportError:
-        return False
+    return importlib.util.find_spec("streamlit") is not None
 
 def install_requirements():
     """Install required packages"""
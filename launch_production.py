@@ -8,9 +8,13 @@ Includes Harrison's enhanced dashboard and NinjaTrader integration
 import os
 import sys
 import subprocess
-import pkg_resources
 from pathlib import Path
 
+from requirement_check import is_installed
+
+# Launcher location, resolved once for every path built below
+SCRIPT_DIR = Path(__file__).parent.absolute()
+
 # Required packages for production
 REQUIRED_PACKAGES = [
     'streamlit>=1.48.0',
@@ -26,6 +30,35 @@ REQUIRED_PACKAGES = [
     'watchdog>=3.0.0',
 ]
 
+PIP_INSTALL = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', '--no-input', '--prefer-binary']
+
+# Values shared by the written config.toml and the launch command line
+STREAMLIT_SETTINGS = {
+    'port': 8501,
+    'headless': 'false',
+    'gather_usage_stats': 'false',
+}
+
+STREAMLIT_CONFIG_TEMPLATE = """
+[server]
+headless = {headless}
+port = {port}
+enableCORS = true
+enableXsrfProtection = false
+
+[browser]
+gatherUsageStats = {gather_usage_stats}
+
+[theme]
+primaryColor = "#1f4e79"
+backgroundColor = "#ffffff"
+secondaryBackgroundColor = "#f8f9fa"
+textColor = "#262730"
+
+[logger]
+level = "info"
+"""
+
 def check_python_version():
     """Check if Python version is compatible"""
     if sys.version_info < (3, 8):
@@ -42,28 +75,22 @@ def install_required_packages():
     missing_packages = []
     
     for package in REQUIRED_PACKAGES:
-        try:
-            pkg_name = package.split('>=')[0].split('==')[0]
-            if pkg_name == 'opencv-python':
-                import cv2
-            elif pkg_name == 'python-dotenv':
-                import dotenv
-            else:
-                __import__(pkg_name)
+        pkg_name = package.split('>=')[0].split('==')[0]
+        if is_installed(package):
             print(f"✅ {pkg_name} is installed")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {pkg_name} is missing")
     
     if missing_packages:
         print(f"\n📦 Installing {len(missing_packages)} missing packages...")
+        # One pip run resolves the whole set instead of restarting pip per package
+        result = subprocess.run(PIP_INSTALL + missing_packages)
+        if result.returncode != 0:
+            print(f"❌ Failed to install packages (pip exit code {result.returncode})")
+            return False
         for package in missing_packages:
-            try:
-                subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
-                print(f"✅ Installed {package}")
-            except subprocess.CalledProcessError as e:
-                print(f"❌ Failed to install {package}: {e}")
-                return False
+            print(f"✅ Installed {package}")
         print("✅ All packages installed successfully!")
     else:
         print("✅ All required packages are already installed!")
@@ -75,11 +102,10 @@ def setup_environment():
     print("🌟 Setting up production environment...")
     
     # Add current directory to Python path
-    current_dir = Path(__file__).parent.absolute()
-    system_dir = current_dir / 'system'
+    system_dir = SCRIPT_DIR / 'system'
     
-    if str(current_dir) not in sys.path:
-        sys.path.insert(0, str(current_dir))
+    if str(SCRIPT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPT_DIR))
     if str(system_dir) not in sys.path:
         sys.path.insert(0, str(system_dir))
     
@@ -105,11 +131,18 @@ def verify_system_files():
     ]
     
     missing_files = []
-    current_dir = Path(__file__).parent.absolute()
     
+    # Scan each folder once and look names up, rather than stat'ing every file
+    listings = {}
     for file_path in required_files:
-        full_path = current_dir / file_path
-        if full_path.exists():
+        folder, name = os.path.split(file_path)
+        if folder not in listings:
+            try:
+                with os.scandir(SCRIPT_DIR / folder) as entries:
+                    listings[folder] = {entry.name for entry in entries}
+            except OSError:
+                listings[folder] = set()
+        if name in listings[folder]:
             print(f"✅ {file_path}")
         else:
             missing_files.append(file_path)
@@ -125,55 +158,45 @@ def verify_system_files():
 
 def create_production_config():
     """Create production configuration file"""
-    config_path = Path(__file__).parent / '.streamlit' / 'config.toml'
+    config_path = SCRIPT_DIR / '.streamlit' / 'config.toml'
     config_path.parent.mkdir(exist_ok=True)
     
-    config_content = """
-[server]
-headless = false
-port = 8501
-enableCORS = true
-enableXsrfProtection = false
-
-[browser]
-gatherUsageStats = false
-
-[theme]
-primaryColor = "#1f4e79"
-backgroundColor = "#ffffff"
-secondaryBackgroundColor = "#f8f9fa"
-textColor = "#262730"
-
-[logger]
-level = "info"
-"""
-    
     with open(config_path, 'w') as f:
-        f.write(config_content)
+        f.write(STREAMLIT_CONFIG_TEMPLATE.format_map(STREAMLIT_SETTINGS))
     
     print("✅ Production configuration created")
 
+# Console banners, printed with a single write each
+HEADER = "\n".join([
+    "🚀 UNIVERSAL 6-CHART TRADING SYSTEM - PRODUCTION LAUNCHER",
+    "=" * 60
+])
+
+APP_BANNER = "\n".join([
+    "\n🚀 Launching Universal 6-Chart Trading System - PRODUCTION MODE",
+    "=" * 60,
+    "📊 Available Dashboards:",
+    "  • Universal 6-Chart Dashboard (Default)",
+    "  • Harrison's Enhanced Dashboard",
+    "  • NinjaTrader + Tradovate Dashboard",
+    "  • System Integration Panel",
+    "  • Analytics & Settings",
+    "=" * 60
+])
+
 def launch_production_app():
     """Launch the production app"""
-    print("\n🚀 Launching Universal 6-Chart Trading System - PRODUCTION MODE")
-    print("=" * 60)
-    print("📊 Available Dashboards:")
-    print("  • Universal 6-Chart Dashboard (Default)")
-    print("  • Harrison's Enhanced Dashboard")
-    print("  • NinjaTrader + Tradovate Dashboard")
-    print("  • System Integration Panel")
-    print("  • Analytics & Settings")
-    print("=" * 60)
-    
-    app_path = Path(__file__).parent / 'app.py'
+    print(APP_BANNER)
+    
+    app_path = SCRIPT_DIR / 'app.py'
     
     # Launch Streamlit
     try:
         subprocess.run([
             sys.executable, '-m', 'streamlit', 'run', str(app_path),
-            '--server.headless', 'false',
-            '--server.port', '8501',
-            '--browser.gatherUsageStats', 'false'
+            '--server.headless', STREAMLIT_SETTINGS['headless'],
+            '--server.port', str(STREAMLIT_SETTINGS['port']),
+            '--browser.gatherUsageStats', STREAMLIT_SETTINGS['gather_usage_stats']
         ])
     except KeyboardInterrupt:
         print("\n👋 Application stopped by user")
@@ -182,8 +205,7 @@ def launch_production_app():
 
 def main():
     """Main production launcher"""
-    print("🚀 UNIVERSAL 6-CHART TRADING SYSTEM - PRODUCTION LAUNCHER")
-    print("=" * 60)
+    print(HEADER)
     
     # Pre-flight checks
     if not check_python_version():
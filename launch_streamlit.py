@@ -3,6 +3,7 @@
 Simple launcher for the Streamlit-based trading application
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -10,11 +11,7 @@ from pathlib import Path
 
 def check_streamlit_installed():
     """Check if Streamlit is installed"""
-    try:
-        import streamlit
-        return True
-    except ImportError:
-        return False
+    return importlib.util.find_spec("streamlit") is not None
 
 def install_requirements():
     """Install required packages"""
@@ -41,6 +38,21 @@ def install_requirements():
     print("✅ All packages installed successfully!")
     return True
 
+# Console banners, printed with a single write each
+BANNER = "\n".join([
+    "=" * 60,
+    "🎯 UNIVERSAL 6-CHART TRADING SYSTEM",
+    "   Streamlit-based control panel for any trader",
+    "=" * 60
+])
+
+LAUNCH_NOTICE = "\n".join([
+    "🚀 Launching Universal 6-Chart Trading System...",
+    "📊 Opening in your default web browser...",
+    "🛑 Press Ctrl+C in this terminal to stop the application",
+    ""
+])
+
 def launch_streamlit_app():
     """Launch the Streamlit application"""
     app_path = Path(__file__).parent / "app.py"
@@ -49,14 +61,23 @@ def launch_streamlit_app():
         print(f"❌ App file not found: {app_path}")
         return False
     
-    print("🚀 Launching Universal 6-Chart Trading System...")
-    print("📊 Opening in your default web browser...")
-    print("🛑 Press Ctrl+C in this terminal to stop the application")
-    print()
+    print(LAUNCH_NOTICE)
+    
+    cmd = [sys.executable, "-m", "streamlit", "run", str(app_path), "--server.headless", "false"]
+    
+    # On POSIX, become the streamlit process rather than waiting on it: no
+    # idle launcher interpreter for the whole session and Ctrl+C goes
+    # straight to the server. Windows has no real exec, so it keeps the child
+    if os.name != 'nt':
+        sys.stdout.flush()
+        try:
+            os.execv(sys.executable, cmd)
+        except OSError as e:
+            print(f"❌ Failed to launch Streamlit: {e}")
+            return False
     
     try:
         # Launch Streamlit
-        cmd = [sys.executable, "-m", "streamlit", "run", str(app_path), "--server.headless", "false"]
         subprocess.run(cmd, check=True)
         return True
     except subprocess.CalledProcessError as e:
@@ -68,10 +89,7 @@ def launch_streamlit_app():
 
 def main():
     """Main launcher function"""
-    print("=" * 60)
-    print("🎯 UNIVERSAL 6-CHART TRADING SYSTEM")
-    print("   Streamlit-based control panel for any trader")
-    print("=" * 60)
+    print(BANNER)
     
     # Check if Streamlit is installed
     if not check_streamlit_installed():
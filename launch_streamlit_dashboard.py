@@ -12,6 +12,8 @@ import sys
 import os
 from pathlib import Path
 
+from requirement_check import is_installed
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     required_packages = [
@@ -33,22 +35,16 @@ def check_dependencies():
     print("🔍 Checking dependencies...")
     
     for package in required_packages:
-        try:
-            __import__(package)
+        if is_installed(package):
             print(f"   ✅ {package}")
-        except ImportError:
+        else:
             missing_required.append(package)
             print(f"   ❌ {package} (REQUIRED)")
     
     for package in optional_packages:
-        package_name = package.replace('-', '_')  # opencv-python imports as cv2
-        if package == 'opencv-python':
-            package_name = 'cv2'
-        
-        try:
-            __import__(package_name)
+        if is_installed(package):
             print(f"   ✅ {package} (OCR functionality)")
-        except ImportError:
+        else:
             missing_optional.append(package)
             print(f"   ⚠️  {package} (OCR functionality - optional)")
     
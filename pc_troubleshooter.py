@@ -6,6 +6,7 @@ Interactive diagnostic tool to help users fix common PC setup issues
 import sys
 import os
 import subprocess
+import importlib.util
 import platform
 import socket
 from datetime import datetime
@@ -76,10 +77,9 @@ class PCTroubleshooter:
         missing_packages = []
         
         for package in required_packages:
-            try:
-                __import__(package)
+            if importlib.util.find_spec(package) is not None:
                 print(f"   ✅ {package} - Available")
-            except ImportError:
+            else:
                 missing_packages.append(package)
                 print(f"   ❌ {package} - Missing")
         
@@ -318,7 +318,7 @@ class PCTroubleshooter:
         elif choice == "4":
             self.auto_reinstall_streamlit()
         elif choice == "5":
-            os.system("python enigma_system_test.py")
+            subprocess.run([sys.executable, "enigma_system_test.py"])
         elif choice == "0":
             print("Goodbye!")
         else:
@@ -328,10 +328,10 @@ class PCTroubleshooter:
     def auto_install_packages(self):
         """Automatically install required packages"""
         print("Installing required packages...")
-        packages = "streamlit pandas numpy plotly requests websockets cryptography psutil"
+        packages = ["streamlit", "pandas", "numpy", "plotly", "requests", "websockets", "cryptography", "psutil"]
         
         try:
-            result = subprocess.run(f"pip install {packages}", shell=True, 
+            result = subprocess.run([sys.executable, "-m", "pip", "install", *packages],
                                   capture_output=True, text=True)
             if result.returncode == 0:
                 print("✅ Packages installed successfully!")
@@ -345,8 +345,8 @@ class PCTroubleshooter:
         """Automatically update pip"""
         print("Updating pip...")
         try:
-            result = subprocess.run("python -m pip install --upgrade pip", 
-                                  shell=True, capture_output=True, text=True)
+            result = subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip"],
+                                  capture_output=True, text=True)
             if result.returncode == 0:
                 print("✅ pip updated successfully!")
                 self.fixes_applied.append("Updated pip")
@@ -360,10 +360,10 @@ class PCTroubleshooter:
         print("Reinstalling Streamlit...")
         try:
             # Uninstall
-            subprocess.run("pip uninstall streamlit -y", shell=True, 
+            subprocess.run([sys.executable, "-m", "pip", "uninstall", "streamlit", "-y"],
                          capture_output=True, text=True)
             # Reinstall
-            result = subprocess.run("pip install streamlit", shell=True, 
+            result = subprocess.run([sys.executable, "-m", "pip", "install", "streamlit"],
                                   capture_output=True, text=True)
             if result.returncode == 0:
                 print("✅ Streamlit reinstalled successfully!")
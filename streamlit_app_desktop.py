@@ -88,8 +88,8 @@ try:
     AUDIO_TYPE = "winsound"
 except ImportError:
     try:
+        # The mixer opens the audio device, so it is started on the first alert
         import pygame
-        pygame.mixer.init()
         AUDIO_AVAILABLE = True
         AUDIO_TYPE = "pygame"
     except ImportError:
@@ -334,6 +334,9 @@ class NotificationManager:
                     winsound.Beep(600, 100)   # Single short beep
             
             elif AUDIO_TYPE == "pygame" and AUDIO_AVAILABLE:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+                
                 # Generate tones using pygame
                 frequencies = {
                     "critical": [1000, 800, 1000],
@@ -415,7 +415,7 @@ class StreamlitOCRManager:
             os.makedirs("config", exist_ok=True)
             
             with open("config/ocr_config.json", 'w') as f:
-                json.dump(config_data, f, indent=2)
+                f.write(json.dumps(config_data, indent=2))
                 
         except Exception as e:
             st.error(f"Error saving OCR config: {e}")
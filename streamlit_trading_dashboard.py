@@ -41,6 +41,28 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Stand-in log entries for the Logs tab: (minutes ago, event)
+SIMULATED_LOG_EVENTS = [
+    (0, "System started"),
+    (1, "Chart ES-Primary signal: GREEN (85%)"),
+    (2, "Position updated: NQ-Primary 2.5 contracts"),
+    (3, "Compliance check: PASSED"),
+]
+
+@st.cache_data(ttl=5, max_entries=1, show_spinner=False)
+def simulated_log_lines() -> List[str]:
+    """Timestamped simulated log lines, rebuilt at most every 5 seconds instead of on every rerun"""
+    now = datetime.now()
+    return [f"{(now - timedelta(minutes=minutes)).strftime('%H:%M:%S')} - {event}"
+            for minutes, event in SIMULATED_LOG_EVENTS]
+
+def arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert columns to Arrow-backed dtypes once, so st.dataframe ships them without re-converting"""
+    try:
+        return df.convert_dtypes(dtype_backend="pyarrow")
+    except (TypeError, ImportError):  # pandas < 2.0 or pyarrow missing
+        return df
+
 @dataclass
 class UserConfig:
     """User-specific configuration"""
@@ -144,7 +166,7 @@ class TradingDashboard:
         
         try:
             with open(config_file, 'w') as f:
-                json.dump(asdict(st.session_state.user_config), f, indent=2)
+                f.write(json.dumps(asdict(st.session_state.user_config), indent=2))
         except Exception as e:
             st.error(f"Error saving config: {e}")
     
@@ -582,11 +604,13 @@ class TradingDashboard:
         
         with col1:
             st.subheader("📊 Performance Metrics")
-            metrics_df = pd.DataFrame({
-                "Metric": ["Total Return", "Max Drawdown", "Win Rate", "Profit Factor", "Sharpe Ratio"],
-                "Value": ["$2,450 (9.8%)", "$1,200 (4.8%)", "68.5%", "1.85", "1.42"]
-            })
-            st.dataframe(metrics_df, hide_index=True)
+            # Fixed figures: build the table once per session, not on every rerun
+            if 'performance_metrics' not in st.session_state:
+                st.session_state.performance_metrics = arrow_backed(pd.DataFrame({
+                    "Metric": ["Total Return", "Max Drawdown", "Win Rate", "Profit Factor", "Sharpe Ratio"],
+                    "Value": ["$2,450 (9.8%)", "$1,200 (4.8%)", "68.5%", "1.85", "1.42"]
+                }))
+            st.dataframe(st.session_state.performance_metrics, hide_index=True)
         
         with col2:
             st.subheader("🎯 Chart Performance")
@@ -682,15 +706,9 @@ class TradingDashboard:
                 st.divider()
                 
                 # Simulated log entries
-                logs = [
-                    f"{datetime.now().strftime('%H:%M:%S')} - System started",
-                    f"{(datetime.now() - timedelta(minutes=1)).strftime('%H:%M:%S')} - Chart ES-Primary signal: GREEN (85%)",
-                    f"{(datetime.now() - timedelta(minutes=2)).strftime('%H:%M:%S')} - Position updated: NQ-Primary 2.5 contracts",
-                    f"{(datetime.now() - timedelta(minutes=3)).strftime('%H:%M:%S')} - Compliance check: PASSED",
-                ]
+                logs = simulated_log_lines()
                 
-                for log in logs:
-                    st.text(log)
+                st.text("\n".join(logs))
             
             # Auto-refresh simulation
             if st.session_state.system_running:
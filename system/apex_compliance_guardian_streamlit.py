@@ -19,6 +19,7 @@ from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Tuple
 import sqlite3
 import base64
+from string import Template
 
 # Import production configuration manager
 try:
@@ -40,6 +41,22 @@ except ImportError:
 
 import io
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json fallback
+
+def write_json_atomic(path: str, data: Dict):
+    """Write JSON to a temp file and swap it in, so readers never see a partial file"""
+    tmp_path = path + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps(data, indent=2))
+    os.replace(tmp_path, path)
+
 # Page configuration
 st.set_page_config(
     page_title="🛡️ Apex Compliance Guardian + AlgoBars",
@@ -120,6 +137,204 @@ class AlgoBarSettings:
     show_imbalance_zones: bool = True
     no_repainting: bool = True  # WYSIWYG principle
 
+ALERT_ICONS = {
+    'ERROR': '🚨',
+    'WARNING': '⚠️',
+    'SUCCESS': '✅',
+    'INFO': 'ℹ️',
+}
+
+# Native Streamlit callout per alert level, used by the alert feeds
+ALERT_CALLOUTS = {
+    'ERROR': st.error,
+    'WARNING': st.warning,
+    'SUCCESS': st.success,
+    'INFO': st.info,
+}
+
+# With Visual Flash on, the newest alert is drawn as a card carrying the
+# flash-* class that the flash CSS animates
+ALERT_FLASH_CARD = '<div class="flash-{level_class}"><strong>{icon} {level} [{timestamp}]</strong><br>{message}</div>'
+
+# Notification snippets depend only on alert type and the on/off setting.
+# Streamlit re-executes this script on every rerun, which would reset a
+# plain functools cache, so Streamlit's own caches hold each variant for
+# the life of the server instead.
+@st.cache_data(max_entries=16, show_spinner=False)
+def _sound_notification_html(alert_type: str, enabled: bool) -> str:
+    """Build the Web Audio snippet once per alert type and sound setting"""
+    # Generate different tones for different alert types
+    frequencies = {
+        'ERROR': 800,    # High pitch for errors
+        'WARNING': 600,  # Medium pitch for warnings
+        'SUCCESS': 400,  # Low pitch for success
+        'INFO': 500,     # Neutral pitch for info
+    }
+    
+    freq = frequencies.get(alert_type, 500)
+    
+    # Create a robust sound notification using Web Audio API
+    audio_html = f"""
+    <script>
+    (function() {{
+        if ({str(enabled).lower()}) {{
+            try {{
+                // Check for user interaction first
+                if (typeof window.audioContextInitialized === 'undefined') {{
+                    window.audioContextInitialized = false;
+                    document.addEventListener('click', function initAudio() {{
+                        window.audioContextInitialized = true;
+                        document.removeEventListener('click', initAudio);
+                    }}, {{ once: true }});
+                }}
+                
+                // Create audio context
+                const AudioContext = window.AudioContext || window.webkitAudioContext;
+                if (!AudioContext) {{
+                    console.warn('Web Audio API not supported');
+                    return;
+                }}
+                
+                const audioContext = new AudioContext();
+                
+                // Resume context if suspended
+                if (audioContext.state === 'suspended') {{
+                    audioContext.resume();
+                }}
+                
+                const oscillator = audioContext.createOscillator();
+                const gainNode = audioContext.createGain();
+                
+                oscillator.connect(gainNode);
+                gainNode.connect(audioContext.destination);
+                
+                oscillator.frequency.setValueAtTime({freq}, audioContext.currentTime);
+                oscillator.type = 'sine';
+                
+                // Smooth volume envelope
+                gainNode.gain.setValueAtTime(0, audioContext.currentTime);
+                gainNode.gain.linearRampToValueAtTime(0.2, audioContext.currentTime + 0.05);
+                gainNode.gain.exponentialRampToValueAtTime(0.001, audioContext.currentTime + 0.8);
+                
+                oscillator.start(audioContext.currentTime);
+                oscillator.stop(audioContext.currentTime + 0.8);
+                
+                // Clean up
+                oscillator.onended = function() {{
+                    oscillator.disconnect();
+                    gainNode.disconnect();
+                }};
+                
+            }} catch (error) {{
+                console.warn('Audio notification failed:', error);
+                // Fallback: try system beep
+                try {{
+                    const fallbackAudio = new Audio('data:audio/wav;base64,UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2EcBj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PwtmMcBjiR1/LMeSwFJHfH8N2QQAoUXrTp66hVFApGn+DyvmEaETGH0fPTgjMGHm7A7+OZURE,');
+                    fallbackAudio.volume = 0.1;
+                    fallbackAudio.play().catch(() => {{}});
+                }} catch (fallbackError) {{
+                    console.warn('Fallback audio also failed:', fallbackError);
+                }}
+            }}
+        }}
+    }})();
+    </script>
+    """
+    return audio_html
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _browser_notification_template(alert_type: str, enabled: bool) -> Template:
+    """Build the Notification API snippet once per alert type, leaving $title and $message to fill in"""
+    icon = ALERT_ICONS.get(alert_type, 'ℹ️')
+    
+    return Template(f"""
+    <script>
+    (function() {{
+        if ({str(enabled).lower()}) {{
+            try {{
+                if ("Notification" in window) {{
+                    if (Notification.permission === "granted") {{
+                        const notification = new Notification("{icon} $title", {{
+                            body: "$message",
+                            icon: "data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMjQiIGhlaWdodD0iMjQiIHZpZXdCb3g9IjAgMCAyNCAyNCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEyIDJDNi40OCAyIDIgNi40OCAyIDEyUzYuNDggMjIgMTIgMjJTMjIgMTcuNTIgMjIgMTJTMTcuNTIgMiAxMiAyWiIgZmlsbD0iIzJkM2E4NyIvPgo8L3N2Zz4K",
+                            requireInteraction: false,
+                            tag: "apex-compliance-{alert_type.lower()}",
+                            timestamp: Date.now(),
+                            silent: false
+                        }});
+                        
+                        // Auto-close after 5 seconds for non-critical alerts
+                        if ('{alert_type}' !== 'ERROR') {{
+                            setTimeout(() => {{
+                                if (notification) {{
+                                    notification.close();
+                                }}
+                            }}, 5000);
+                        }}
+                        
+                    }} else if (Notification.permission !== "denied") {{
+                        Notification.requestPermission().then(function (permission) {{
+                            if (permission === "granted") {{
+                                const notification = new Notification("{icon} $title", {{
+                                    body: "$message",
+                                    requireInteraction: '{alert_type}' === 'ERROR',
+                                    tag: "apex-compliance-{alert_type.lower()}",
+                                    timestamp: Date.now()
+                                }});
+                                
+                                if ('{alert_type}' !== 'ERROR') {{
+                                    setTimeout(() => {{
+                                        if (notification) {{
+                                            notification.close();
+                                        }}
+                                    }}, 5000);
+                                }}
+                            }}
+                        }});
+                    }} else {{
+                        console.warn('Browser notifications are blocked');
+                    }}
+                }} else {{
+                    console.warn('Browser notifications not supported');
+                }}
+            }} catch (error) {{
+                console.warn('Browser notification failed:', error);
+            }}
+        }}
+    }})();
+    </script>
+    """)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _visual_flash_html(alert_type: str) -> str:
+    """Build the flash CSS once per alert type"""
+    colors = {
+        'ERROR': '#ff4b4b',
+        'WARNING': '#ff8c00',
+        'SUCCESS': '#00d084',
+        'INFO': '#0066cc',
+    }
+    
+    color = colors.get(alert_type, '#0066cc')
+    
+    flash_html = f"""
+    <style>
+    @keyframes flashAlert {{
+        0% {{ background-color: transparent; }}
+        50% {{ background-color: {color}20; }}
+        100% {{ background-color: transparent; }}
+    }}
+    .flash-{alert_type.lower()} {{
+        animation: flashAlert 0.5s ease-in-out 3;
+        border: 2px solid {color};
+        border-radius: 5px;
+        padding: 10px;
+        margin: 5px 0;
+    }}
+    </style>
+    """
+    return flash_html
+
 class EnhancedNotificationSystem:
     """Advanced notification system with sound, visual, and browser alerts"""
     
@@ -134,187 +349,20 @@ class EnhancedNotificationSystem:
         
     def create_sound_notification(self, alert_type: str) -> str:
         """Create HTML audio element for sound notifications"""
-        # Generate different tones for different alert types
-        frequencies = {
-            'ERROR': 800,    # High pitch for errors
-            'WARNING': 600,  # Medium pitch for warnings
-            'SUCCESS': 400,  # Low pitch for success
-            'INFO': 500,     # Neutral pitch for info
-        }
-        
-        freq = frequencies.get(alert_type, 500)
-        
-        # Create a robust sound notification using Web Audio API
-        audio_html = f"""
-        <script>
-        (function() {{
-            if ({str(self.notification_settings['sound_enabled']).lower()}) {{
-                try {{
-                    // Check for user interaction first
-                    if (typeof window.audioContextInitialized === 'undefined') {{
-                        window.audioContextInitialized = false;
-                        document.addEventListener('click', function initAudio() {{
-                            window.audioContextInitialized = true;
-                            document.removeEventListener('click', initAudio);
-                        }}, {{ once: true }});
-                    }}
-                    
-                    // Create audio context
-                    const AudioContext = window.AudioContext || window.webkitAudioContext;
-                    if (!AudioContext) {{
-                        console.warn('Web Audio API not supported');
-                        return;
-                    }}
-                    
-                    const audioContext = new AudioContext();
-                    
-                    // Resume context if suspended
-                    if (audioContext.state === 'suspended') {{
-                        audioContext.resume();
-                    }}
-                    
-                    const oscillator = audioContext.createOscillator();
-                    const gainNode = audioContext.createGain();
-                    
-                    oscillator.connect(gainNode);
-                    gainNode.connect(audioContext.destination);
-                    
-                    oscillator.frequency.setValueAtTime({freq}, audioContext.currentTime);
-                    oscillator.type = 'sine';
-                    
-                    // Smooth volume envelope
-                    gainNode.gain.setValueAtTime(0, audioContext.currentTime);
-                    gainNode.gain.linearRampToValueAtTime(0.2, audioContext.currentTime + 0.05);
-                    gainNode.gain.exponentialRampToValueAtTime(0.001, audioContext.currentTime + 0.8);
-                    
-                    oscillator.start(audioContext.currentTime);
-                    oscillator.stop(audioContext.currentTime + 0.8);
-                    
-                    // Clean up
-                    oscillator.onended = function() {{
-                        oscillator.disconnect();
-                        gainNode.disconnect();
-                    }};
-                    
-                }} catch (error) {{
-                    console.warn('Audio notification failed:', error);
-                    // Fallback: try system beep
-                    try {{
-                        const fallbackAudio = new Audio('data:audio/wav;base64,UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2EcBj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PwtmMcBjiR1/LMeSwFJHfH8N2QQAoUXrTp66hVFApGn+DyvmEaETGH0fPTgjMGHm7A7+OZURE,');
-                        fallbackAudio.volume = 0.1;
-                        fallbackAudio.play().catch(() => {{}});
-                    }} catch (fallbackError) {{
-                        console.warn('Fallback audio also failed:', fallbackError);
-                    }}
-                }}
-            }}
-        }})();
-        </script>
-        """
-        return audio_html
+        return _sound_notification_html(alert_type, self.notification_settings['sound_enabled'])
     
     def create_browser_notification(self, title: str, message: str, alert_type: str) -> str:
         """Create browser notification using Notification API"""
-        icons = {
-            'ERROR': '🚨',
-            'WARNING': '⚠️',
-            'SUCCESS': '✅',
-            'INFO': 'ℹ️',
-        }
-        
-        icon = icons.get(alert_type, 'ℹ️')
-        
         # Clean message text for JavaScript
         clean_title = title.replace('"', '\\"').replace("'", "\\'")
         clean_message = message.replace('"', '\\"').replace("'", "\\'")
         
-        notification_html = f"""
-        <script>
-        (function() {{
-            if ({str(self.notification_settings['browser_notifications']).lower()}) {{
-                try {{
-                    if ("Notification" in window) {{
-                        if (Notification.permission === "granted") {{
-                            const notification = new Notification("{icon} {clean_title}", {{
-                                body: "{clean_message}",
-                                icon: "data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMjQiIGhlaWdodD0iMjQiIHZpZXdCb3g9IjAgMCAyNCAyNCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEyIDJDNi40OCAyIDIgNi40OCAyIDEyUzYuNDggMjIgMTIgMjJTMjIgMTcuNTIgMjIgMTJTMTcuNTIgMiAxMiAyWiIgZmlsbD0iIzJkM2E4NyIvPgo8L3N2Zz4K",
-                                requireInteraction: false,
-                                tag: "apex-compliance-{alert_type.lower()}",
-                                timestamp: Date.now(),
-                                silent: false
-                            }});
-                            
-                            // Auto-close after 5 seconds for non-critical alerts
-                            if ('{alert_type}' !== 'ERROR') {{
-                                setTimeout(() => {{
-                                    if (notification) {{
-                                        notification.close();
-                                    }}
-                                }}, 5000);
-                            }}
-                            
-                        }} else if (Notification.permission !== "denied") {{
-                            Notification.requestPermission().then(function (permission) {{
-                                if (permission === "granted") {{
-                                    const notification = new Notification("{icon} {clean_title}", {{
-                                        body: "{clean_message}",
-                                        requireInteraction: '{alert_type}' === 'ERROR',
-                                        tag: "apex-compliance-{alert_type.lower()}",
-                                        timestamp: Date.now()
-                                    }});
-                                    
-                                    if ('{alert_type}' !== 'ERROR') {{
-                                        setTimeout(() => {{
-                                            if (notification) {{
-                                                notification.close();
-                                            }}
-                                        }}, 5000);
-                                    }}
-                                }}
-                            }});
-                        }} else {{
-                            console.warn('Browser notifications are blocked');
-                        }}
-                    }} else {{
-                        console.warn('Browser notifications not supported');
-                    }}
-                }} catch (error) {{
-                    console.warn('Browser notification failed:', error);
-                }}
-            }}
-        }})();
-        </script>
-        """
-        return notification_html
+        template = _browser_notification_template(alert_type, self.notification_settings['browser_notifications'])
+        return template.substitute(title=clean_title, message=clean_message)
     
     def create_visual_flash(self, alert_type: str) -> str:
         """Create visual flash effect for critical alerts"""
-        colors = {
-            'ERROR': '#ff4b4b',
-            'WARNING': '#ff8c00',
-            'SUCCESS': '#00d084',
-            'INFO': '#0066cc',
-        }
-        
-        color = colors.get(alert_type, '#0066cc')
-        
-        flash_html = f"""
-        <style>
-        @keyframes flashAlert {{
-            0% {{ background-color: transparent; }}
-            50% {{ background-color: {color}20; }}
-            100% {{ background-color: transparent; }}
-        }}
-        .flash-{alert_type.lower()} {{
-            animation: flashAlert 0.5s ease-in-out 3;
-            border: 2px solid {color};
-            border-radius: 5px;
-            padding: 10px;
-            margin: 5px 0;
-        }}
-        </style>
-        """
-        return flash_html
+        return _visual_flash_html(alert_type)
 
 class AlgoBarEngine:
     """AlgoBox AlgoBar calculation engine - Price-based bars without time distortion"""
@@ -470,12 +518,14 @@ class ApexComplianceGuardian:
         
     def add_alert(self, message: str, level: str = "INFO", enable_notifications: bool = True):
         """Add alert to the system with enhanced notifications"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # One clock read for both fields; building HH:MM:SS from the fields
+        # is about twice as fast as strftime on this hot path
+        now = datetime.now()
         alert = {
-            'timestamp': timestamp,
+            'timestamp': f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
             'message': message,
             'level': level,
-            'full_time': datetime.now()
+            'full_time': now
         }
         
         if 'alerts' not in st.session_state:
@@ -502,48 +552,25 @@ class ApexComplianceGuardian:
             st.markdown(browser_html, unsafe_allow_html=True)
             
             # Add visual flash
-            flash_html = self.notification_system.create_visual_flash(level)
-            st.markdown(flash_html, unsafe_allow_html=True)
+            if self.notification_system.notification_settings['visual_flash']:
+                flash_html = self.notification_system.create_visual_flash(level)
+                st.markdown(flash_html, unsafe_allow_html=True)
             
         # Log to file
         logging.info(f"{level}: {message}")
         
-    def simulate_market_data(self):
-        """Simulate realistic market data for AlgoBar formation"""
+    def simulate_market_data(self, ticks: int = 1):
+        """Simulate realistic market data for AlgoBar formation
+        
+        The noise and volume draws for all ticks are made in one NumPy call
+        each, so driving a batch of ticks doesn't pay per-tick RNG overhead.
+        """
         # Generate realistic price movement
         base_price = 4580.25  # ES futures example
         
         # Market volatility simulation with trends
-        volatility = random.uniform(0.5, 2.0)
-        
-        # Add trend bias
-        if not hasattr(self, 'trend_direction'):
-            self.trend_direction = random.choice([1, -1])
-            self.trend_strength = random.uniform(0.1, 0.3)
-            self.trend_duration = random.randint(50, 200)
-            self.trend_counter = 0
-            
-        # Change trend occasionally
-        self.trend_counter += 1
-        if self.trend_counter >= self.trend_duration:
-            self.trend_direction = random.choice([1, -1])
-            self.trend_strength = random.uniform(0.1, 0.3)
-            self.trend_duration = random.randint(50, 200)
-            self.trend_counter = 0
-        
-        # Calculate price change with trend bias
-        trend_component = self.trend_direction * self.trend_strength
-        noise_component = random.gauss(0, volatility)
-        price_change = trend_component + noise_component
-        
-        # Current price with trend
-        if not hasattr(self, 'current_price'):
-            self.current_price = base_price
-            
-        self.current_price += price_change
-        
-        # Ensure realistic price bounds
-        self.current_price = max(4500, min(4700, self.current_price))
+        volatility = np.random.uniform(0.5, 2.0, ticks)
+        noise = np.random.normal(0.0, volatility).tolist()
         
         # Volume simulation (heavier during market hours)
         current_time = datetime.now()
@@ -557,32 +584,59 @@ class ApexComplianceGuardian:
             # Higher volume during first and last hour
             hour = current_time.hour
             if hour in [9, 15]:  # Opening and closing hours
-                volume = random.randint(200, 800)
+                volume_range = (200, 800)
             elif hour in [10, 14]:  # Active hours
-                volume = random.randint(100, 400)
+                volume_range = (100, 400)
             else:  # Mid-day
-                volume = random.randint(50, 200)
+                volume_range = (50, 200)
         else:
-            volume = random.randint(5, 50)  # Overnight/after hours
+            volume_range = (5, 50)  # Overnight/after hours
+        volumes = np.random.randint(volume_range[0], volume_range[1] + 1, ticks).tolist()
         
-        # Delta (order flow) simulation with bias
-        if price_change > 0:
-            # Bullish bias in delta
-            delta = random.randint(int(volume * 0.3), volume)
-        else:
-            # Bearish bias in delta
-            delta = random.randint(-volume, int(-volume * 0.3))
-        
-        # Add tick to AlgoBar engine
-        self.algo_engine.add_tick(
-            price=self.current_price,
-            volume=volume,
-            delta=delta,
-            timestamp=current_time
-        )
+        # Add trend bias
+        if not hasattr(self, 'trend_direction'):
+            self.trend_direction = random.choice([1, -1])
+            self.trend_strength = random.uniform(0.1, 0.3)
+            self.trend_duration = random.randint(50, 200)
+            self.trend_counter = 0
+            
+        # Current price with trend
+        if not hasattr(self, 'current_price'):
+            self.current_price = base_price
         
-        # Update trade data simulation
-        self.update_trade_data()
+        for noise_component, volume in zip(noise, volumes):
+            # Change trend occasionally
+            self.trend_counter += 1
+            if self.trend_counter >= self.trend_duration:
+                self.trend_direction = random.choice([1, -1])
+                self.trend_strength = random.uniform(0.1, 0.3)
+                self.trend_duration = random.randint(50, 200)
+                self.trend_counter = 0
+            
+            # Calculate price change with trend bias
+            price_change = self.trend_direction * self.trend_strength + noise_component
+            
+            # Ensure realistic price bounds
+            self.current_price = max(4500, min(4700, self.current_price + price_change))
+            
+            # Delta (order flow) simulation with bias
+            if price_change > 0:
+                # Bullish bias in delta
+                delta = random.randint(int(volume * 0.3), volume)
+            else:
+                # Bearish bias in delta
+                delta = random.randint(-volume, int(-volume * 0.3))
+            
+            # Add tick to AlgoBar engine
+            self.algo_engine.add_tick(
+                price=self.current_price,
+                volume=volume,
+                delta=delta,
+                timestamp=current_time
+            )
+            
+            # Update trade data simulation
+            self.update_trade_data()
         
     def update_trade_data(self):
         """Update trade data with realistic simulation"""
@@ -802,8 +856,7 @@ class ApexComplianceGuardian:
         }
         
         try:
-            with open('apex_settings.json', 'w') as f:
-                json.dump(settings, f, indent=2)
+            write_json_atomic('apex_settings.json', settings)
             self.add_alert("💾 Settings saved successfully", "SUCCESS")
         except Exception as e:
             self.add_alert(f"❌ Failed to save settings: {str(e)}", "ERROR")
@@ -1534,32 +1587,19 @@ def create_alerts_panel():
             
             st.markdown("---")
             
-            for alert in reversed(recent_alerts):
+            # Native callouts rather than raw HTML cards, except the newest
+            # alert when Visual Flash is on: it keeps its flash card
+            flash_newest = guardian.notification_system.notification_settings['visual_flash']
+            for index, alert in enumerate(reversed(recent_alerts)):
                 level = alert['level']
-                message = alert['message']
-                timestamp = alert['timestamp']
-                
-                # Enhanced styling with icons and colors
-                if level == "ERROR":
-                    st.markdown(
-                        f'<div class="flash-error"><strong>🚨 ERROR [{timestamp}]</strong><br>{message}</div>',
-                        unsafe_allow_html=True
-                    )
-                elif level == "WARNING":
-                    st.markdown(
-                        f'<div class="flash-warning"><strong>⚠️ WARNING [{timestamp}]</strong><br>{message}</div>',
-                        unsafe_allow_html=True
-                    )
-                elif level == "SUCCESS":
-                    st.markdown(
-                        f'<div class="flash-success"><strong>✅ SUCCESS [{timestamp}]</strong><br>{message}</div>',
-                        unsafe_allow_html=True
-                    )
+                icon = ALERT_ICONS.get(level, 'ℹ️')
+                if index == 0 and flash_newest:
+                    st.markdown(ALERT_FLASH_CARD.format(level_class=level.lower() if level in ALERT_ICONS else 'info', icon=icon, level=level,
+                                                        timestamp=alert['timestamp'], message=alert['message']),
+                                unsafe_allow_html=True)
                 else:
-                    st.markdown(
-                        f'<div class="flash-info"><strong>ℹ️ INFO [{timestamp}]</strong><br>{message}</div>',
-                        unsafe_allow_html=True
-                    )
+                    callout = ALERT_CALLOUTS.get(level, st.info)
+                    callout(f"**{icon} {level} [{alert['timestamp']}]**  \n{alert['message']}")
         else:
             st.info("No alerts yet. Start monitoring to see system alerts.")
             
@@ -1650,7 +1690,8 @@ def create_alerts_panel():
         # Notification statistics
         if 'alerts' in st.session_state and st.session_state.alerts:
             total_alerts = len(st.session_state.alerts)
-            today_alerts = len([a for a in st.session_state.alerts if a['full_time'].date() == datetime.now().date()])
+            today = datetime.now().date()
+            today_alerts = sum(1 for a in st.session_state.alerts if a['full_time'].date() == today)
             
             stats_col1, stats_col2, stats_col3 = st.columns(3)
             with stats_col1:
@@ -1912,24 +1953,11 @@ def create_alerts_panel():
         st.markdown("#### 📋 Recent Alerts (Last 20)")
         
         for alert in alerts[-20:]:
-            level_colors = {
-                'ERROR': '🚨',
-                'WARNING': '⚠️',
-                'SUCCESS': '✅',
-                'INFO': 'ℹ️'
-            }
-            
-            icon = level_colors.get(alert['level'], 'ℹ️')
+            icon = ALERT_ICONS.get(alert['level'], 'ℹ️')
             
             # Create colored alert based on level
-            if alert['level'] == 'ERROR':
-                st.error(f"{icon} [{alert['timestamp']}] {alert['message']}")
-            elif alert['level'] == 'WARNING':
-                st.warning(f"{icon} [{alert['timestamp']}] {alert['message']}")
-            elif alert['level'] == 'SUCCESS':
-                st.success(f"{icon} [{alert['timestamp']}] {alert['message']}")
-            else:
-                st.info(f"{icon} [{alert['timestamp']}] {alert['message']}")
+            callout = ALERT_CALLOUTS.get(alert['level'], st.info)
+            callout(f"{icon} [{alert['timestamp']}] {alert['message']}")
                 
         # Clear alerts button
         if st.button("🗑️ Clear All Alerts"):
@@ -0,0 +1,257 @@
+"""
+🔢 POWER SCORE DIGIT CLASSIFIER
+Template matcher for the AlgoBox power-score field
+AlgoBox draws the score in one fixed font, so a per-glyph template
+comparison replaces a full Tesseract pass with a few microseconds of work
+"""
+
+import os
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Run kernels as plain Python when Numba is not installed"""
+        def decorate(func):
+            return func
+        return decorate
+
+# Calibration output: one binarized glyph per digit 0-9, shape (10, H, W)
+DIGIT_TEMPLATES_PATH = os.environ.get("POWER_SCORE_TEMPLATES", "config/power_score_digit_templates.npy")
+
+# Mean per-pixel mismatch (0-255) above which a glyph is rejected as unreadable
+MAX_GLYPH_MISMATCH = 64
+
+@njit(cache=True)
+def _glyph_spans(ink: np.ndarray) -> np.ndarray:
+    """Split an ink mask into glyphs at blank columns, returning (x1, x2, y1, y2) rows"""
+    height, width = ink.shape
+    spans = np.empty((width, 4), dtype=np.int64)
+    count = 0
+    x = 0
+    while x < width:
+        column_has_ink = False
+        for y in range(height):
+            if ink[y, x]:
+                column_has_ink = True
+                break
+        if not column_has_ink:
+            x += 1
+            continue
+        
+        x1 = x
+        while x < width:
+            column_has_ink = False
+            for y in range(height):
+                if ink[y, x]:
+                    column_has_ink = True
+                    break
+            if not column_has_ink:
+                break
+            x += 1
+        
+        y1 = height
+        y2 = 0
+        for yy in range(height):
+            for xx in range(x1, x):
+                if ink[yy, xx]:
+                    if yy < y1:
+                        y1 = yy
+                    if yy + 1 > y2:
+                        y2 = yy + 1
+                    break
+        
+        spans[count, 0] = x1
+        spans[count, 1] = x
+        spans[count, 2] = y1
+        spans[count, 3] = y2
+        count += 1
+    return spans[:count]
+
+@njit(cache=True, fastmath=True)
+def classify_digits(binary: np.ndarray, templates: np.ndarray) -> np.ndarray:
+    """Classify each glyph in a binarized crop against the 10 digit templates
+    
+    Returns one digit per glyph, left to right, or -1 for a glyph that
+    matches no template closely enough.
+    """
+    height, width = binary.shape
+    template_height = templates.shape[1]
+    template_width = templates.shape[2]
+    
+    # Text may be light-on-dark or dark-on-light; treat the minority as ink
+    lit = 0
+    for y in range(height):
+        for x in range(width):
+            if binary[y, x] > 127:
+                lit += 1
+    ink_is_lit = lit * 2 <= height * width
+    
+    ink = np.empty((height, width), dtype=np.bool_)
+    for y in range(height):
+        for x in range(width):
+            ink[y, x] = (binary[y, x] > 127) == ink_is_lit
+    
+    spans = _glyph_spans(ink)
+    digits = np.empty(spans.shape[0], dtype=np.int64)
+    glyph = np.empty((template_height, template_width), dtype=np.int32)
+    max_error = MAX_GLYPH_MISMATCH * template_height * template_width
+    
+    for i in range(spans.shape[0]):
+        x1, x2, y1, y2 = spans[i, 0], spans[i, 1], spans[i, 2], spans[i, 3]
+        
+        # Nearest-neighbour scale of the glyph box onto the template grid
+        for ty in range(template_height):
+            sy = y1 + (ty * (y2 - y1)) // template_height
+            for tx in range(template_width):
+                sx = x1 + (tx * (x2 - x1)) // template_width
+                glyph[ty, tx] = 255 if ink[sy, sx] else 0
+        
+        best_digit = -1
+        best_error = max_error
+        for digit in range(templates.shape[0]):
+            error = 0
+            for ty in range(template_height):
+                for tx in range(template_width):
+                    error += abs(glyph[ty, tx] - np.int32(templates[digit, ty, tx]))
+            if error < best_error:
+                best_error = error
+                best_digit = digit
+        digits[i] = best_digit
+    
+    return digits
+
+@njit(cache=True)
+def _otsu_binarize(gray: np.ndarray) -> np.ndarray:
+    """Threshold at Otsu's level, matching cv2.THRESH_BINARY + cv2.THRESH_OTSU"""
+    height, width = gray.shape
+    histogram = np.zeros(256, dtype=np.int64)
+    for y in range(height):
+        for x in range(width):
+            histogram[gray[y, x]] += 1
+    
+    total = height * width
+    total_sum = 0.0
+    for level in range(256):
+        total_sum += level * histogram[level]
+    
+    # Pick the split that maximizes the between-class variance
+    background_weight = 0
+    background_sum = 0.0
+    best_variance = -1.0
+    threshold = 0
+    for level in range(256):
+        background_weight += histogram[level]
+        if background_weight == 0:
+            continue
+        foreground_weight = total - background_weight
+        if foreground_weight == 0:
+            break
+        background_sum += level * histogram[level]
+        background_mean = background_sum / background_weight
+        foreground_mean = (total_sum - background_sum) / foreground_weight
+        variance = background_weight * foreground_weight * (background_mean - foreground_mean) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            threshold = level
+    
+    binary = np.empty((height, width), dtype=np.uint8)
+    for y in range(height):
+        for x in range(width):
+            binary[y, x] = 255 if gray[y, x] > threshold else 0
+    return binary
+
+@njit(cache=True)
+def ocr_power_score(bgra: np.ndarray, templates: np.ndarray) -> int:
+    """Read a power score straight from a BGR(A) crop: grayscale, Otsu and template match in one pass
+    
+    Returns -1 when the crop holds no digits or any glyph is unrecognised.
+    """
+    height, width = bgra.shape[0], bgra.shape[1]
+    gray = np.empty((height, width), dtype=np.uint8)
+    for y in range(height):
+        for x in range(width):
+            # Same luminance weights as cv2.COLOR_BGR2GRAY
+            gray[y, x] = np.uint8(0.114 * bgra[y, x, 0] + 0.587 * bgra[y, x, 1] + 0.299 * bgra[y, x, 2] + 0.5)
+    
+    digits = classify_digits(_otsu_binarize(gray), templates)
+    if digits.shape[0] == 0:
+        return -1
+    
+    score = 0
+    for digit in digits:
+        if digit < 0:
+            return -1
+        score = score * 10 + digit
+    return score
+
+def build_digit_templates(binary: np.ndarray, digits: str, size: tuple = (16, 10)) -> np.ndarray:
+    """Cut digit templates from a calibration crop showing the given digits
+    
+    The crop must contain every digit 0-9 at least once (e.g. two captures of
+    scores joined side by side); the first occurrence of each digit is used.
+    """
+    template_height, template_width = size
+    ink = binary > 127
+    if ink.sum() * 2 > ink.size:
+        ink = ~ink
+    
+    spans = _glyph_spans(ink)
+    if len(spans) != len(digits):
+        raise ValueError(f"Found {len(spans)} glyphs but expected {len(digits)} for '{digits}'")
+    
+    templates = np.zeros((10, template_height, template_width), dtype=np.uint8)
+    seen = set()
+    for (x1, x2, y1, y2), digit_char in zip(spans, digits):
+        digit = int(digit_char)
+        if digit in seen:
+            continue
+        rows = y1 + (np.arange(template_height) * (y2 - y1)) // template_height
+        cols = x1 + (np.arange(template_width) * (x2 - x1)) // template_width
+        templates[digit] = ink[np.ix_(rows, cols)] * np.uint8(255)
+        seen.add(digit)
+    
+    missing = sorted(set(range(10)) - seen)
+    if missing:
+        raise ValueError(f"Calibration crop is missing digits {missing}")
+    return templates
+
+def join_calibration_crops(binaries: List[np.ndarray]) -> np.ndarray:
+    """Lay binarized crops side by side as one light-on-dark calibration strip
+    
+    Each crop is flipped to light ink first and followed by a blank column,
+    so glyphs from neighbouring crops never merge.
+    """
+    height = max(binary.shape[0] for binary in binaries)
+    pieces = []
+    for binary in binaries:
+        ink = binary > 127
+        if ink.sum() * 2 > ink.size:
+            ink = ~ink
+        piece = np.zeros((height, binary.shape[1] + 1), dtype=np.uint8)
+        piece[:binary.shape[0], :binary.shape[1]] = ink * np.uint8(255)
+        pieces.append(piece)
+    return np.hstack(pieces)
+
+_templates_cache = {}
+
+def save_digit_templates(templates: np.ndarray, path: str = DIGIT_TEMPLATES_PATH):
+    """Store calibrated templates where the OCR coordinator looks for them"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.save(path, templates)
+    _templates_cache[path] = templates
+
+def load_digit_templates(path: str = DIGIT_TEMPLATES_PATH) -> Optional[np.ndarray]:
+    """Load calibrated templates once per process, or None if not calibrated yet"""
+    if path not in _templates_cache:
+        try:
+            templates = np.load(path)
+        except (FileNotFoundError, ValueError):
+            templates = None
+        if templates is not None and (templates.ndim != 3 or templates.shape[0] != 10):
+            templates = None
+        _templates_cache[path] = templates
+    return _templates_cache[path]
@@ -535,9 +535,9 @@ class HarrisonEnhancedDashboard:
             # Harrison's status display
             st.markdown(f"**{status_text}**")
             
-            # Enhanced: Instrument tags
-            for instrument in chart_data.instruments:
-                st.markdown(f'<span class="instrument-tag">{instrument}</span>', unsafe_allow_html=True)
+            # Enhanced: Instrument tags, sent as one element rather than one per tag
+            st.markdown("".join(f'<span class="instrument-tag">{instrument}</span>'
+                                for instrument in chart_data.instruments), unsafe_allow_html=True)
             
             # Harrison's metrics layout
             col1, col2 = st.columns(2)
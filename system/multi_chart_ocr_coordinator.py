@@ -5,26 +5,214 @@ Designed for Michael's 6-chart trading setup
 """
 
 import os
+
+# Each Tesseract would otherwise start its own OpenMP team; OCR parallelism
+# comes from the process pool instead
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+import hashlib
 import cv2
+import mss
 import numpy as np
 import pytesseract
-from PIL import Image, ImageGrab
 import json
+import sys
 import time
 import asyncio
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from typing import Dict, List, Optional, Tuple
 import logging
 from enigma_config import OCR_ACTIVATION_PIXEL_THRESHOLD
 
+try:
+    from .digits_kernel import (build_digit_templates, join_calibration_crops, load_digit_templates,
+                                ocr_power_score, save_digit_templates)
+except ImportError:
+    from digits_kernel import (build_digit_templates, join_calibration_crops, load_digit_templates,
+                               ocr_power_score, save_digit_templates)
+
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+except ImportError:
+    PyTessBaseAPI = None  # fall back to the pytesseract subprocess per read
+
 # Configure OCR path — override with TESSERACT_CMD env var if Tesseract is installed elsewhere
 pytesseract.pytesseract.tesseract_cmd = os.environ.get(
     'TESSERACT_CMD', r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 )
 
-@dataclass
+# Signal colour HSV ranges, one row per colour in SIGNAL_COLOR_NAMES order
+SIGNAL_COLOR_NAMES = ("GREEN", "RED", "BLUE", "PINK")
+SIGNAL_COLOR_LOWER = np.array([[40, 50, 50], [0, 50, 50], [100, 50, 50], [140, 50, 50]], dtype=np.uint8)
+SIGNAL_COLOR_UPPER = np.array([[80, 255, 255], [10, 255, 255], [130, 255, 255], [170, 255, 255]], dtype=np.uint8)
+SIGNAL_COLOR_MIN_PIXELS = 200  # Minimum matching pixels for a colour to count
+
+# Colour checks only need "enough of this colour", so they run on regions
+# shrunk by this factor per axis; pixel thresholds shrink by its square
+COLOR_DOWNSAMPLE = 4
+
+# Between bars a chart panel is pixel-identical, so each tick first compares a
+# thumbnail of the panel with the last one that was fully read
+PANEL_THUMBNAIL_SIZE = (100, 75)  # (width, height)
+PANEL_CHANGE_THRESHOLD = 500  # Summed absolute thumbnail difference that counts as a change
+
+def _panel_thumbnail(panel: np.ndarray) -> np.ndarray:
+    """Shrink a chart panel for the cheap unchanged-since-last-read check"""
+    return cv2.resize(panel, PANEL_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+
+# Valid signals are kept in memory (one hour at one read per second) and
+# appended to the audit file in batches instead of logged on every read
+SIGNAL_AUDIT_PATH = "logs/chart_signal_audit.jsonl"
+SIGNAL_AUDIT_MAXLEN = 3600
+SIGNAL_AUDIT_FLUSH_SECONDS = 10
+
+MONITOR_PERIOD_SECONDS = 1.0  # Read every chart once per period
+MONITOR_ERROR_BACKOFF_SECONDS = 5.0
+
+# Per-thread scratch arrays passed to OpenCV as dst= so region reads reuse
+# the same memory every tick instead of allocating fresh arrays
+_scratch_local = threading.local()
+
+def _scratch(name: str, shape: Tuple[int, ...]) -> np.ndarray:
+    """Return this thread's reusable uint8 buffer for name at the given shape"""
+    buffers = getattr(_scratch_local, "buffers", None)
+    if buffers is None:
+        buffers = _scratch_local.buffers = {}
+    
+    key = (name, shape)
+    buffer = buffers.get(key)
+    if buffer is None:
+        buffer = buffers[key] = np.empty(shape, dtype=np.uint8)
+    return buffer
+
+def _downsample(image_np: np.ndarray) -> np.ndarray:
+    """Shrink a region for colour analysis, averaging pixel blocks"""
+    height, width = image_np.shape[:2]
+    size = (max(1, width // COLOR_DOWNSAMPLE), max(1, height // COLOR_DOWNSAMPLE))
+    small = _scratch("small", (size[1], size[0]) + image_np.shape[2:])
+    return cv2.resize(image_np, size, dst=small, interpolation=cv2.INTER_AREA)
+
+def _to_hsv(image_np: np.ndarray) -> np.ndarray:
+    """Convert a BGRA region to HSV in a reused buffer (OpenCV ignores the alpha channel)"""
+    return cv2.cvtColor(image_np, cv2.COLOR_BGR2HSV, dst=_scratch("hsv", image_np.shape[:2] + (3,)))
+
+def _scaled_pixel_threshold(full_resolution_pixels: int) -> int:
+    """Convert a full-resolution pixel-count threshold to the downsampled grid"""
+    return full_resolution_pixels // (COLOR_DOWNSAMPLE * COLOR_DOWNSAMPLE)
+
+# mss handles are bound to the thread that opened them, so keep one per thread
+_grabber_local = threading.local()
+
+def _screen_grabber():
+    """Return this thread's persistent mss screenshot handle"""
+    grabber = getattr(_grabber_local, "sct", None)
+    if grabber is None:
+        grabber = _grabber_local.sct = mss.mss()
+    return grabber
+
+def _grab_bgra(bbox: Tuple[int, int, int, int]) -> np.ndarray:
+    """Grab a screen box as a BGRA array viewing mss's pixel buffer, without a copy"""
+    shot = _screen_grabber().grab(bbox)
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+# A loaded Tesseract model is not thread-safe, so each thread keeps its own
+_tesseract_local = threading.local()
+
+def _tesseract_api():
+    """Return this thread's persistent digits-only Tesseract API, or None without tesserocr"""
+    if PyTessBaseAPI is None:
+        return None
+    
+    api = getattr(_tesseract_local, "api", None)
+    if api is None:
+        options = {"psm": PSM.SINGLE_WORD, "oem": OEM.DEFAULT}
+        if "TESSDATA_PREFIX" in os.environ:
+            options["path"] = os.environ["TESSDATA_PREFIX"]
+        api = _tesseract_local.api = PyTessBaseAPI(**options)
+        api.SetVariable("tessedit_char_whitelist", "0123456789")
+    return api
+
+def _read_digits(binary: np.ndarray) -> str:
+    """OCR a binarized single-number crop"""
+    api = _tesseract_api()
+    if api is not None:
+        # Hand Tesseract the raw 8-bit rows directly, with no PIL image in between
+        binary = np.ascontiguousarray(binary)
+        height, width = binary.shape
+        api.SetImageBytes(binary.tobytes(), width, height, 1, width)
+        return api.GetUTF8Text().strip()
+    
+    # OCR configuration for numbers
+    custom_config = r'--oem 3 --psm 8 -c tessedit_char_whitelist=0123456789'
+    return pytesseract.image_to_string(binary, config=custom_config).strip()
+
+def _power_score_text(image_np: np.ndarray) -> str:
+    """Binarize a power-score crop and OCR its digits (runs in OCR pool workers)"""
+    # Calibrated digit templates read the fixed AlgoBox font in one compiled
+    # pass; Tesseract only runs when they are missing or a glyph doesn't match
+    templates = load_digit_templates()
+    if templates is not None:
+        score = ocr_power_score(np.ascontiguousarray(image_np), templates)
+        if score >= 0:
+            return str(score)
+    
+    # Preprocess image for better OCR
+    gray = cv2.cvtColor(image_np, cv2.COLOR_BGRA2GRAY, dst=_scratch("gray", image_np.shape[:2]))
+    
+    # Apply thresholding for better text recognition
+    _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU,
+                              dst=_scratch("thresh", gray.shape))
+    
+    return _read_digits(thresh)
+
+def _init_ocr_worker():
+    """Load the Tesseract model once when an OCR pool worker starts"""
+    _tesseract_api()
+
+class RegionResultCache:
+    """Bounded LRU of region read results keyed on a hash of the region's pixels
+    
+    Chart panels are pixel-identical between most ticks, so a hit skips OCR
+    and colour analysis entirely.
+    """
+    
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, object]" = OrderedDict()
+        self._lock = threading.Lock()  # shared by every monitoring thread
+    
+    @staticmethod
+    def key_for(kind: str, pixels: np.ndarray) -> bytes:
+        """Hash a region's pixels together with what is being read from them"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{kind}:{pixels.shape}".encode())
+        digest.update(np.ascontiguousarray(pixels).data)
+        return digest.digest()
+    
+    def get(self, key: bytes):
+        """Return the cached result for key, or None"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+    
+    def put(self, key: bytes, result):
+        """Store a result, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+# Offset that turns time.monotonic_ns() readings into wall-clock epoch nanoseconds
+_WALL_CLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+@dataclass(slots=True, frozen=True)
 class ChartSignal:
     """Signal data from individual chart"""
     chart_id: int
@@ -34,10 +222,15 @@ class ChartSignal:
     signal_color: str
     macvu_status: str
     atr_value: float
-    timestamp: datetime
+    timestamp_ns: int  # time.monotonic_ns() when the chart was read
     is_valid: bool
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time the chart was read"""
+        return datetime.fromtimestamp((self.timestamp_ns + _WALL_CLOCK_OFFSET_NS) / 1e9)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChartRegions:
     """Screen regions for individual chart"""
     chart_id: int
@@ -58,9 +251,19 @@ class MultiChartOCRCoordinator:
     def __init__(self, config_path: str = "config/multi_chart_ocr_config.json"):
         self.config_path = config_path
         self.chart_regions: Dict[int, ChartRegions] = {}
+        self.region_bboxes: Dict[int, Dict[str, Tuple[int, int, int, int]]] = {}
+        self.panel_slices: Dict[int, Dict[str, Optional[Tuple[slice, slice]]]] = {}
+        self.union_bbox: Optional[Tuple[int, int, int, int]] = None
+        self.frame_slices: Dict[int, Tuple[slice, slice]] = {}
         self.last_signals: Dict[int, ChartSignal] = {}
+        self._last_panel: Dict[int, np.ndarray] = {}  # Thumbnail behind each chart's last signal
         self.is_monitoring = False
-        self.monitoring_threads: Dict[int, threading.Thread] = {}
+        self._stop_event = threading.Event()  # Set to wake and end the monitoring threads
+        self.monitoring_thread: Optional[threading.Thread] = None
+        self.audit_thread: Optional[threading.Thread] = None
+        self.signal_audit: "deque[Tuple[int, int, ChartSignal]]" = deque(maxlen=SIGNAL_AUDIT_MAXLEN)
+        self.ocr_pool: Optional[ProcessPoolExecutor] = None
+        self.result_cache = RegionResultCache()
         
         # Initialize logging
         logging.basicConfig(level=logging.INFO)
@@ -68,6 +271,7 @@ class MultiChartOCRCoordinator:
         
         # Load or create configuration
         self.load_or_create_config()
+        self.build_region_tables()
         
         # Signal validation thresholds
         self.validation_thresholds = {
@@ -111,235 +315,337 @@ class MultiChartOCRCoordinator:
         # Michael's 6-chart layout assumptions:
         # Assume 3 charts on top row, 3 on bottom row
         # Each chart approximately 400x300 pixels
-        
-        chart_templates = {
-            "1": {
-                "chart_name": "ES-Account-1",
-                "chart_position": "top-left",
-                "base_x": 50, "base_y": 50,
-                "width": 400, "height": 300
-            },
-            "2": {
-                "chart_name": "ES-Account-2", 
-                "chart_position": "top-center",
-                "base_x": 500, "base_y": 50,
-                "width": 400, "height": 300
-            },
-            "3": {
-                "chart_name": "NQ-Account-1",
-                "chart_position": "top-right", 
-                "base_x": 950, "base_y": 50,
-                "width": 400, "height": 300
-            },
-            "4": {
-                "chart_name": "NQ-Account-2",
-                "chart_position": "bottom-left",
-                "base_x": 50, "base_y": 400,
-                "width": 400, "height": 300
-            },
-            "5": {
-                "chart_name": "YM-Account-1",
-                "chart_position": "bottom-center",
-                "base_x": 500, "base_y": 400,
-                "width": 400, "height": 300
-            },
-            "6": {
-                "chart_name": "RTY-Account-1",
-                "chart_position": "bottom-right",
-                "base_x": 950, "base_y": 400,
-                "width": 400, "height": 300
-            }
-        }
+        chart_templates = [
+            # (chart_id, chart_name, chart_position, base_x, base_y)
+            (1, "ES-Account-1", "top-left", 50, 50),
+            (2, "ES-Account-2", "top-center", 500, 50),
+            (3, "NQ-Account-1", "top-right", 950, 50),
+            (4, "NQ-Account-2", "bottom-left", 50, 400),
+            (5, "YM-Account-1", "bottom-center", 500, 400),
+            (6, "RTY-Account-1", "bottom-right", 950, 400)
+        ]
         
         config = {"charts": {}}
         
-        for chart_id, template in chart_templates.items():
-            base_x = template["base_x"]
-            base_y = template["base_y"]
-            
-            # Define relative positions within each chart
-            chart_config = {
-                "chart_name": template["chart_name"],
-                "chart_position": template["chart_position"],
-                "power_score_region": [base_x + 10, base_y + 10, base_x + 80, base_y + 40],
-                "confluence_regions": {
-                    "L1": [base_x + 100, base_y + 10, base_x + 130, base_y + 30],
-                    "L2": [base_x + 100, base_y + 35, base_x + 130, base_y + 55],
-                    "L3": [base_x + 100, base_y + 60, base_x + 130, base_y + 80],
-                    "L4": [base_x + 100, base_y + 85, base_x + 130, base_y + 105]
-                },
-                "signal_color_region": [base_x + 150, base_y + 10, base_x + 220, base_y + 60],
-                "macvu_region": [base_x + 240, base_y + 10, base_x + 310, base_y + 40],
-                "atr_region": [base_x + 320, base_y + 10, base_x + 390, base_y + 40],
-                "full_panel_region": [base_x, base_y, base_x + template["width"], base_y + template["height"]]
-            }
-            
-            config["charts"][chart_id] = chart_config
-            
-            # Create ChartRegions object
-            self.chart_regions[int(chart_id)] = ChartRegions(
-                chart_id=int(chart_id),
-                chart_name=chart_config["chart_name"],
-                power_score_region=chart_config["power_score_region"],
-                confluence_regions=chart_config["confluence_regions"],
-                signal_color_region=chart_config["signal_color_region"],
-                macvu_region=chart_config["macvu_region"],
-                atr_region=chart_config["atr_region"],
-                full_panel_region=chart_config["full_panel_region"]
-            )
+        for chart_id, chart_name, chart_position, base_x, base_y in chart_templates:
+            chart_regions = self._build_regions(chart_id, chart_name, base_x, base_y)
+            self.chart_regions[chart_id] = chart_regions
+            
+            chart_config = asdict(chart_regions)
+            del chart_config["chart_id"]  # Stored as the key
+            chart_config["chart_position"] = chart_position
+            config["charts"][str(chart_id)] = chart_config
         
         # Save template
-        import os
-        os.makedirs("config", exist_ok=True)
+        os.makedirs(os.path.dirname(self.config_path) or ".", exist_ok=True)
         with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+            f.write(json.dumps(config, indent=2))
         
         self.logger.warning(f"📝 Created multi-chart OCR config template at {self.config_path}")
         self.logger.warning("⚠️  Please calibrate screen regions for each of your 6 charts!")
+    
+    @staticmethod
+    def _build_regions(chart_id: int, chart_name: str, base_x: int, base_y: int,
+                       width: int = 400, height: int = 300) -> ChartRegions:
+        """Lay out a chart's regions relative to its top-left corner"""
+        return ChartRegions(
+            chart_id=chart_id,
+            chart_name=chart_name,
+            power_score_region=[base_x + 10, base_y + 10, base_x + 80, base_y + 40],
+            confluence_regions={
+                "L1": [base_x + 100, base_y + 10, base_x + 130, base_y + 30],
+                "L2": [base_x + 100, base_y + 35, base_x + 130, base_y + 55],
+                "L3": [base_x + 100, base_y + 60, base_x + 130, base_y + 80],
+                "L4": [base_x + 100, base_y + 85, base_x + 130, base_y + 105]
+            },
+            signal_color_region=[base_x + 150, base_y + 10, base_x + 220, base_y + 60],
+            macvu_region=[base_x + 240, base_y + 10, base_x + 310, base_y + 40],
+            atr_region=[base_x + 320, base_y + 10, base_x + 390, base_y + 40],
+            full_panel_region=[base_x, base_y, base_x + width, base_y + height]
+        )
+        
+    def build_region_tables(self):
+        """Precompute every region's bbox and its slice within the chart panel"""
+        self.region_bboxes.clear()
+        self.panel_slices.clear()
         
-    def capture_chart_region(self, chart_id: int, region_name: str) -> Optional[Image.Image]:
+        for chart_id, chart_regions in self.chart_regions.items():
+            bboxes = {
+                "power_score": tuple(chart_regions.power_score_region),
+                "signal_color": tuple(chart_regions.signal_color_region),
+                "macvu": tuple(chart_regions.macvu_region),
+                "atr": tuple(chart_regions.atr_region),
+                "full_panel": tuple(chart_regions.full_panel_region)
+            }
+            for level, region in chart_regions.confluence_regions.items():
+                bboxes[f"confluence_{level.lower()}"] = tuple(region)
+            
+            panel_x, panel_y, panel_x2, panel_y2 = bboxes["full_panel"]
+            slices = {}
+            for region_name, (x1, y1, x2, y2) in bboxes.items():
+                if panel_x <= x1 < x2 <= panel_x2 and panel_y <= y1 < y2 <= panel_y2:
+                    slices[region_name] = (slice(y1 - panel_y, y2 - panel_y), slice(x1 - panel_x, x2 - panel_x))
+                else:
+                    slices[region_name] = None  # Outside the panel, grabbed on its own
+            
+            self.region_bboxes[chart_id] = bboxes
+            self.panel_slices[chart_id] = slices
+        
+        # One grab covering every chart panel; each panel is then a view into it
+        self.union_bbox = None
+        self.frame_slices = {}
+        panels = {chart_id: bboxes["full_panel"] for chart_id, bboxes in self.region_bboxes.items()}
+        if panels:
+            self.union_bbox = (min(b[0] for b in panels.values()), min(b[1] for b in panels.values()),
+                               max(b[2] for b in panels.values()), max(b[3] for b in panels.values()))
+            union_x, union_y = self.union_bbox[:2]
+            for chart_id, (x1, y1, x2, y2) in panels.items():
+                self.frame_slices[chart_id] = (slice(y1 - union_y, y2 - union_y), slice(x1 - union_x, x2 - union_x))
+    
+    def capture_chart_region(self, chart_id: int, region_name: str) -> Optional[np.ndarray]:
         """Capture specific region from specific chart"""
-        if chart_id not in self.chart_regions:
+        if chart_id not in self.region_bboxes:
             self.logger.error(f"❌ Chart {chart_id} not found in configuration")
             return None
             
-        chart_regions = self.chart_regions[chart_id]
+        bbox = self.region_bboxes[chart_id].get(region_name)
+        if bbox is None:
+            self.logger.error(f"❌ Unknown region '{region_name}'")
+            return None
         
         try:
-            if region_name == "power_score":
-                bbox = tuple(chart_regions.power_score_region)
-            elif region_name.startswith("confluence_"):
-                level = region_name.split("_")[1].upper()
-                if level in chart_regions.confluence_regions:
-                    bbox = tuple(chart_regions.confluence_regions[level])
-                else:
-                    return None
-            elif region_name == "signal_color":
-                bbox = tuple(chart_regions.signal_color_region)
-            elif region_name == "macvu":
-                bbox = tuple(chart_regions.macvu_region)
-            elif region_name == "atr":
-                bbox = tuple(chart_regions.atr_region)
-            elif region_name == "full_panel":
-                bbox = tuple(chart_regions.full_panel_region)
-            else:
-                self.logger.error(f"❌ Unknown region '{region_name}'")
-                return None
-                
-            screenshot = ImageGrab.grab(bbox=bbox)
-            return screenshot
+            return _grab_bgra(bbox)
             
         except Exception as e:
             self.logger.error(f"❌ Failed to capture region '{region_name}' from chart {chart_id}: {e}")
             return None
     
-    def read_chart_power_score(self, chart_id: int) -> int:
-        """Read power score from specific chart"""
+    def capture_chart_panel(self, chart_id: int) -> Optional[np.ndarray]:
+        """Grab a chart's full panel once as a BGRA array (mss native order) for sub-regions to slice from"""
+        if chart_id not in self.chart_regions:
+            self.logger.error(f"❌ Chart {chart_id} not found in configuration")
+            return None
+        
         try:
-            image = self.capture_chart_region(chart_id, "power_score")
-            if image is None:
-                return 0
-            
-            # Preprocess image for better OCR
-            image_np = np.array(image)
-            gray = cv2.cvtColor(image_np, cv2.COLOR_RGB2GRAY)
-            
-            # Apply thresholding for better text recognition
-            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            bbox = self.region_bboxes[chart_id]["full_panel"]
+            return _grab_bgra(bbox)
             
-            # OCR configuration for numbers
-            custom_config = r'--oem 3 --psm 8 -c tessedit_char_whitelist=0123456789'
-            text = pytesseract.image_to_string(thresh, config=custom_config).strip()
-            
-            # Parse and validate
-            if text.isdigit():
-                power_score = int(text)
-                if self.validation_thresholds["power_score_min"] <= power_score <= self.validation_thresholds["power_score_max"]:
-                    return power_score
+        except Exception as e:
+            self.logger.error(f"❌ Failed to capture panel from chart {chart_id}: {e}")
+            return None
+    
+    def capture_all_panels(self) -> Dict[int, Optional[np.ndarray]]:
+        """Grab every chart panel with a single screen copy of their bounding box"""
+        if self.union_bbox is None:
+            return {}
+        
+        try:
+            frame = _grab_bgra(self.union_bbox)
+        except Exception as e:
+            self.logger.error(f"❌ Failed to capture chart panels: {e}")
+            return {chart_id: None for chart_id in self.chart_regions}
+        
+        return {chart_id: frame[frame_slice] for chart_id, frame_slice in self.frame_slices.items()}
+    
+    def crop_panel_region(self, chart_id: int, panel: np.ndarray, region_name: str) -> Optional[np.ndarray]:
+        """Slice a named sub-region out of a captured panel, grabbing it directly if it lies outside"""
+        region_slice = self.panel_slices[chart_id].get(region_name)
+        if region_slice is not None:
+            return panel[region_slice]
+        
+        bbox = self.region_bboxes[chart_id].get(region_name)
+        if bbox is None:
+            return None
+        
+        try:
+            return _grab_bgra(bbox)
+        except Exception as e:
+            self.logger.error(f"❌ Failed to capture region '{region_name}' from chart {chart_id}: {e}")
+            return None
+    
+    def read_chart_power_score(self, chart_id: int, panel: Optional[np.ndarray] = None) -> int:
+        """Read power score from specific chart"""
+        if panel is None:
+            panel = self.capture_chart_panel(chart_id)
+            if panel is None:
+                return 0
+        
+        return self.request_power_score(chart_id, panel).result()
+    
+    def request_power_score(self, chart_id: int, panel: np.ndarray) -> "Future[int]":
+        """Start reading a chart's power score, in the OCR pool when monitoring
+        
+        The returned future always resolves to a score, 0 when unreadable.
+        """
+        result: "Future[int]" = Future()
+        
+        try:
+            image_np = self.crop_panel_region(chart_id, panel, "power_score")
+            if image_np is None:
+                result.set_result(0)
+                return result
+            
+            cache_key = self.result_cache.key_for("power_score", image_np)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                result.set_result(cached)
+                return result
+            
+            def finish(text: str):
+                power_score = self.parse_power_score(text)
+                self.result_cache.put(cache_key, power_score)
+                result.set_result(power_score)
+            
+            if self.ocr_pool is None:
+                finish(_power_score_text(image_np))
+                return result
+            
+            def on_ocr_done(ocr: Future):
+                try:
+                    finish(ocr.result())
+                except Exception as e:
+                    self.logger.error(f"❌ Failed to read power score from chart {chart_id}: {e}")
+                    result.set_result(0)
             
-            return 0
+            self.ocr_pool.submit(_power_score_text, image_np).add_done_callback(on_ocr_done)
             
         except Exception as e:
             self.logger.error(f"❌ Failed to read power score from chart {chart_id}: {e}")
-            return 0
+            if not result.done():
+                result.set_result(0)
+            
+        return result
     
-    def detect_chart_confluence_level(self, chart_id: int) -> str:
+    def parse_power_score(self, text: str) -> int:
+        """Validate OCR text as a power score, returning 0 for unreadable or out-of-range values"""
+        if text.isdigit():
+            power_score = int(text)
+            if self.validation_thresholds["power_score_min"] <= power_score <= self.validation_thresholds["power_score_max"]:
+                return power_score
+        
+        return 0
+    
+    def detect_chart_confluence_level(self, chart_id: int, panel: Optional[np.ndarray] = None) -> str:
         """Detect active confluence level for specific chart"""
         try:
-            confluence_levels = ["L1", "L2", "L3", "L4"]
-            active_level = "L0"  # Default
+            if panel is None:
+                panel = self.capture_chart_panel(chart_id)
+                if panel is None:
+                    return "L0"
+            
+            # The highest active level wins, so scan from the top and stop at the first
+            confluence_levels = ["L4", "L3", "L2", "L1"]
             
             for level in confluence_levels:
-                image = self.capture_chart_region(chart_id, f"confluence_{level.lower()}")
+                image_np = self.crop_panel_region(chart_id, panel, f"confluence_{level.lower()}")
                 
-                if image is None:
+                if image_np is None:
                     continue
                 
-                # Convert to numpy array for color analysis
-                image_np = np.array(image)
-                
-                # Check for green color (active state)
-                hsv = cv2.cvtColor(image_np, cv2.COLOR_RGB2HSV)
-                green_lower = np.array([40, 50, 50])
-                green_upper = np.array([80, 255, 255])
-                green_mask = cv2.inRange(hsv, green_lower, green_upper)
+                cache_key = self.result_cache.key_for("confluence", image_np)
+                is_active = self.result_cache.get(cache_key)
+                if is_active is None:
+                    # Check for green color (active state)
+                    hsv = _to_hsv(_downsample(image_np))
+                    hue, saturation, value = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+                    
+                    # Green is hue 40-80 with S and V >= 50; the uint8 upper bounds of 255 always hold
+                    green_pixels = np.count_nonzero((hue >= 40) & (hue <= 80) & (saturation >= 50) & (value >= 50))
+                    
+                    # If green pixels found, this level is active
+                    is_active = green_pixels > _scaled_pixel_threshold(OCR_ACTIVATION_PIXEL_THRESHOLD)
+                    self.result_cache.put(cache_key, is_active)
                 
-                # If green pixels found, this level is active
-                if np.sum(green_mask) > OCR_ACTIVATION_PIXEL_THRESHOLD:
-                    active_level = level
+                if is_active:
+                    return level
             
-            return active_level
+            return "L0"  # Default
             
         except Exception as e:
             self.logger.error(f"❌ Failed to detect confluence level for chart {chart_id}: {e}")
             return "L0"
     
-    def detect_chart_signal_color(self, chart_id: int) -> str:
+    def detect_chart_signal_color(self, chart_id: int, panel: Optional[np.ndarray] = None) -> str:
         """Detect signal color for specific chart"""
         try:
-            image = self.capture_chart_region(chart_id, "signal_color")
-            if image is None:
+            if panel is None:
+                panel = self.capture_chart_panel(chart_id)
+                if panel is None:
+                    return "NONE"
+            
+            image_np = self.crop_panel_region(chart_id, panel, "signal_color")
+            if image_np is None:
                 return "NONE"
             
-            image_np = np.array(image)
-            hsv = cv2.cvtColor(image_np, cv2.COLOR_RGB2HSV)
+            cache_key = self.result_cache.key_for("signal_color", image_np)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Define color ranges
-            color_ranges = {
-                "GREEN": ([40, 50, 50], [80, 255, 255]),
-                "RED": ([0, 50, 50], [10, 255, 255]),
-                "BLUE": ([100, 50, 50], [130, 255, 255]),
-                "PINK": ([140, 50, 50], [170, 255, 255])
-            }
+            hsv = _to_hsv(_downsample(image_np)).reshape(-1, 1, 3)
             
-            max_pixels = 0
-            detected_color = "NONE"
+            # Test every pixel against all colour ranges in one pass
+            in_range = ((hsv >= SIGNAL_COLOR_LOWER) & (hsv <= SIGNAL_COLOR_UPPER)).all(axis=2)
+            pixel_counts = np.count_nonzero(in_range, axis=0)
             
-            for color_name, (lower, upper) in color_ranges.items():
-                lower_np = np.array(lower)
-                upper_np = np.array(upper)
-                mask = cv2.inRange(hsv, lower_np, upper_np)
-                pixel_count = np.sum(mask)
-                
-                if pixel_count > max_pixels and pixel_count > 200:  # Minimum threshold
-                    max_pixels = pixel_count
-                    detected_color = color_name
+            best = int(np.argmax(pixel_counts))
+            if pixel_counts[best] > _scaled_pixel_threshold(SIGNAL_COLOR_MIN_PIXELS):
+                detected_color = SIGNAL_COLOR_NAMES[best]
+            else:
+                detected_color = "NONE"
             
+            self.result_cache.put(cache_key, detected_color)
             return detected_color
             
         except Exception as e:
             self.logger.error(f"❌ Failed to detect signal color for chart {chart_id}: {e}")
             return "NONE"
     
-    def read_chart_signals(self, chart_id: int) -> ChartSignal:
+    def panel_changed(self, chart_id: int, thumbnail: np.ndarray) -> bool:
+        """Check whether a chart's panel differs from the one behind its last signal"""
+        last_thumbnail = self._last_panel.get(chart_id)
+        if last_thumbnail is None or chart_id not in self.last_signals:
+            return True
+        
+        # cv2.norm with NORM_L1 is the sum of absolute differences
+        return cv2.norm(thumbnail, last_thumbnail, cv2.NORM_L1) >= PANEL_CHANGE_THRESHOLD
+    
+    def unchanged_panel_signal(self, chart_id: int, thumbnail: np.ndarray) -> Optional[ChartSignal]:
+        """Return the chart's last signal, re-stamped, if its panel hasn't changed since"""
+        if self.panel_changed(chart_id, thumbnail):
+            return None
+        
+        signal = replace(self.last_signals[chart_id], timestamp_ns=time.monotonic_ns())
+        self.last_signals[chart_id] = signal
+        return signal
+    
+    def read_chart_signals(self, chart_id: int, panel: Optional[np.ndarray] = None,
+                           power_score_request: Optional["Future[int]"] = None,
+                           thumbnail: Optional[np.ndarray] = None) -> ChartSignal:
         """Read all signals from specific chart"""
         try:
             chart_regions = self.chart_regions[chart_id]
             
-            # Read individual components
-            power_score = self.read_chart_power_score(chart_id)
-            confluence_level = self.detect_chart_confluence_level(chart_id)
-            signal_color = self.detect_chart_signal_color(chart_id)
+            # One screen grab per chart; every component slices from it
+            if panel is None:
+                panel = self.capture_chart_panel(chart_id)
+                if panel is None:
+                    raise RuntimeError("panel capture failed")
+            
+            # Skip every OCR and colour read while the panel is unchanged
+            if thumbnail is None:
+                thumbnail = _panel_thumbnail(panel)
+            unchanged = self.unchanged_panel_signal(chart_id, thumbnail)
+            if unchanged is not None:
+                return unchanged
+            
+            if power_score_request is None:
+                power_score_request = self.request_power_score(chart_id, panel)
+            
+            # Colour reads run here while the power-score OCR runs in the pool
+            confluence_level = self.detect_chart_confluence_level(chart_id, panel)
+            signal_color = self.detect_chart_signal_color(chart_id, panel)
+            power_score = power_score_request.result()
             
             # For now, simulate MACVU and ATR (can be implemented later)
             macvu_status = "GREEN"  # Simulated
@@ -360,72 +666,157 @@ class MultiChartOCRCoordinator:
                 signal_color=signal_color,
                 macvu_status=macvu_status,
                 atr_value=atr_value,
-                timestamp=datetime.now(),
+                timestamp_ns=time.monotonic_ns(),
                 is_valid=is_valid
             )
             
             self.last_signals[chart_id] = signal
+            self._last_panel[chart_id] = thumbnail
             return signal
             
         except Exception as e:
             self.logger.error(f"❌ Failed to read signals from chart {chart_id}: {e}")
-            return ChartSignal(chart_id, f"Chart-{chart_id}", 0, "L0", "NONE", "NONE", 0.0, datetime.now(), False)
+            return ChartSignal(chart_id, f"Chart-{chart_id}", 0, "L0", "NONE", "NONE", 0.0, time.monotonic_ns(), False)
     
     def read_all_charts(self) -> Dict[int, ChartSignal]:
         """Read signals from all 6 charts simultaneously"""
-        signals = {}
+        panels, thumbnails, power_score_requests = self.queue_chart_reads()
         
-        for chart_id in self.chart_regions.keys():
-            signal = self.read_chart_signals(chart_id)
-            signals[chart_id] = signal
-            
-        return signals
+        return {
+            chart_id: self.read_chart_signals(chart_id, panels.get(chart_id), power_score_requests.get(chart_id),
+                                              thumbnails.get(chart_id))
+            for chart_id in self.chart_regions
+        }
     
-    def start_monitoring_chart(self, chart_id: int):
-        """Start monitoring specific chart in separate thread"""
-        def monitor_loop():
-            self.logger.info(f"🔍 Started monitoring Chart {chart_id} ({self.chart_regions[chart_id].chart_name})")
-            
-            while self.is_monitoring:
-                try:
-                    signal = self.read_chart_signals(chart_id)
-                    
+    async def read_all_charts_async(self) -> Dict[int, ChartSignal]:
+        """Read signals from all 6 charts without blocking the event loop on OCR"""
+        panels, thumbnails, power_score_requests = self.queue_chart_reads()
+        
+        # Let the loop keep serving other tasks while the pool reads the scores
+        await asyncio.gather(*(asyncio.wrap_future(request) for request in power_score_requests.values()))
+        
+        return {
+            chart_id: self.read_chart_signals(chart_id, panels.get(chart_id), power_score_requests.get(chart_id),
+                                              thumbnails.get(chart_id))
+            for chart_id in self.chart_regions
+        }
+    
+    def queue_chart_reads(self) -> Tuple[Dict[int, Optional[np.ndarray]], Dict[int, np.ndarray], Dict[int, "Future[int]"]]:
+        """Capture every panel and start the power-score OCR for each chart that changed"""
+        panels = self.capture_all_panels()
+        thumbnails = {
+            chart_id: _panel_thumbnail(panel)
+            for chart_id, panel in panels.items() if panel is not None
+        }
+        
+        # Queue every changed chart's power-score OCR before any colour work so the pool runs them in parallel
+        power_score_requests = {
+            chart_id: self.request_power_score(chart_id, panels[chart_id])
+            for chart_id, thumbnail in thumbnails.items() if self.panel_changed(chart_id, thumbnail)
+        }
+        
+        return panels, thumbnails, power_score_requests
+    
+    def monitor_loop(self):
+        """Read every chart once a second until monitoring stops"""
+        # Reads are scheduled against fixed deadlines so the cadence doesn't
+        # stretch by however long each read took
+        next_deadline = time.monotonic() + MONITOR_PERIOD_SECONDS
+        
+        while not self._stop_event.is_set():
+            try:
+                signals = self.read_all_charts()
+                
+                log_signals = self.logger.isEnabledFor(logging.DEBUG)
+                for chart_id, signal in signals.items():
                     if signal.is_valid:
-                        self.logger.info(f"📊 Chart {chart_id}: Power={signal.power_score}%, "
-                                       f"Level={signal.confluence_level}, Color={signal.signal_color}")
-                    
-                    time.sleep(1)  # Read every second
-                    
-                except Exception as e:
-                    self.logger.error(f"❌ Monitoring error for Chart {chart_id}: {e}")
-                    time.sleep(5)  # Wait longer on error
-                    
-            self.logger.info(f"🛑 Stopped monitoring Chart {chart_id}")
+                        self.signal_audit.append((signal.timestamp_ns, chart_id, signal))
+                        if log_signals:
+                            self.logger.debug("📊 Chart %d: Power=%d%%, Level=%s, Color=%s", chart_id,
+                                              signal.power_score, signal.confluence_level, signal.signal_color)
+                
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+                    next_deadline += MONITOR_PERIOD_SECONDS
+                else:
+                    # Running behind: start the next read now rather than bursting to catch up
+                    next_deadline = time.monotonic() + MONITOR_PERIOD_SECONDS
+                
+            except Exception as e:
+                self.logger.error(f"❌ Monitoring error: {e}")
+                self._stop_event.wait(MONITOR_ERROR_BACKOFF_SECONDS)  # Wait longer on error
+                next_deadline = time.monotonic() + MONITOR_PERIOD_SECONDS
+                
+        self.logger.info("🛑 Monitoring loop stopped")
+    
+    def audit_loop(self):
+        """Write buffered signals to the audit file every few seconds while monitoring"""
+        while not self._stop_event.wait(SIGNAL_AUDIT_FLUSH_SECONDS):
+            self.flush_signal_audit()
+    
+    def flush_signal_audit(self):
+        """Append every buffered signal to the audit file"""
+        records = []
+        while True:
+            try:
+                _, _, signal = self.signal_audit.popleft()
+            except IndexError:
+                break
+            record = asdict(signal)
+            record["timestamp"] = signal.timestamp.isoformat()
+            records.append(json.dumps(record))
+        
+        if not records:
+            return
         
-        thread = threading.Thread(target=monitor_loop)
-        thread.daemon = True
-        thread.start()
-        self.monitoring_threads[chart_id] = thread
+        try:
+            os.makedirs(os.path.dirname(SIGNAL_AUDIT_PATH), exist_ok=True)
+            with open(SIGNAL_AUDIT_PATH, 'a') as f:
+                f.write("\n".join(records) + "\n")
+        except OSError as e:
+            self.logger.error(f"❌ Failed to write signal audit: {e}")
     
     def start_monitoring_all_charts(self):
         """Start monitoring all 6 charts simultaneously"""
+        if self.is_monitoring:
+            return
+        
         self.is_monitoring = True
+        self._stop_event.clear()
+        
+        # One OCR process per chart keeps Tesseract off the GIL and out of each other's way
+        if self.ocr_pool is None:
+            self.ocr_pool = ProcessPoolExecutor(max_workers=max(1, min(len(self.chart_regions), os.cpu_count() or 1)),
+                                                initializer=_init_ocr_worker)
         
-        for chart_id in self.chart_regions.keys():
-            self.start_monitoring_chart(chart_id)
+        self.monitoring_thread = threading.Thread(target=self.monitor_loop)
+        self.monitoring_thread.daemon = True
+        self.monitoring_thread.start()
+        
+        self.audit_thread = threading.Thread(target=self.audit_loop)
+        self.audit_thread.daemon = True
+        self.audit_thread.start()
             
         self.logger.info(f"🚀 Started monitoring all {len(self.chart_regions)} charts")
     
     def stop_monitoring_all_charts(self):
         """Stop monitoring all charts"""
         self.is_monitoring = False
+        self._stop_event.set()
         
-        # Wait for threads to finish
-        for chart_id, thread in self.monitoring_threads.items():
-            if thread.is_alive():
+        # The stop event wakes both threads, so they exit without finishing their wait
+        for thread in (self.monitoring_thread, self.audit_thread):
+            if thread is not None and thread.is_alive():
                 thread.join(timeout=2)
-                
-        self.monitoring_threads.clear()
+        self.monitoring_thread = None
+        self.audit_thread = None
+        self.flush_signal_audit()
+        
+        if self.ocr_pool is not None:
+            self.ocr_pool.shutdown(wait=False, cancel_futures=True)
+            self.ocr_pool = None
+            
         self.logger.info("🛑 Stopped monitoring all charts")
     
     def get_latest_signals(self) -> Dict[int, ChartSignal]:
@@ -438,6 +829,27 @@ class MultiChartOCRCoordinator:
         self.logger.info("Implementation: Use screenshot tool to set coordinates for each region")
         # Future: Implement interactive region selection tool
     
+    def calibrate_power_score_templates(self, displayed_scores: Dict[int, str]):
+        """Cut the power-score digit templates from what the charts show right now
+        
+        displayed_scores maps chart id to the score that chart is displaying;
+        together the scores must contain every digit 0-9. OCR workers pick the
+        templates up the next time monitoring starts.
+        """
+        binaries = []
+        digits = ""
+        for chart_id, score in displayed_scores.items():
+            image = self.capture_chart_region(chart_id, "power_score")
+            if image is None:
+                raise ValueError(f"Could not capture the power score of chart {chart_id}")
+            gray = cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            binaries.append(binary)
+            digits += score
+        
+        save_digit_templates(build_digit_templates(join_calibration_crops(binaries), digits))
+        self.logger.info(f"🔢 Saved power-score digit templates from charts {sorted(displayed_scores)}")
+    
     def test_chart_regions(self, chart_id: int) -> Dict[str, bool]:
         """Test if chart regions are correctly configured"""
         results = {}
@@ -467,15 +879,26 @@ class MultiChartOCRCoordinator:
         return {
             "is_monitoring": self.is_monitoring,
             "charts_configured": len(self.chart_regions),
-            "active_threads": len([t for t in self.monitoring_threads.values() if t.is_alive()]),
+            "active_threads": int(self.monitoring_thread is not None and self.monitoring_thread.is_alive()),
             "last_signals_count": len(self.last_signals),
             "chart_names": [regions.chart_name for regions in self.chart_regions.values()]
         }
 
 def main():
-    """Test the multi-chart OCR coordinator"""
+    """Test the multi-chart OCR coordinator
+    
+    Run with --calibrate-digits CHART=SCORE ... (e.g. 1=87 2=4695 3=123)
+    to save power-score digit templates from the scores currently on screen.
+    """
     coordinator = MultiChartOCRCoordinator()
     
+    if sys.argv[1:2] == ["--calibrate-digits"]:
+        displayed_scores = {int(chart_id): score for chart_id, score in
+                            (argument.split("=", 1) for argument in sys.argv[2:])}
+        coordinator.calibrate_power_score_templates(displayed_scores)
+        print("✅ Power-score digit templates saved")
+        return
+    
     print("🔍 Multi-Chart OCR Coordinator Test")
     print(f"📊 Configured charts: {len(coordinator.chart_regions)}")
     
@@ -569,9 +569,9 @@ class NinjaTraderTradovateDashboard:
             # Status and instruments
             st.markdown(f"**{status_text}** | Margin: {account.margin_percentage:.1f}%")
             
-            # Instruments
-            for instrument in account.instruments:
-                st.markdown(f'<span class="instrument-tag">{instrument}</span>', unsafe_allow_html=True)
+            # Instruments, as a single markdown element for the whole row of tags
+            st.markdown("".join(f'<span class="instrument-tag">{instrument}</span>'
+                                for instrument in account.instruments), unsafe_allow_html=True)
             
             # Key metrics
             col1, col2 = st.columns(2)
@@ -19,6 +19,13 @@ from plotly.subplots import make_subplots
 import asyncio
 import threading
 
+# Live chart panel refresh cadence while monitoring is active
+LIVE_REFRESH_INTERVAL = timedelta(seconds=5)
+
+# st.fragment landed in Streamlit 1.37 (st.experimental_fragment in 1.33);
+# older installs fall back to rendering the live panel with the full page.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
 @dataclass
 class ChartStatus:
     """Individual chart status data"""
@@ -538,6 +545,11 @@ class StreamlitTradingDashboard:
 
     def refresh_all_data(self):
         """Refresh all chart data (simulate real data)"""
+        self.simulate_market_tick()
+        st.success("📊 Data refreshed")
+
+    def simulate_market_tick(self):
+        """Apply one tick of simulated market data to the active charts"""
         import random
 
         for chart_data in st.session_state.charts_data.values():
@@ -560,22 +572,30 @@ class StreamlitTradingDashboard:
                 chart_data.last_update = datetime.now()
 
         st.session_state.last_update = datetime.now()
-        st.success("📊 Data refreshed")
+
+    def render_live_panel(self):
+        """Render the margin indicator and chart grid, ticking data when monitoring"""
+        if (st.session_state.monitoring_active and
+                datetime.now() - st.session_state.last_update >= LIVE_REFRESH_INTERVAL):
+            self.simulate_market_tick()
+
+        self.render_overall_margin_indicator()
+        self.render_chart_grid()
 
     def run(self):
         """Main dashboard rendering method"""
-        # Auto-refresh every 5 seconds if monitoring is active
-        if st.session_state.monitoring_active:
-            placeholder = st.empty()
+        self.render_header()
 
-            # Auto-refresh logic would go here
-            # For now, just show a status
+        if st.session_state.monitoring_active:
             st.info("🔄 Live monitoring active - Data updates automatically")
 
-        # Render all dashboard components
-        self.render_header()
-        self.render_overall_margin_indicator()
-        self.render_chart_grid()
+        if st.session_state.monitoring_active and _fragment is not None:
+            # Only the live panel reruns on the timer; the rest of the page stays put
+            _fragment(run_every=LIVE_REFRESH_INTERVAL)(self.render_live_panel)()
+        else:
+            self.render_live_panel()
+
+        # Render remaining dashboard components
         self.render_control_buttons()
         self.render_sidebar_settings()
         self.render_performance_charts()
@@ -0,0 +1,51 @@
+// EnigmaApexDataExporter.cs
+// Auto-generated by ENIGMA APEX — place in:
+//   Documents\NinjaTrader 8\bin\Custom\Indicators\
+// Then compile via NinjaScript Editor and add to your chart.
+
+using System;
+using System.IO;
+using NinjaTrader.Cbi;
+using NinjaTrader.NinjaScript;
+using Newtonsoft.Json;
+
+namespace NinjaTrader.NinjaScript.Indicators
+{
+    public class EnigmaApexDataExporter : Indicator
+    {
+        private string exportPath = @"$export_path";
+
+        protected override void OnStateChange()
+        {
+            if (State == State.SetDefaults)
+            {
+                Name = "EnigmaApexDataExporter";
+                Description = "Exports OHLCV + account data for ENIGMA APEX";
+                Calculate = Calculate.OnBarClose;
+                IsOverlay = true;
+            }
+        }
+
+        protected override void OnBarUpdate()
+        {
+            if (CurrentBar < 1) return;
+            var payload = new {
+                symbol    = Instrument.FullName,
+                timestamp = Time[0].ToString("o"),
+                open      = Open[0],
+                high      = High[0],
+                low       = Low[0],
+                close     = Close[0],
+                volume    = Volume[0],
+                account   = new {
+                    buying_power      = Account.Get(AccountItem.BuyingPower, Currency.UsDollar),
+                    cash_value        = Account.Get(AccountItem.CashValue, Currency.UsDollar),
+                    net_liquidation   = Account.Get(AccountItem.NetLiquidation, Currency.UsDollar),
+                    realized_pnl      = Account.Get(AccountItem.RealizedProfitLoss, Currency.UsDollar),
+                    unrealized_pnl    = Account.Get(AccountItem.UnrealizedProfitLoss, Currency.UsDollar)
+                }
+            };
+            File.WriteAllText(exportPath, JsonConvert.SerializeObject(payload, Formatting.Indented));
+        }
+    }
+}
@@ -6,7 +6,7 @@ Test script to verify all components work before deploying to Render
 
 import sys
 import subprocess
-import importlib
+import importlib.util
 import os
 from datetime import datetime
 
@@ -22,7 +22,7 @@ def test_python_version():
         return False
 
 def test_dependencies():
-    """Test if all required packages can be imported"""
+    """Test if all required packages are installed"""
     print("\n📦 Testing dependencies...")
     
     required_packages = [
@@ -42,11 +42,10 @@ def test_dependencies():
     
     success_count = 0
     for package, description in required_packages:
-        try:
-            importlib.import_module(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✅ {package} - {description}")
             success_count += 1
-        except ImportError:
+        else:
             print(f"❌ {package} - {description} (MISSING)")
     
     print(f"\n📊 Dependencies: {success_count}/{len(required_packages)} available")
@@ -0,0 +1,100 @@
+"""
+🧪 POWER SCORE DIGIT TESTS
+Checks the digit template classifier and how the OCR coordinator loads it
+"""
+
+import os
+import subprocess
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+system_dir = os.path.join(current_dir, 'system')
+
+def _import_in_fresh_interpreter(statement, extra_path=None):
+    """Run an import in a clean interpreter so module caches can't hide a failure"""
+    env = dict(os.environ)
+    if extra_path:
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [extra_path, env.get("PYTHONPATH")]))
+    return subprocess.run([sys.executable, "-c", statement], cwd=current_dir, env=env,
+                          capture_output=True, text=True)
+
+def test_coordinator_imports_as_package():
+    """system.multi_chart_ocr_coordinator resolves digits_kernel relative to the package"""
+    result = _import_in_fresh_interpreter("import system.multi_chart_ocr_coordinator")
+    assert result.returncode == 0, result.stderr
+
+def test_coordinator_imports_flat():
+    """multi_chart_ocr_coordinator still imports with system/ itself on sys.path"""
+    result = _import_in_fresh_interpreter("import multi_chart_ocr_coordinator", extra_path=system_dir)
+    assert result.returncode == 0, result.stderr
+
+sys.path.insert(0, system_dir)
+
+import cv2
+import numpy as np
+
+from digits_kernel import (_otsu_binarize, build_digit_templates, classify_digits,
+                           join_calibration_crops, ocr_power_score)
+
+GLYPH_SHAPE = (16, 10)
+
+def _synthetic_glyph(digit):
+    """A framed 16x10 glyph whose interior encodes the digit in binary"""
+    glyph = np.zeros(GLYPH_SHAPE, dtype=np.uint8)
+    glyph[0, :] = glyph[-1, :] = glyph[:, 0] = glyph[:, -1] = 255
+    for bit in range(4):
+        if digit >> bit & 1:
+            glyph[2 + 3 * bit:4 + 3 * bit, 2:8] = 255
+    if digit >= 8:
+        glyph[13, 4:6] = 255
+    return glyph
+
+def _render(digits):
+    """Light glyphs on a dark strip with blank margins and gaps"""
+    height, width = GLYPH_SHAPE
+    strip = np.zeros((height + 4, 2 + len(digits) * (width + 3)), dtype=np.uint8)
+    for i, digit_char in enumerate(digits):
+        x = 2 + i * (width + 3)
+        strip[2:2 + height, x:x + width] = _synthetic_glyph(int(digit_char))
+    return strip
+
+def _templates():
+    return build_digit_templates(_render("0123456789"), "0123456789", size=GLYPH_SHAPE)
+
+def test_build_digit_templates_cuts_each_glyph():
+    templates = _templates()
+    assert templates.shape == (10, 16, 10)
+    for digit in range(10):
+        assert np.array_equal(templates[digit], _synthetic_glyph(digit))
+
+def test_classify_digits_reads_left_to_right():
+    assert list(classify_digits(_render("4096"), _templates())) == [4, 0, 9, 6]
+
+def test_classify_digits_accepts_dark_on_light():
+    assert list(classify_digits(255 - _render("87"), _templates())) == [8, 7]
+
+def test_classify_digits_rejects_unknown_glyph():
+    strip = _render("55")
+    strip[2:18, 15:25] = 255  # solid block matches no template
+    assert list(classify_digits(strip, _templates())) == [5, -1]
+
+def test_otsu_binarize_matches_opencv():
+    rng = np.random.default_rng(7)
+    gray = np.where(_render("31") > 0, 200, 40).astype(np.uint8)
+    gray = np.clip(gray.astype(np.int16) + rng.integers(-25, 26, gray.shape), 0, 255).astype(np.uint8)
+    _, expected = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    assert np.array_equal(_otsu_binarize(gray), expected)
+
+def test_ocr_power_score_reads_bgra_crop():
+    bgra = np.full(_render("87").shape + (4,), 20, dtype=np.uint8)
+    bgra[_render("87") > 0] = (230, 220, 210, 255)
+    assert ocr_power_score(bgra, _templates()) == 87
+
+def test_ocr_power_score_flags_blank_crop():
+    bgra = np.full((20, 30, 4), 20, dtype=np.uint8)
+    assert ocr_power_score(bgra, _templates()) == -1
+
+def test_join_calibration_crops_builds_full_template_set():
+    crops = [_render("01234"), 255 - _render("56789")]
+    templates = build_digit_templates(join_calibration_crops(crops), "0123456789", size=GLYPH_SHAPE)
+    assert list(classify_digits(_render("9150"), templates)) == [9, 1, 5, 0]